@@ -0,0 +1,294 @@
+"""
+Benchmark headless hot path vision & render CineTune.
+
+Contoh:
+    python src/benchmark.py --output hasil.json
+    python src/benchmark.py --recording rekaman/sesi1 --baseline hasil.json
+    python src/benchmark.py --source video:tangan.mp4 --cases detect,camera_pipeline
+
+Jalan tanpa window/audio (SDL_VIDEODRIVER=dummy, SDL_AUDIODRIVER=dummy).
+Frame sumber: FrameSource apa pun (--source, default sintetis) atau
+rekaman (--recording, sekaligus memberi landmarks untuk map), di-resize ke
+setiap resolusi kamera yang di-benchmark. Frame
+sintetis tidak berisi tangan, jadi detect hanya mengukur jalur "tidak ada
+tangan"; pakai rekaman berisi tangan untuk jalur tracking.
+
+Dengan --baseline, p50 tiap case dibandingkan dengan hasil sebelumnya;
+exit code 1 kalau ada regresi di atas --threshold.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import cv2
+import numpy as np
+import pygame
+
+# Add src directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.data_loader import load_questions
+from ui.camera_display import CameraDisplayPipeline
+from ui.tampilan import GameUI, GameState, scale_preserve_aspect_ratio
+from vision.gesture_detector import GestureDetector
+from vision.gesture_mapper import GestureMapper, normalize_landmarks
+from vision.hand_landmarks import HandLandmarks
+from vision.frame_source import SyntheticSource, open_frame_source
+from vision.recording import Recording
+
+CAMERA_RESOLUTIONS = [(320, 240), (640, 480), (1280, 720)]
+WINDOW_RESOLUTIONS = [(480, 640), (720, 960), (1080, 1440)]
+BATCH_SIZE = 1024
+CASES = ["detect", "map", "camera_pipeline", "scale", "draw_game", "load_image"]
+
+
+def time_case(fn, iterations, warmup):
+    """
+    Jalankan fn(i) warmup + iterations kali.
+
+    Returns:
+        dict statistik waktu per panggilan (ms)
+    """
+    for i in range(warmup):
+        fn(i)
+    times_ms = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(i)
+        times_ms[i] = (time.perf_counter() - start) * 1000.0
+    return {
+        "iterations": iterations,
+        "mean_ms": float(times_ms.mean()),
+        "p50_ms": float(np.percentile(times_ms, 50)),
+        "p95_ms": float(np.percentile(times_ms, 95)),
+        "min_ms": float(times_ms.min()),
+    }
+
+
+def read_source(source, count):
+    """Baca sampai `count` frame dari FrameSource (unpaced) ke memori"""
+    frames = []
+    while len(frames) < count:
+        ret, frame = source.read()
+        if not ret:
+            break
+        frames.append(np.array(frame))
+    source.release()
+    return frames
+
+
+def load_frames(args):
+    """Frame sumber (BGR, sebelum flip) + HandLandmarks dari rekaman kalau ada"""
+    hands = []
+    if args.recording:
+        recording = Recording(args.recording)
+        count = min(len(recording), args.frames)
+        frames = [np.array(recording.frame(i)) for i in range(count)] if recording.has_frames() else []
+        hands = [h for h in (recording.hand(i) for i in range(count)) if h is not None]
+        recording.close()
+    else:
+        frames = read_source(open_frame_source(args.source, paced=False), args.frames)
+    return frames, hands
+
+
+def synthetic_hands(count, seed=0):
+    """HandLandmarks acak (untuk map kalau rekaman tidak punya landmarks)"""
+    rng = np.random.default_rng(seed)
+    return [HandLandmarks(rng.random((21, 3)), "Right", 0.9, i / 30.0, 4 / 3) for i in range(count)]
+
+
+def run_benchmarks(args):
+    """Returns: dict {nama case: statistik}"""
+    cases = args.cases.split(",") if args.cases else CASES
+    frames, hands = load_frames(args)
+    if not frames and any(c in cases for c in ("detect", "camera_pipeline")):
+        print("[BENCH] Sumber tidak punya frame, case kamera dilewati")
+    hands = hands or synthetic_hands(args.frames)
+    results = {}
+
+    def record(name, fn):
+        stats = time_case(fn, args.iterations, args.warmup)
+        results[name] = stats
+        print(f"[BENCH] {name:42s} p50={stats['p50_ms']:8.3f} ms  p95={stats['p95_ms']:8.3f} ms  "
+              f"mean={stats['mean_ms']:8.3f} ms")
+
+    ui = GameUI()
+    ui.state = GameState.GAME
+    pipeline = CameraDisplayPipeline()
+    mapper = GestureMapper()
+
+    # --- Vision ---
+    if "detect" in cases and frames:
+        detector = GestureDetector()
+        for width, height in CAMERA_RESOLUTIONS:
+            scaled = [cv2.flip(cv2.resize(f, (width, height)), 1) for f in frames]
+            detector.reset_tracking()
+            # detect() menggambar landmarks ke frame: pakai salinan supaya
+            # frame sumber tetap bersih di iterasi berikutnya
+            record(f"gesture_detector.detect@{width}x{height}",
+                   lambda i: detector.detect(scaled[i % len(scaled)].copy(), i / 30.0))
+        detector.close()
+
+    if "map" in cases:
+        record("gesture_mapper.map", lambda i: mapper.map(hands[i % len(hands)]))
+        # Ukuran batch tetap supaya nama case sama di setiap run
+        points = np.stack([hands[i % len(hands)].points for i in range(BATCH_SIZE)])
+        batch = normalize_landmarks(points, hands[0].aspect)
+        record(f"gesture_mapper.classify_batch[{len(batch)}]", lambda i: mapper.classify_batch(batch))
+
+    if "camera_pipeline" in cases and frames:
+        # Jalur display get_camera_frame: flip + draw landmarks + background seukuran window
+        detector = GestureDetector()
+        hand = hands[0]
+        for width, height in CAMERA_RESOLUTIONS:
+            scaled = [cv2.resize(f, (width, height)) for f in frames]
+
+            def camera_pipeline(i):
+                frame = cv2.flip(scaled[i % len(scaled)], 1)
+                detector.draw(frame, hand)
+                pipeline.process(frame, (ui.width, ui.height))
+            record(f"camera_pipeline@{width}x{height}->{ui.width}x{ui.height}", camera_pipeline)
+        detector.close()
+
+    # --- Render ---
+    question = load_questions()[0]
+    poster = pygame.image.load(question["image"])
+    for width, height in WINDOW_RESOLUTIONS:
+        ui.resize(width, height)
+        size = f"{width}x{height}"
+
+        if "scale" in cases:
+            record(f"scale_preserve_aspect_ratio@{size}",
+                   lambda i: scale_preserve_aspect_ratio(poster, width, height))
+
+        if "draw_game" in cases:
+            # Dengan camera_frame, draw_game menggambar ulang layar penuh tiap frame
+            source = frames[0] if frames else read_source(SyntheticSource(paced=False), 1)[0]
+            background = pipeline.process(source, (width, height))
+            image = ui.load_image(question["image"], *ui.get_poster_size())
+            # Ukur steady state: animasi slide-in masuk layar GAME (550 ms)
+            # sudah selesai, jadi hasil tidak bergantung kecepatan mesin
+            ui._last_state = ui.state
+            ui._state_change_time = pygame.time.get_ticks() - 1000
+
+            def draw_game(i):
+                ui.draw_game(1, 8, image, question["options"], current_gesture="A",
+                             gesture_confidence=0.8, camera_frame=background)
+            record(f"game_ui.draw_game@{size}", draw_game)
+
+        if "load_image" in cases:
+            poster_size = ui.get_poster_size()
+
+            def load_image_cold(i):
+                ui.image_cache.clear()
+                ui.load_image(question["image"], *poster_size)
+            record(f"game_ui.load_image[cold]@{size}", load_image_cold)
+            record(f"game_ui.load_image[warm]@{size}",
+                   lambda i: ui.load_image(question["image"], *poster_size))
+
+    pygame.quit()
+    return results
+
+
+def environment_info(args):
+    """Metadata run (versi library & mesin) untuk file JSON"""
+    import mediapipe
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "pygame": pygame.version.ver,
+        "mediapipe": mediapipe.__version__,
+        "source": args.recording or args.source,
+        "iterations": args.iterations,
+    }
+
+
+def compare(results, baseline, threshold, metric="p50_ms", min_delta_ms=0.05):
+    """
+    Bandingkan hasil dengan baseline.
+
+    Args:
+        threshold: kenaikan relatif yang dianggap regresi (0.10 = +10%)
+        min_delta_ms: selisih absolut minimum (abaikan jitter case yang sangat cepat)
+
+    Returns:
+        list (nama, baseline ms, sekarang ms, rasio, status)
+    """
+    rows = []
+    for name in sorted(set(results) | set(baseline)):
+        if name not in baseline:
+            rows.append((name, None, results[name][metric], None, "new"))
+            continue
+        if name not in results:
+            rows.append((name, baseline[name][metric], None, None, "missing"))
+            continue
+        old, new = baseline[name][metric], results[name][metric]
+        ratio = new / old if old > 0 else float("inf")
+        status = "ok"
+        if abs(new - old) >= min_delta_ms:
+            if ratio > 1 + threshold:
+                status = "REGRESSION"
+            elif ratio < 1 - threshold:
+                status = "improved"
+        rows.append((name, old, new, ratio, status))
+    return rows
+
+
+def print_comparison(rows, metric):
+    fmt = lambda v: f"{v:8.3f}" if v is not None else "       -"
+    print(f"[BENCH] Perbandingan {metric} (baseline -> sekarang):")
+    for name, old, new, ratio, status in rows:
+        ratio_text = f"{ratio:6.2f}x" if ratio is not None else "      -"
+        print(f"[BENCH]   {name:42s} {fmt(old)} -> {fmt(new)} ms {ratio_text}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless CineTune (vision & render)")
+    parser.add_argument("--recording", help="direktori rekaman (vision/recording.py)")
+    parser.add_argument("--source", default="synthetic",
+                        help="spec FrameSource: synthetic, video:<file>, images:<dir>, camera:0 (default synthetic)")
+    parser.add_argument("--frames", type=int, default=60, help="jumlah frame sumber")
+    parser.add_argument("--iterations", type=int, default=100, help="iterasi terukur per case")
+    parser.add_argument("--warmup", type=int, default=10, help="iterasi pemanasan per case")
+    parser.add_argument("--cases", help=f"subset case, dipisah koma ({','.join(CASES)})")
+    parser.add_argument("--output", help="tulis hasil ke file JSON")
+    parser.add_argument("--baseline", help="file JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--threshold", type=float, default=0.10, help="batas regresi relatif (default 0.10)")
+    parser.add_argument("--metric", default="p50_ms", help="metric pembanding (default p50_ms)")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+    report = {"environment": environment_info(args), "results": results}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[BENCH] Hasil ditulis ke {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        rows = compare(results, baseline, args.threshold, args.metric)
+        print_comparison(rows, args.metric)
+        regressions = [row[0] for row in rows if row[4] == "REGRESSION"]
+        if regressions:
+            print(f"[BENCH] {len(regressions)} regresi: {', '.join(regressions)}")
+            sys.exit(1)
+        print("[BENCH] Tidak ada regresi")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,50 @@
 import pygame
 import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.sound_bank import SoundBank, MIXER_BUFFER
+from core.sfx_registry import SfxRegistry
 
 class AudioPlayer:
-    def __init__(self):
-        """Initialize audio player"""
+    def __init__(self, sound_bank_mb=64):
+        """
+        Initialize audio player
+
+        Args:
+            sound_bank_mb: batas memori PCM untuk audio soal yang di-decode
+        """
+        self.sound_bank = None
+        self.sfx = SfxRegistry()
+        self._sfx_base_dir = None
         try:
-            # Inisialisasi mixer dengan setting standar
-            pygame.mixer.init(frequency=44100, size=-16, channels=2)
+            # Inisialisasi mixer dengan setting standar (buffer kecil = latensi rendah)
+            pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=MIXER_BUFFER)
             self.is_initialized = True
             self.current_sound = None
 
             print("[AUDIO] Mixer initialized ->", pygame.mixer.get_init())
+
+            # Audio soal di-decode sekali ke Sound, diputar di channel reserved
+            self.sound_bank = SoundBank(max_mb=sound_bank_mb)
         except Exception as e:
             print(f"[WARNING] Pygame mixer tidak tersedia: {e}")
             self.is_initialized = False
 
+    def preload_question_audio(self, file_path: str):
+        """
+        Decode audio soal ke sound bank (dipanggil dari thread prefetch),
+        supaya play_question_audio tidak menyentuh disk.
+        """
+        if not self.is_initialized or not file_path:
+            return
+        self.sound_bank.load(file_path)
+
     def play_question_audio(self, file_path: str):
         """
-        Putar audio pertanyaan.
-        Di sini kita pakai pygame.mixer.music supaya simpel.
+        Putar audio pertanyaan dari sound bank.
         file_path sudah absolut dari data_loader.
         """
         if not self.is_initialized:
@@ -29,24 +55,17 @@ class AudioPlayer:
             print("[AUDIO] file_path kosong.")
             return
 
-        exists = os.path.exists(file_path)
-        print(f"[AUDIO] QUESTION -> {file_path} | exists={exists}")
-
-        if not exists:
+        preloaded = file_path in self.sound_bank
+        if not preloaded and not os.path.exists(file_path):
             print(f"[WARNING] File audio tidak ditemukan: {file_path}")
             return
 
         try:
-            # Hentikan audio yang sebelumnya
-            try:
-                pygame.mixer.music.stop()
-            except:
-                pass
-
-            # Load & play
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
-            print("[AUDIO] Question audio PLAY.")
+            # Hentikan audio soal sebelumnya
+            self.sound_bank.stop()
+
+            latency_ms = self.sound_bank.play(file_path)
+            print(f"[AUDIO] Question audio PLAY | preloaded={preloaded} | ttfs={latency_ms:.1f} ms")
         except Exception as e:
             print(f"[ERROR] Gagal memutar question audio: {e}")
         
@@ -60,26 +79,47 @@ class AudioPlayer:
             return False
 
         try:
-            return pygame.mixer.music.get_busy()
+            return self.sound_bank.is_playing()
         except Exception as e:
             print(f"[AUDIO] Gagal cek status audio: {e}")
             return False
 
 
-    # --- efek benar/salah masih boleh pakai Sound / beep ---
+    # --- efek benar/salah: Sound siap pakai dari SfxRegistry ---
+
+    def load_sound_effects(self, base_dir):
+        """
+        Load / synthesize semua SFX sekali (dipanggil saat startup).
+        File correct.wav / wrong.wav dipakai kalau ada, selain itu beep.
+        """
+        if not self.is_initialized:
+            return
+        effects = {
+            "correct": ("correct.wav", 1000, 200),
+            "wrong": ("wrong.wav", 300, 300),
+        }
+        for name, (filename, frequency, duration) in effects.items():
+            path = os.path.join(base_dir, "assets", "audio", filename)
+            if not (os.path.exists(path) and self.sfx.register_file(name, path)):
+                self.sfx.register_tone(name, frequency, duration)
+        self._sfx_base_dir = base_dir
+        print(f"[AUDIO] SFX ready: {self.sfx.names()}")
 
     def play_sound_effect(self, file_path: str):
         """Play sound effect sederhana (kalau mau pakai file .wav lain)"""
         if not self.is_initialized:
             return
 
-        if not os.path.exists(file_path):
-            print(f"[WARNING] SFX file tidak ditemukan: {file_path}")
-            return
+        # File yang sama hanya di-load sekali
+        if file_path not in self.sfx:
+            if not os.path.exists(file_path):
+                print(f"[WARNING] SFX file tidak ditemukan: {file_path}")
+                return
+            if not self.sfx.register_file(file_path, file_path):
+                return
 
         try:
-            sound = pygame.mixer.Sound(file_path)
-            sound.play()
+            self.sfx.play(file_path)
         except Exception as e:
             print(f"[ERROR] Gagal play SFX: {e}")
 
@@ -87,39 +127,28 @@ class AudioPlayer:
         """Play sound effect untuk jawaban benar"""
         if not self.is_initialized:
             return
-        path = os.path.join(base_dir, "assets", "audio", "correct.wav")
-        if os.path.exists(path):
-            self.play_sound_effect(path)
-        else:
-            self.play_beep(1000, 200)
+        if base_dir != self._sfx_base_dir:
+            self.load_sound_effects(base_dir)
+        self.sfx.play("correct")
 
     def play_wrong_sound(self, base_dir):
         """Play sound effect untuk jawaban salah"""
         if not self.is_initialized:
             return
-        path = os.path.join(base_dir, "assets", "audio", "wrong.wav")
-        if os.path.exists(path):
-            self.play_sound_effect(path)
-        else:
-            self.play_beep(300, 300)
+        if base_dir != self._sfx_base_dir:
+            self.load_sound_effects(base_dir)
+        self.sfx.play("wrong")
 
     def play_beep(self, frequency=440, duration=200, sample_rate=22050):
-        """Generate and play a simple beep sound"""
+        """Play a simple beep sound (waveform di-synthesize sekali per parameter)"""
         if not self.is_initialized:
             return
 
+        name = f"beep:{frequency}:{duration}:{sample_rate}"
         try:
-            import math
-            import numpy as np
-
-            frames = int(duration * sample_rate / 1000)
-            t = np.linspace(0, duration / 1000, frames)
-            arr = np.sin(2.0 * math.pi * frequency * t)
-            arr = (arr * 32767).astype(np.int16)
-            arr = np.repeat(arr.reshape(frames, 1), 2, axis=1)
-
-            sound = pygame.sndarray.make_sound(arr)
-            sound.play()
+            if name not in self.sfx:
+                self.sfx.register_tone(name, frequency, duration, sample_rate)
+            self.sfx.play(name)
             print("[AUDIO] Beep sound played.")
         except Exception as e:
             print(f"[WARNING] Tidak bisa generate beep: {e}")
@@ -129,13 +158,10 @@ class AudioPlayer:
         if not self.is_initialized:
             return
         try:
-            # stop musik utama (yang dipakai play_question_audio)
-            pygame.mixer.music.stop()
-
-            # stop semua channel audio lain (SFX, sound effect, dll)
+            # stop semua channel (audio soal di channel reserved + SFX)
             pygame.mixer.stop()
 
-            print("[AUDIO] Stop all sounds (music + SFX).")
+            print("[AUDIO] Stop all sounds (question + SFX).")
         except Exception as e:
             print(f"[ERROR] Gagal stop audio: {e}")
 
@@ -143,6 +169,7 @@ class AudioPlayer:
         """Stop dan quit mixer"""
         if self.is_initialized:
             try:
+                print(f"[AUDIO] Sound bank stats: {self.sound_bank.get_stats()}")
                 pygame.mixer.quit()
                 print("[AUDIO] Mixer quit.")
             except Exception as e:
@@ -16,7 +16,7 @@ class GamePhase(Enum):
 # GAME MANAGER CLASS
 # ==========================================
 class GameManager:
-    def __init__(self, questions):
+    def __init__(self, questions, prefetcher=None):
         """
         Initialize game manager
         
@@ -29,8 +29,11 @@ class GameManager:
                     "options": {"A": str, "B": str, "C": str, "D": str},
                     "answer": str (A/B/C/D)
                 }
+            prefetcher: AssetPrefetcher (opsional) untuk memanaskan asset
+                soal berikutnya sesuai urutan hasil shuffle
         """
         self.questions = questions if questions else []
+        self.prefetcher = prefetcher
         self.current_question_idx = 0
         self.score = 0
         self.answered_count = 0
@@ -43,6 +46,16 @@ class GameManager:
         # Shuffle questions
         if self.questions:
             random.shuffle(self.questions)
+
+        # Urutan sudah final -> panaskan soal pertama selagi di menu
+        self._schedule_prefetch(include_current=True)
+
+    def _schedule_prefetch(self, include_current=False):
+        """Minta prefetcher men-decode soal setelah soal aktif"""
+        if self.prefetcher is None:
+            return
+        start = self.current_question_idx if include_current else self.current_question_idx + 1
+        self.prefetcher.schedule(self.questions, start)
     
     def start_game(self):
         """Start the game"""
@@ -53,6 +66,7 @@ class GameManager:
 
         # [TIMER-ADD] mulai timer untuk soal pertama
         self.current_question_start_time = time.time()
+        self._schedule_prefetch()
     
     def get_current_question(self):
         """Get current question"""
@@ -115,6 +129,7 @@ class GameManager:
             self.phase = GamePhase.WAITING_ANSWER
             # [TIMER-ADD] reset timer untuk soal baru
             self.current_question_start_time = time.time()
+            self._schedule_prefetch()
     
     def is_game_over(self):
         """Check if game is over"""
@@ -142,7 +157,10 @@ class GameManager:
     
     def reset(self):
         """Reset game"""
-        self.__init__(self.questions)
+        # Prefetch untuk urutan lama tidak berlaku lagi setelah shuffle ulang
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+        self.__init__(self.questions, self.prefetcher)
 
     # ==========================================================
     # [TIMER-ADD] FUNGSI BARU: update_timer
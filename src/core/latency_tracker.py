@@ -0,0 +1,163 @@
+from collections import deque
+
+import numpy as np
+
+# Stage latency gesture -> feedback, berurutan dan saling menyambung:
+# jumlah semua stage = total
+LATENCY_STAGES = [
+    ("acquire", "pose muncul -> kandidat aktif (vote)"),
+    ("dwell", "kandidat aktif -> frame keputusan (hold)"),
+    ("detect", "capture frame keputusan -> landmarks"),
+    ("map", "landmarks -> gesture"),
+    ("decide", "gesture -> keputusan (draw + engine)"),
+    ("submit", "keputusan -> submit jawaban"),
+    ("feedback", "play SFX + buffer mixer"),
+]
+
+
+class LatencyRecord:
+    """Satu pengukuran gesture -> feedback (semua waktu time.monotonic, detik)"""
+
+    __slots__ = ("answer", "is_correct", "appeared", "onset", "capture", "detected", "mapped",
+                 "decided", "feedback_start", "feedback_end", "stages_ms", "total_ms")
+
+    def __init__(self, answer, appeared, onset, capture, detected, mapped, decided):
+        self.answer = answer
+        self.is_correct = None
+        self.appeared = appeared
+        self.onset = onset
+        self.capture = capture
+        self.detected = detected
+        self.mapped = mapped
+        self.decided = decided
+        self.feedback_start = None
+        self.feedback_end = None
+        self.stages_ms = None
+        self.total_ms = None
+
+    def __repr__(self):
+        stages = " ".join(f"{name}={ms:.0f}" for name, ms in self.stages_ms.items()) if self.stages_ms else ""
+        total = f"{self.total_ms:.0f}ms" if self.total_ms is not None else "pending"
+        return f"LatencyRecord({self.answer} total={total} {stages})"
+
+
+class LatencyTracker:
+    """
+    Latency end-to-end dari pose tangan muncul di depan kamera sampai
+    feedback audio (SFX benar/salah) diputar.
+
+    Alur per frame kamera: timestamp capture (CameraCapture) -> landmarks
+    tersedia -> gesture di-map (mark_frame). Saat decision engine
+    memutuskan, begin() membuat LatencyRecord dari frame keputusan dan waktu
+    pose muncul / kandidat aktif; finish() menutupnya setelah SFX diputar.
+
+    Catatan: timestamp capture diambil setelah cap.read() kembali, jadi
+    latensi sensor/driver kamera sebelum itu tidak ikut terukur.
+    """
+
+    def __init__(self, audio_buffer_ms=0.0, history=200):
+        """
+        Args:
+            audio_buffer_ms: perkiraan latensi buffer mixer (ditambahkan ke feedback)
+            history: jumlah record yang disimpan untuk ringkasan sesi
+        """
+        self.audio_buffer_ms = audio_buffer_ms
+        self.records = deque(maxlen=history)
+        self._frame = None
+
+    def mark_frame(self, capture, detected, mapped):
+        """
+        Jejak frame kamera terbaru: waktu capture frame sumber landmarks
+        (hand.timestamp kalau ada tangan), landmarks siap, gesture di-map
+        """
+        self._frame = (capture, detected, mapped)
+
+    def reset_frame(self):
+        """Lupakan jejak frame (kamera di-pause / frame basi)"""
+        self._frame = None
+
+    def begin(self, answer, appeared, onset, decided):
+        """
+        Mulai record untuk keputusan di frame terbaru.
+
+        Args:
+            answer: label yang diputuskan
+            appeared: timestamp capture frame pertama pose muncul
+            onset: timestamp capture saat kandidat jadi aktif
+            decided: waktu keputusan (monotonic)
+
+        Returns:
+            LatencyRecord, atau None kalau belum ada jejak frame
+        """
+        if self._frame is None:
+            return None
+        capture, detected, mapped = self._frame
+        if appeared is None:
+            appeared = capture
+        if onset is None:
+            onset = capture
+        return LatencyRecord(answer, appeared, onset, capture, detected, mapped, decided)
+
+    def finish(self, record, is_correct, feedback_start, feedback_end):
+        """Tutup record setelah SFX diputar, simpan ke history"""
+        record.is_correct = is_correct
+        record.feedback_start = feedback_start
+        record.feedback_end = feedback_end
+        stages = {
+            "acquire": record.onset - record.appeared,
+            "dwell": record.capture - record.onset,
+            "detect": record.detected - record.capture,
+            "map": record.mapped - record.detected,
+            "decide": record.decided - record.mapped,
+            "submit": feedback_start - record.decided,
+            "feedback": feedback_end - feedback_start,
+        }
+        record.stages_ms = {name: ms * 1000.0 for name, ms in stages.items()}
+        record.stages_ms["feedback"] += self.audio_buffer_ms
+        record.total_ms = (feedback_end - record.appeared) * 1000.0 + self.audio_buffer_ms
+        self.records.append(record)
+        print(f"[LATENCY] {record}")
+        return record
+
+    def summary(self):
+        """
+        Distribusi latency sesi ini.
+
+        Returns:
+            dict: count, total {p50, p95, max}, stages {name: {p50, p95}} (ms)
+        """
+        if not self.records:
+            return {"count": 0, "total": None, "stages": {}}
+        totals = np.array([r.total_ms for r in self.records])
+        stages = {}
+        for name, _ in LATENCY_STAGES:
+            values = np.array([r.stages_ms[name] for r in self.records])
+            stages[name] = {
+                "p50": float(np.percentile(values, 50)),
+                "p95": float(np.percentile(values, 95)),
+            }
+        return {
+            "count": len(totals),
+            "total": {
+                "p50": float(np.percentile(totals, 50)),
+                "p95": float(np.percentile(totals, 95)),
+                "max": float(totals.max()),
+            },
+            "stages": stages,
+        }
+
+    def report(self):
+        """Ringkasan sesi dalam bentuk teks (beberapa baris) untuk log"""
+        summary = self.summary()
+        if not summary["count"]:
+            return "[LATENCY] Belum ada jawaban gesture di sesi ini"
+        total = summary["total"]
+        lines = [
+            f"[LATENCY] Gesture -> feedback, {summary['count']} jawaban: "
+            f"p50 {total['p50']:.0f}ms  p95 {total['p95']:.0f}ms  max {total['max']:.0f}ms"
+        ]
+        lines.append(f"[LATENCY]   {'stage':<9}{'p50':>8} {'p95':>8}   (ms)")
+        for name, description in LATENCY_STAGES:
+            stage = summary["stages"][name]
+            lines.append(f"[LATENCY]   {name:<9}{stage['p50']:8.1f} {stage['p95']:8.1f}   {description}")
+        return "\n".join(lines)
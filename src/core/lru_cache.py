@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Cache LRU sederhana dengan batas jumlah entry dan/atau batas memori.
+
+    Dipakai bersama oleh cache image, text, font dan audio. Thread-safe
+    supaya bisa diisi dari thread prefetch.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, size_of=None):
+        """
+        Args:
+            max_entries: jumlah entry maksimum (None = tidak dibatasi)
+            max_bytes: total ukuran maksimum dalam byte (None = tidak dibatasi)
+            size_of: fungsi value -> ukuran byte (wajib kalau max_bytes dipakai)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Ambil value dan tandai sebagai paling baru dipakai"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Simpan value, lalu evict entry paling lama sampai kembali di bawah budget"""
+        size = self.size_of(value) if self.size_of else 0
+        with self._lock:
+            if key in self._data:
+                self.total_bytes -= self._sizes[key]
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._sizes[key] = size
+            self.total_bytes += size
+            self._evict()
+
+    def _evict(self):
+        # Entry terbaru tidak pernah di-evict, walaupun sendirian melebihi budget
+        while len(self._data) > 1 and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            old_key, _ = self._data.popitem(last=False)
+            self.total_bytes -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+    def pop(self, key, default=None):
+        """Hapus satu entry"""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self.total_bytes -= self._sizes.pop(key)
+            return self._data.pop(key)
+
+    def clear(self):
+        """Kosongkan cache (counter hit/miss tetap disimpan)"""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.total_bytes = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_stats(self):
+        """Statistik cache"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
@@ -0,0 +1,90 @@
+import queue
+import threading
+
+
+class AssetPrefetcher:
+    """
+    Worker thread yang memanaskan (decode) asset soal berikutnya.
+
+    Prefetcher tidak tahu cara decode asset; ia hanya memanggil `loaders`
+    (callable fn(question)) di thread sendiri. Setiap loader bertanggung
+    jawab menyimpan hasilnya ke cache masing-masing, sehingga saat soal
+    berganti main loop cukup mengambil dari memori.
+    """
+
+    def __init__(self, loaders, depth=1):
+        """
+        Args:
+            loaders: list callable fn(question) yang dijalankan di worker thread
+            depth: jumlah soal ke depan yang di-prefetch (1 = soal N+1 saja)
+        """
+        self.loaders = list(loaders)
+        self.depth = depth
+
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._scheduled = set()
+
+        # Counters
+        self.prefetched = 0
+        self.cancelled = 0
+
+        self._thread = threading.Thread(target=self._worker_loop, name="AssetPrefetcher", daemon=True)
+        self._thread.start()
+
+    def schedule(self, questions, start_idx):
+        """Antrikan soal questions[start_idx : start_idx + depth] untuk di-prefetch"""
+        with self._lock:
+            generation = self._generation
+            for question in questions[start_idx:start_idx + self.depth]:
+                key = question.get("id")
+                if key in self._scheduled:
+                    continue
+                self._scheduled.add(key)
+                self._queue.put((generation, question))
+
+    def cancel(self):
+        """Batalkan semua prefetch yang belum jalan (misal saat GameManager.reset)"""
+        with self._lock:
+            self._generation += 1
+            self._scheduled.clear()
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self.cancelled += 1
+
+    def _worker_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            generation, question = item
+            for loader in self.loaders:
+                # Berhenti di tengah kalau sudah dibatalkan
+                if generation != self._generation:
+                    self.cancelled += 1
+                    break
+                try:
+                    loader(question)
+                except Exception as e:
+                    print(f"[WARNING] Prefetch gagal untuk soal {question.get('id')}: {e}")
+            else:
+                self.prefetched += 1
+
+    def get_stats(self):
+        """Statistik prefetcher"""
+        return {
+            "prefetched": self.prefetched,
+            "cancelled": self.cancelled,
+            "queued": self._queue.qsize(),
+        }
+
+    def stop(self):
+        """Hentikan worker thread"""
+        self.cancel()
+        self._queue.put(None)
+        self._thread.join(timeout=1.0)
@@ -0,0 +1,121 @@
+import time
+
+import numpy as np
+
+
+class _NullSpan:
+    """Span kosong saat profiler mati: enter/exit tanpa kerja apa pun"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class FrameProfiler:
+    """
+    Instrumentasi waktu per stage frame.
+
+    - span(name): context manager yang mengukur satu stage (perf_counter,
+      monotonic) dan mencatatnya dalam ms.
+    - Setiap nama punya ring buffer `window` sampel terakhir; p50/p95/p99
+      dihitung hanya saat diminta (overlay / stats), bukan per frame.
+    - tick(): dipanggil sekali per frame untuk frame time & FPS.
+
+    Saat disabled, span() mengembalikan satu object kosong yang sama dan
+    record()/tick() langsung return, jadi biayanya praktis nol.
+    """
+
+    def __init__(self, enabled=False, window=240):
+        self.enabled = enabled
+        self.window = window
+        self._samples = {}
+        self._spans = {}
+        self._last_tick = None
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        # Jarak frame melewati masa disabled tidak valid
+        self._last_tick = None
+
+    def span(self, name):
+        """Context manager pengukur stage `name`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self, name)
+        return span
+
+    def record(self, name, ms):
+        """Catat satu sampel durasi (ms) untuk stage `name`"""
+        if not self.enabled:
+            return
+        entry = self._samples.get(name)
+        if entry is None:
+            # [buffer, index tulis berikutnya, jumlah sampel]
+            entry = self._samples[name] = [np.zeros(self.window, np.float32), 0, 0]
+        buf, idx, _ = entry
+        buf[idx] = ms
+        entry[1] = (idx + 1) % self.window
+        entry[2] += 1
+
+    def tick(self):
+        """Tandai akhir satu frame (frame time = jarak antar tick)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            self.record("frame", (now - self._last_tick) * 1000.0)
+        self._last_tick = now
+
+    def percentiles(self, name):
+        """
+        Returns:
+            (p50, p95, p99) ms dari sampel di window, atau None kalau belum ada
+        """
+        entry = self._samples.get(name)
+        if entry is None or entry[2] == 0:
+            return None
+        buf, _, count = entry
+        return tuple(float(v) for v in np.percentile(buf[:min(count, self.window)], (50, 95, 99)))
+
+    def fps(self):
+        """FPS rata-rata dari frame time di window"""
+        entry = self._samples.get("frame")
+        if entry is None or entry[2] == 0:
+            return 0.0
+        mean_ms = float(entry[0][:min(entry[2], self.window)].mean())
+        return 1000.0 / mean_ms if mean_ms > 0 else 0.0
+
+    def names(self):
+        return list(self._samples)
+
+    def get_stats(self):
+        """Ringkasan semua stage: {name: {count, p50, p95, p99}}"""
+        stats = {}
+        for name, (_, _, count) in self._samples.items():
+            p50, p95, p99 = self.percentiles(name)
+            stats[name] = {"count": count, "p50": p50, "p95": p95, "p99": p99}
+        return stats
@@ -0,0 +1,59 @@
+import math
+
+import numpy as np
+import pygame
+
+
+def synthesize_tone(frequency, duration, sample_rate=22050):
+    """Buat Sound sinus stereo (dipakai sebagai beep fallback)"""
+    frames = int(duration * sample_rate / 1000)
+    t = np.linspace(0, duration / 1000, frames)
+    arr = np.sin(2.0 * math.pi * frequency * t)
+    arr = (arr * 32767).astype(np.int16)
+    arr = np.repeat(arr.reshape(frames, 1), 2, axis=1)
+    return pygame.sndarray.make_sound(arr)
+
+
+class SfxRegistry:
+    """
+    Registry sound effect yang sudah siap putar.
+
+    Semua efek di-load dari file atau di-synthesize sekali (saat startup),
+    lalu diambil berdasarkan nama. Jalur jawaban (benar/salah) cukup
+    memanggil play(name): tanpa alokasi, tanpa I/O file.
+    """
+
+    def __init__(self):
+        self._sounds = {}
+
+    def register_file(self, name, file_path):
+        """Load SFX dari file. Returns True kalau berhasil."""
+        try:
+            self._sounds[name] = pygame.mixer.Sound(file_path)
+            return True
+        except Exception as e:
+            print(f"[WARNING] Gagal load SFX '{name}' dari {file_path}: {e}")
+            return False
+
+    def register_tone(self, name, frequency, duration, sample_rate=22050):
+        """Synthesize beep sekali dan simpan sebagai SFX"""
+        self._sounds[name] = synthesize_tone(frequency, duration, sample_rate)
+
+    def get(self, name):
+        """Ambil Sound siap pakai (None kalau belum terdaftar)"""
+        return self._sounds.get(name)
+
+    def play(self, name):
+        """Putar SFX berdasarkan nama. Returns True kalau SFX terdaftar."""
+        sound = self._sounds.get(name)
+        if sound is None:
+            return False
+        sound.play()
+        return True
+
+    def __contains__(self, name):
+        return name in self._sounds
+
+    def names(self):
+        """Daftar nama SFX yang terdaftar"""
+        return list(self._sounds)
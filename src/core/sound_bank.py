@@ -0,0 +1,92 @@
+import os
+import sys
+import time
+from collections import deque
+
+import pygame
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.lru_cache import LRUCache
+
+# Ukuran buffer mixer (sample) yang dipakai AudioPlayer
+MIXER_BUFFER = 512
+
+
+def sound_nbytes(sound):
+    """Ukuran sample PCM hasil decode sebuah Sound (byte)"""
+    frequency, size, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency * channels * abs(size) // 8)
+
+
+class SoundBank:
+    """
+    Bank audio soal di memori.
+
+    Setiap clip di-decode SEKALI menjadi pygame.mixer.Sound (boleh dari
+    thread prefetch) dan diputar di channel yang di-reserve khusus untuk
+    audio soal, sehingga SFX tidak pernah merebut channelnya. Total memori
+    PCM dibatasi `max_mb`; clip paling lama tidak dipakai di-evict.
+    """
+
+    def __init__(self, max_mb=64, reserved_channels=1, history=100):
+        pygame.mixer.set_reserved(reserved_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(reserved_channels)]
+        self._next_channel = 0
+        self._sounds = LRUCache(max_bytes=max_mb * 1024 * 1024, size_of=sound_nbytes)
+
+        # Time-to-first-sample: waktu dari permintaan play sampai clip
+        # diserahkan ke mixer (+ perkiraan latensi buffer mixer)
+        self.latencies_ms = deque(maxlen=history)
+        frequency = pygame.mixer.get_init()[0]
+        self.buffer_latency_ms = MIXER_BUFFER * 1000.0 / frequency
+
+    def load(self, file_path):
+        """Decode clip ke Sound (kalau belum ada di bank) dan kembalikan Sound-nya"""
+        sound = self._sounds.get(file_path)
+        if sound is None:
+            sound = pygame.mixer.Sound(file_path)
+            self._sounds.put(file_path, sound)
+        return sound
+
+    def play(self, file_path):
+        """
+        Putar clip di channel reserved.
+
+        Returns:
+            time-to-first-sample dalam ms
+        """
+        start = time.perf_counter()
+        sound = self.load(file_path)
+
+        channel = self.channels[self._next_channel]
+        self._next_channel = (self._next_channel + 1) % len(self.channels)
+        channel.play(sound)
+
+        latency_ms = (time.perf_counter() - start) * 1000.0 + self.buffer_latency_ms
+        self.latencies_ms.append(latency_ms)
+        return latency_ms
+
+    def is_playing(self):
+        """True kalau masih ada clip soal yang berbunyi"""
+        return any(channel.get_busy() for channel in self.channels)
+
+    def stop(self):
+        """Hentikan semua channel audio soal"""
+        for channel in self.channels:
+            channel.stop()
+
+    def __contains__(self, file_path):
+        return file_path in self._sounds
+
+    def get_stats(self):
+        """Statistik bank + distribusi time-to-first-sample"""
+        stats = self._sounds.get_stats()
+        if self.latencies_ms:
+            ordered = sorted(self.latencies_ms)
+            stats["ttfs_p50_ms"] = ordered[len(ordered) // 2]
+            stats["ttfs_max_ms"] = ordered[-1]
+        stats["buffer_latency_ms"] = self.buffer_latency_ms
+        return stats
+
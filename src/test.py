@@ -0,0 +1,150 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# Add src directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ui.layout import LayoutCache, game_layout, game_over_layout, menu_layout
+from vision.gesture_decision import GestureDecisionEngine
+
+FPS = 30
+
+
+def old_hold_decision(stream, hold=0.5):
+    """Loop hold lama di handle_game_state: gesture sama beruntun selama `hold` detik"""
+    last, start = None, 0.0
+    for timestamp, gesture in stream:
+        if gesture:
+            if gesture != last:
+                last, start = gesture, timestamp
+            elif timestamp - start >= hold:
+                return gesture, timestamp
+    return None, None
+
+
+def engine_decision(stream, confidence=0.95):
+    engine = GestureDecisionEngine()
+    for timestamp, gesture in stream:
+        decided = engine.update(gesture, timestamp, confidence)
+        if decided:
+            return decided, timestamp
+    return None, None
+
+
+def flicker_stream(rng, target="B", onset=0.2, duration=3.0, max_flicker=0.25):
+    """Hold `target` sejak `onset`; tiap frame bisa flicker ke jawaban lain / tanpa tangan"""
+    flicker = rng.uniform(0, max_flicker)
+    stream = []
+    for i in range(int(duration * FPS)):
+        timestamp = i / FPS
+        if timestamp < onset:
+            gesture = None
+        elif rng.random() > flicker:
+            gesture = target
+        else:
+            gesture = rng.choice([None, "A", "C", "D"])
+        stream.append((timestamp, gesture))
+    return stream
+
+
+class GestureDecisionTest(unittest.TestCase):
+    def test_steady_hold_not_slower_than_old_loop(self):
+        # 1 detik tanpa tangan, lalu 'A' stabil
+        stream = [(i / FPS, None if i < FPS else "A") for i in range(3 * FPS)]
+        old_label, old_time = old_hold_decision(stream)
+        label, decided_at = engine_decision(stream, confidence=1.0)
+
+        self.assertEqual(label, "A")
+        self.assertEqual(old_label, "A")
+        self.assertAlmostEqual(old_time - 1.0, 0.5, places=6)
+        self.assertLessEqual(decided_at, old_time + 1e-9)
+
+    def test_flicker_simulation(self):
+        # 2000 trial, 30 fps, flicker acak sampai 25%, seed tetap supaya angka bisa direproduksi
+        rng = np.random.default_rng(0)
+        results = {"old": [], "engine": []}
+        wrong = {"old": 0, "engine": 0}
+        undecided = {"old": 0, "engine": 0}
+        for _ in range(2000):
+            stream = flicker_stream(rng)
+            for name, decide in (("old", old_hold_decision), ("engine", engine_decision)):
+                label, decided_at = decide(stream)
+                if label is None:
+                    undecided[name] += 1
+                else:
+                    results[name].append(decided_at - 0.2)
+                    wrong[name] += label != "B"
+
+        self.assertEqual(undecided["engine"], 0)
+        self.assertEqual(wrong["engine"], 0)
+        self.assertGreater(undecided["old"], 0)
+        median = {name: np.median(times) for name, times in results.items()}
+        p95 = {name: np.percentile(times, 95) for name, times in results.items()}
+        self.assertLess(median["engine"], median["old"], f"median (s): {median}")
+        self.assertLess(p95["engine"], p95["old"], f"p95 (s): {p95}")
+
+
+class LayoutTest(unittest.TestCase):
+    """Layout murni dari ukuran window: tidak butuh display"""
+
+    def test_game_layout_480x640(self):
+        layout = game_layout(480, 640, 4)
+        self.assertIsNone(layout["image"])
+        self.assertEqual(layout["panel"], pygame.Rect(60, 67, 360, 56))
+        self.assertEqual(layout["cards"], [pygame.Rect(48, y, 384, 48) for y in (261, 321, 381, 441)])
+
+    def test_game_layout_960x1280_two_options(self):
+        layout = game_layout(960, 1280, 2)
+        self.assertEqual(layout["panel"], pygame.Rect(120, 134, 720, 112))
+        self.assertEqual(layout["cards"], [pygame.Rect(96, 643, 768, 96), pygame.Rect(96, 763, 768, 96)])
+        self.assertEqual(layout["content"], layout["panel"].unionall(layout["cards"]))
+
+    def test_menu_cards_fit_window(self):
+        cards = menu_layout(480, 640, 40, 20)["gesture_cards"]
+        self.assertEqual([i for i, _ in cards], [0, 1, 2, 3])
+        self.assertEqual(cards[0][1], pygame.Rect(36, 264, 408, 64))
+        # Window pendek: kartu terakhir keluar layar, tidak dimasukkan
+        cards = menu_layout(480, 480, 40, 20)["gesture_cards"]
+        self.assertEqual([i for i, _ in cards], [0, 1, 2])
+
+    def test_game_over_buttons(self):
+        layout = game_over_layout(480, 640)
+        self.assertEqual(layout["card"], pygame.Rect(36, 116, 408, 288))
+        self.assertEqual(layout["retry_button"], pygame.Rect(84, 420, 312, 44))
+        self.assertEqual(layout["menu_button"], pygame.Rect(84, 480, 312, 44))
+
+    def test_cache_hits(self):
+        cache = LayoutCache()
+        first = cache.get("game", 480, 640, 4)
+        self.assertIs(cache.get("game", 480, 640, 4), first)
+        self.assertIsNot(cache.get("game", 480, 640, 3), first)
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_layout_follows_resize(self):
+        from ui.tampilan import GameUI
+        ui = GameUI()
+        try:
+            ui.resize(480, 640)
+            small = ui.get_layout("game", 4)
+            ui.resize(960, 1280)
+            large = ui.get_layout("game", 4)
+            self.assertEqual(large["cards"], game_layout(960, 1280, 4)["cards"])
+            self.assertNotEqual(large["cards"], small["cards"])
+            # Kembali ke ukuran lama: layout lama dipakai lagi (cache hit)
+            ui.resize(480, 640)
+            self.assertIs(ui.get_layout("game", 4), small)
+        finally:
+            pygame.quit()
+
+
+if __name__ == "__main__":
+    unittest.main()
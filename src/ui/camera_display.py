@@ -0,0 +1,102 @@
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.frame_bridge import FrameBridge
+
+
+class CameraDisplayPipeline:
+    """
+    Pipeline background kamera dalam satu stage (fused).
+
+    Menggantikan copy -> blur full resolusi -> cvtColor -> transpose ->
+    make_surface -> scale_preserve_aspect_ratio. Frame di-crop (cover,
+    sama seperti scale_preserve_aspect_ratio), di-downsample dulu, di-blur
+    di resolusi rendah, lalu di-resize langsung ke ukuran window oleh
+    OpenCV, langsung ke buffer FrameBridge yang berbagi memori dengan
+    surface persisten.
+    """
+
+    def __init__(self, downscale=4, blur_ksize=21):
+        """
+        Args:
+            downscale: faktor downsample sebelum blur
+            blur_ksize: ukuran kernel blur ekuivalen di resolusi kamera
+        """
+        self.downscale = downscale
+        self.blur_ksize = blur_ksize
+
+        self._key = None
+        self._crop = None
+        self._small = None
+        self._blurred = None
+        self._ksize = None
+        self.bridge = FrameBridge()
+
+        # Timing stage
+        self.last_ms = 0.0
+        self.avg_ms = None
+        self.frames = 0
+
+    def _allocate(self, frame_shape, target_size):
+        h, w = frame_shape[:2]
+        tw, th = target_size
+
+        # Crop "cover": isi seluruh window, kelebihan sisi dipotong di tengah
+        if w / h > tw / th:
+            cw, ch = max(1, int(h * tw / th)), h
+        else:
+            cw, ch = w, max(1, int(w * th / tw))
+        x0, y0 = (w - cw) // 2, (h - ch) // 2
+        self._crop = (slice(y0, y0 + ch), slice(x0, x0 + cw))
+
+        sw, sh = max(8, cw // self.downscale), max(8, ch // self.downscale)
+        self._small = np.empty((sh, sw, 3), np.uint8)
+        self._blurred = np.empty((sh, sw, 3), np.uint8)
+
+        # Kernel blur diskalakan ke resolusi rendah (harus ganjil, minimal 3)
+        k = int(round(self.blur_ksize * sw / cw))
+        k = max(3, k | 1)
+        self._ksize = (k, k)
+
+        self.bridge.ensure_size(target_size)
+        self._key = (frame_shape, target_size)
+
+    def process(self, frame, target_size):
+        """
+        Args:
+            frame: frame BGR (sudah dianotasi)
+            target_size: (width, height) window
+
+        Returns:
+            pygame.Surface seukuran window (surface yang sama dipakai ulang)
+        """
+        start = time.perf_counter()
+        if self._key != (frame.shape, target_size):
+            self._allocate(frame.shape, target_size)
+
+        rows, cols = self._crop
+        cv2.resize(frame[rows, cols], (self._small.shape[1], self._small.shape[0]),
+                   dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.GaussianBlur(self._small, self._ksize, 0, dst=self._blurred)
+        # Tulis langsung ke buffer bersama -> surface ikut ter-update (zero copy)
+        cv2.resize(self._blurred, target_size, dst=self.bridge.buffer, interpolation=cv2.INTER_LINEAR)
+
+        self.last_ms = (time.perf_counter() - start) * 1000.0
+        self.avg_ms = self.last_ms if self.avg_ms is None else 0.9 * self.avg_ms + 0.1 * self.last_ms
+        self.frames += 1
+        return self.bridge.surface
+
+    def get_stats(self):
+        """Statistik timing stage"""
+        return {
+            "frames": self.frames,
+            "last_ms": self.last_ms,
+            "avg_ms": self.avg_ms,
+        }
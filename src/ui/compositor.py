@@ -0,0 +1,115 @@
+import time
+
+import pygame
+
+
+class LayerCompositor:
+    """
+    Compositor layer + dirty rectangle untuk GameUI.
+
+    - Static layer: surface transparan berisi elemen yang tidak berubah
+      antar frame (panel, kartu opsi, poster). Hanya di-build ulang kalau
+      key-nya berubah (soal, state, ukuran window) atau di-invalidate.
+    - Dynamic layer: digambar langsung ke screen setiap frame (kamera,
+      animasi) oleh pemanggil.
+    - present(): display.update(dirty_rects) hanya untuk area yang berubah;
+      kalau tidak ada yang berubah, display tidak disentuh sama sekali.
+    - overlay: callable(screen) -> rect opsional (misal overlay performa),
+      digambar paling atas tepat sebelum present.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self._static_key = None
+        self._static_layer = None
+        self._screen_key = None
+        self._dirty = []
+        self._full = False
+        self.overlay = None
+
+        # Counters
+        self.static_rebuilds = 0
+        self.frames_presented = 0
+        self.frames_skipped = 0
+        self.last_present_ms = 0.0
+
+    def set_screen(self, screen):
+        """Dipanggil setelah window di-resize"""
+        self.screen = screen
+        self.invalidate()
+
+    def invalidate(self):
+        """Paksa semua layer digambar ulang (resize, window expose, dll)"""
+        self._static_key = None
+        self._screen_key = None
+
+    def is_current(self, key):
+        """True kalau isi screen terakhir digambar dengan key ini dan masih valid"""
+        return key == self._screen_key
+
+    def is_valid(self):
+        """False kalau isi screen sudah di-invalidate atau terakhir digambar tanpa key (dinamis)"""
+        return self._screen_key is not None
+
+    def static_layer(self, key, builder):
+        """
+        Ambil static layer untuk `key`, build ulang hanya kalau key berubah.
+
+        Args:
+            key: identitas isi layer (hashable)
+            builder: callable(surface) yang menggambar isi layer
+
+        Returns:
+            surface SRCALPHA seukuran screen
+        """
+        if key != self._static_key or self._static_layer is None \
+                or self._static_layer.get_size() != self.screen.get_size():
+            if self._static_layer is None or self._static_layer.get_size() != self.screen.get_size():
+                self._static_layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            else:
+                self._static_layer.fill((0, 0, 0, 0))
+            builder(self._static_layer)
+            self._static_key = key
+            self.static_rebuilds += 1
+        return self._static_layer
+
+    def mark_dirty(self, rect):
+        """Tandai area screen yang berubah di frame ini"""
+        self._dirty.append(pygame.Rect(rect))
+
+    def mark_full(self):
+        """Tandai seluruh screen berubah"""
+        self._full = True
+
+    def present(self, screen_key=None):
+        """
+        Kirim area yang berubah ke display.
+
+        Args:
+            screen_key: key isi screen setelah frame ini (lihat is_current)
+        """
+        start = time.perf_counter()
+        if self.overlay is not None:
+            rect = self.overlay(self.screen)
+            if rect is not None:
+                self._dirty.append(rect)
+        if self._full:
+            pygame.display.flip()
+            self.frames_presented += 1
+        elif self._dirty:
+            pygame.display.update(self._dirty)
+            self.frames_presented += 1
+        else:
+            self.frames_skipped += 1
+        self._dirty = []
+        self._full = False
+        self._screen_key = screen_key
+        self.last_present_ms = (time.perf_counter() - start) * 1000.0
+
+    def get_stats(self):
+        """Statistik compositor"""
+        return {
+            "static_rebuilds": self.static_rebuilds,
+            "frames_presented": self.frames_presented,
+            "frames_skipped": self.frames_skipped,
+        }
@@ -0,0 +1,47 @@
+import os
+import sys
+
+import pygame
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.lru_cache import LRUCache
+
+
+class FontRegistry:
+    """
+    Registry pygame.font.Font, di-memoize per (face, size).
+
+    Membuat Font berarti membuka & mem-parse file font, jadi tidak boleh
+    terjadi per frame. Font yang sama (face & ukuran sama) selalu
+    mengembalikan objek yang sama, sehingga key TextCache (id font) tetap
+    valid setelah resize bolak-balik. Jumlah font dibatasi (LRU) supaya
+    resize ke banyak ukuran tidak menumpuk font di memori.
+    """
+
+    def __init__(self, max_entries=16):
+        self._cache = LRUCache(max_entries=max_entries)
+
+    def get(self, size, face=None):
+        """
+        Args:
+            size: ukuran font (pixel)
+            face: path file font, None = font default pygame
+
+        Returns:
+            pygame.font.Font
+        """
+        key = (face, int(size))
+        font = self._cache.get(key)
+        if font is None:
+            font = pygame.font.Font(face, int(size))
+            self._cache.put(key, font)
+        return font
+
+    def clear(self):
+        self._cache.clear()
+
+    def get_stats(self):
+        """Statistik registry (entries, hits, misses, evictions, ...)"""
+        return self._cache.get_stats()
@@ -0,0 +1,48 @@
+import numpy as np
+import pygame
+
+
+class FrameBridge:
+    """
+    Jembatan zero-copy frame BGR (numpy) -> pygame.Surface.
+
+    Satu buffer numpy (tinggi, lebar, 3) berformat BGR dibungkus SEKALI
+    dengan pygame.image.frombuffer(..., "BGR"), sehingga surface dan buffer
+    berbagi memori yang sama. Menulis pixel ke `buffer` (misal lewat
+    parameter dst= fungsi OpenCV) langsung terlihat di `surface`: tanpa
+    transpose, tanpa cvtColor, tanpa alokasi surface per frame.
+    """
+
+    def __init__(self):
+        self.buffer = None
+        self.surface = None
+        self.size = None
+        self.reallocations = 0
+
+    def ensure_size(self, size):
+        """
+        Pastikan buffer & surface berukuran `size` (width, height).
+        Dialokasikan ulang hanya kalau ukurannya berubah (misal window di-resize).
+
+        Returns:
+            buffer numpy (height, width, 3) yang dibagi dengan surface
+        """
+        if size != self.size:
+            width, height = size
+            self.buffer = np.zeros((height, width, 3), np.uint8)
+            # surface hanya valid selama self.buffer hidup -> disimpan bersama
+            self.surface = pygame.image.frombuffer(self.buffer, (width, height), "BGR")
+            self.size = size
+            self.reallocations += 1
+        return self.buffer
+
+    def update(self, frame):
+        """
+        Salin frame BGR (ukuran sama) ke buffer bersama.
+
+        Returns:
+            surface persisten yang sekarang berisi frame tersebut
+        """
+        height, width = frame.shape[:2]
+        np.copyto(self.ensure_size((width, height)), frame)
+        return self.surface
@@ -1,8 +1,8 @@
 import sys
 import os
+import time
 import cv2
 import pygame
-import numpy as np
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -11,9 +11,21 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.data_loader import load_questions, load_gesture_map
 from core.game_manager import GameManager, GamePhase
 from core.audio_player import AudioPlayer
+from core.prefetcher import AssetPrefetcher
+from core.profiler import FrameProfiler
+from core.latency_tracker import LatencyTracker
 from ui.tampilan import GameUI, GameState
+from ui.camera_display import CameraDisplayPipeline
+from ui.render_scheduler import RenderScheduler
+from ui.perf_overlay import PerfOverlay
 from vision.gesture_detector import GestureDetector
 from vision.gesture_mapper import GestureMapper
+from vision.gesture_decision import GestureDecisionEngine
+from vision.camera_capture import CameraCapture
+from vision.inference_scheduler import InferenceScheduler
+from vision.vision_lifecycle import VisionLifecycle
+from vision.recording import FrameRecorder
+from vision.frame_source import open_frame_source
 
 # ==========================================
 # MAIN APPLICATION CLASS
@@ -36,24 +48,75 @@ class CineTuneApp:
         print(f"[INIT] Gesture map: {self.gesture_map}")
         
         # Initialize managers
-        self.game_manager = GameManager(self.questions)
         self.audio_player = AudioPlayer()
+        self.audio_player.load_sound_effects(self.base_dir)
         self.ui = GameUI()
+        # GAME jalan dengan cadence 60 fps; layar static tidur di event.wait
+        self.render_scheduler = RenderScheduler(self.ui.clock, fps=60)
+        # Background kamera: downsample + blur + resize + convert dalam satu stage
+        self.camera_display = CameraDisplayPipeline()
+        # Prefetch poster & audio soal berikutnya di background thread
+        self.prefetcher = AssetPrefetcher([
+            lambda q: self.ui.preload_image(q["image"], *self.ui.get_poster_size()),
+            lambda q: self.audio_player.preload_question_audio(q["audio"]),
+        ])
+        self.game_manager = GameManager(self.questions, prefetcher=self.prefetcher)
         
         # Initialize vision components
         print("[INIT] Initializing gesture detection...")
-        self.gesture_detector = GestureDetector()
+        # CINETUNE_INFERENCE_WORKER=1 -> MediaPipe jalan di proses terpisah
+        use_worker = os.environ.get("CINETUNE_INFERENCE_WORKER", "0") == "1"
+        # CINETUNE_ROI_TRACKING=1 -> inferensi hanya di sekitar tangan terakhir
+        roi_tracking = os.environ.get("CINETUNE_ROI_TRACKING", "0") == "1"
+        self.gesture_detector = GestureDetector(use_worker=use_worker, roi_tracking=roi_tracking)
         self.gesture_mapper = GestureMapper()
-        self.cap = cv2.VideoCapture(0)
+        # Vote + hysteresis + dwell 0.5 detik + cooldown setelah submit
+        self.gesture_decision = GestureDecisionEngine(dwell=0.5)
+        # CINETUNE_INFERENCE_INTERVAL=adaptive (default) atau N -> inferensi tiap N frame
+        interval = os.environ.get("CINETUNE_INFERENCE_INTERVAL", "adaptive")
+        if interval == "adaptive":
+            self.inference_scheduler = InferenceScheduler(adaptive=True)
+        else:
+            self.inference_scheduler = InferenceScheduler(interval=int(interval))
+        # CINETUNE_SOURCE=camera:0 (default) | video:<file> | images:<dir>[@fps] |
+        # synthetic[:WxH@fps] | recording:<dir>; CINETUNE_REPLAY=<dir> = singkatan
+        # recording:<dir>. CINETUNE_SOURCE_PACED=0 -> semua frame secepat mungkin
+        # (lockstep, deterministik), CINETUNE_SOURCE_LOOP=1 untuk footage kiosk
+        replay_path = os.environ.get("CINETUNE_REPLAY")
+        source = open_frame_source(
+            f"recording:{replay_path}" if replay_path else os.environ.get("CINETUNE_SOURCE", "camera:0"),
+            paced=os.environ.get("CINETUNE_SOURCE_PACED", "1") == "1",
+            loop=os.environ.get("CINETUNE_SOURCE_LOOP", "0") == "1",
+        )
+        print(f"[INIT] Frame source: {source.describe()}")
+        self.camera = CameraCapture(source)
+        # CINETUNE_RECORD=<dir> -> rekam frame + landmarks (CINETUNE_RECORD_SCALE=0.5,
+        # CINETUNE_RECORD_VIDEO=1 untuk MJPG, CINETUNE_RECORD_FRAMES=0 untuk landmarks saja)
+        record_path = os.environ.get("CINETUNE_RECORD")
+        self.recorder = None
+        if record_path:
+            self.recorder = FrameRecorder(
+                record_path,
+                scale=float(os.environ.get("CINETUNE_RECORD_SCALE", "1.0")),
+                video=os.environ.get("CINETUNE_RECORD_VIDEO", "0") == "1",
+                frames=os.environ.get("CINETUNE_RECORD_FRAMES", "1") == "1",
+            )
+            print(f"[INIT] Recording ke {record_path} ({self.recorder.frame_format})")
         
-        if not self.cap.isOpened():
+        if not self.camera.is_opened():
             print("[WARNING] Camera tidak tersedia!")
+        self.camera.start()
+        # Kamera & detector hanya aktif di state GAME (mulai dari MENU -> suspend)
+        self.vision = VisionLifecycle(self.camera, self.gesture_detector, self.inference_scheduler)
+        self.vision.set_active(self.ui.state == GameState.GAME)
+        # Hasil frame terakhir, dipakai ulang kalau capture belum punya frame baru
+        self._last_camera_result = (None, None, None)
+        # Timestamp capture frame yang menghasilkan hasil deteksi terakhir
+        self._last_observed_at = None
         
         # Game state
         self.running = True
         self.current_gesture = None
-        self.last_gesture_time = 0
-        self.gesture_hold_time = 0.5  # seconds to hold gesture before registering
         
         # Result state
         self.showing_result = False
@@ -65,52 +128,105 @@ class CineTuneApp:
         self.last_question_index_for_audio = None
         # <<< END ADDED
         
+        # Latency end-to-end gesture -> feedback audio per jawaban
+        sound_bank = self.audio_player.sound_bank
+        self.latency = LatencyTracker(audio_buffer_ms=sound_bank.buffer_latency_ms if sound_bank else 0.0)
+        
+        # Instrumentasi per stage + overlay: CINETUNE_PROFILE=1 atau toggle dengan F3
+        self.profiler = FrameProfiler()
+        self.perf_overlay = PerfOverlay(self.profiler, self.ui.fonts.get(18), counters_fn=self._perf_counters)
+        self.set_profiling(os.environ.get("CINETUNE_PROFILE", "0") == "1")
+        
         print("[INIT] CineTune initialized successfully!")
+
+    def set_profiling(self, enabled):
+        """Nyalakan/matikan instrumentasi dan overlay performa"""
+        self.profiler.set_enabled(enabled)
+        self.ui.compositor.overlay = self.perf_overlay.draw if enabled else None
+        # Gambar ulang penuh supaya overlay lama hilang / overlay baru muncul
+        self.ui.invalidate()
+        print(f"[PERF] Profiling {'ON' if enabled else 'OFF'}")
+
+    def _perf_counters(self):
+        """Counter frame yang dibuang, untuk overlay"""
+        counters = {"cam drop": self.camera.frames_dropped}
+        worker = self.gesture_detector.worker
+        if worker is not None:
+            counters["worker drop"] = worker.frames_dropped + worker.frames_skipped
+        return counters
     
     def get_camera_frame(self):
         """Get current camera frame with gesture detection"""
-        ret, frame = self.cap.read()
-        if not ret:
-            return None, None, None
+        profiler = self.profiler
+        # Non-blocking: render loop tidak pernah menunggu kamera
+        with profiler.span("capture"):
+            packet = self.camera.read()
+        if packet is None:
+            return self._last_camera_result
+        raw_frame, timestamp, _ = packet
         
         # Flip frame
-        frame = cv2.flip(frame, 1)
-        # Detect landmarks on original (non-blurred) frame so detection is accurate
-        landmarks, annotated = self.gesture_detector.detect(frame)
+        frame = cv2.flip(raw_frame, 1)
+        # Detect landmarks on original (non-blurred) frame so detection is accurate.
+        # Scheduler menentukan apakah inferensi dijalankan di frame ini atau
+        # landmarks diinterpolasi dari inferensi sebelumnya.
+        with profiler.span("inference"):
+            hand = self.inference_scheduler.step(frame, timestamp, self.gesture_detector.estimate)
+        detected_at = time.monotonic()
+        with profiler.span("landmarks"):
+            self.gesture_detector.draw(frame, hand)
 
-        # Map to gesture
-        gesture = None
-        if landmarks:
-            gesture = self.gesture_mapper.map(landmarks)
+        # Map to gesture (HandLandmarks langsung, dinormalisasi di mapper)
+        with profiler.span("gesture"):
+            gesture = self.gesture_mapper.map(hand)
+        # Capture frame yang menghasilkan hasil ini (tangan atau None): di mode
+        # worker / frame yang dilewati scheduler bisa lebih lama dari frame yang
+        # baru dibaca. None = worker belum mengembalikan hasil apa pun.
+        if hand is not None:
+            self._last_observed_at = hand.timestamp
+        else:
+            self._last_observed_at = self.gesture_detector.last_result_timestamp
+        self.latency.mark_frame(self._last_observed_at if self._last_observed_at is not None else timestamp,
+                                detected_at, time.monotonic())
+        if self.recorder is not None:
+            self.recorder.write(raw_frame, timestamp, hand,
+                                predicted=not self.inference_scheduler.last_step_inferred)
 
-        # Prepare a blurred copy for display (soft background / filter look)
-        try:
-            display_frame = annotated.copy()
-            # Apply Gaussian blur for background aesthetic
-            display_frame = cv2.GaussianBlur(display_frame, (21, 21), 0)
-        except Exception:
-            display_frame = annotated
+        # Blurred background seukuran window (soft background / filter look)
+        with profiler.span("camera_bg"):
+            frame_surface = self.camera_display.process(frame, (self.ui.width, self.ui.height))
 
-        # Convert display frame to pygame surface
-        frame_rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-        frame_rgb = np.transpose(frame_rgb, (1, 0, 2))
-        frame_surface = pygame.surfarray.make_surface(frame_rgb)
+        self._last_camera_result = (frame_surface, gesture, hand)
+        return self._last_camera_result
+    
+    def handle_window_event(self, event):
+        """Event global (window, hotkey debug) untuk semua state. Returns True kalau sudah ditangani."""
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.set_profiling(not self.profiler.enabled)
+        elif event.type == pygame.VIDEORESIZE:
+            # Resize dikumpulkan dulu, diterapkan sekali oleh run() setelah selesai
+            self.ui.request_resize(*event.size)
+        elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+            # Isi window hilang (tertutup window lain, restore) -> gambar ulang
+            self.ui.invalidate()
+        else:
+            return False
+        return True
 
-        return frame_surface, gesture, annotated
+    def _state_events(self, events):
+        """Buang event window (sudah ditangani) dari list event milik state handler"""
+        if events is None:
+            events = pygame.event.get()
+        return [event for event in events if not self.handle_window_event(event)]
     
-    def handle_menu_state(self):
+    def handle_menu_state(self, events=None):
         """Handle menu state"""
         button = self.ui.draw_menu()
         
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.VIDEORESIZE:
-                # Handle window resize
-                self.ui.width, self.ui.height = event.size
-                self.ui.screen = pygame.display.set_mode((self.ui.width, self.ui.height), pygame.RESIZABLE)
-                self.ui._update_fonts()  # Update fonts for new resolution
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+        for event in self._state_events(events):
+            if event.type == pygame.MOUSEBUTTONDOWN:
                 if button.collidepoint(event.pos):
                     print("[GAME] Starting game...")
                     self.game_manager.start_game()
@@ -119,7 +235,7 @@ class CineTuneApp:
                     # <<< END ADDED
                     self.ui.state = GameState.GAME
     
-    def handle_game_state(self):
+    def handle_game_state(self, events=None):
         """Handle game state"""
         # <<< TIMER-ADD: update timer 10 detik per soal >>>
         self.game_manager.update_timer(self.audio_player)
@@ -136,6 +252,8 @@ class CineTuneApp:
         # <<< ADDED: putar audio pertanyaan hanya sekali per question
         current_index = self.game_manager.current_question_idx
         if current_index != self.last_question_index_for_audio:
+            # Soal baru (dijawab atau timeout): vote & hold soal sebelumnya tidak berlaku
+            self.gesture_decision.reset()
             audio_path = current_q.get("audio")
             if audio_path:
                 print(f"[AUDIO] Play question audio: {audio_path}")
@@ -145,38 +263,34 @@ class CineTuneApp:
         # <<< END ADDED
         
         # Get camera frame
-        frame_surface, gesture, raw_frame = self.get_camera_frame()
+        frame_surface, gesture, hand = self.get_camera_frame()
         
         # Update current gesture
         self.current_gesture = gesture
         
-        # Load and display question image
-        question_image = self.ui.load_image(current_q["image"], max_width=400, max_height=400)
+        # Load and display question image (dari cache, sudah seukuran tampilan)
+        question_image = self.ui.load_image(current_q["image"], *self.ui.get_poster_size())
         
         # Draw game screen
         question_num = self.game_manager.get_current_question_number()
         total_questions = self.game_manager.get_total_questions()
         
-        self.ui.draw_game(
-            question_num=question_num,
-            total_questions=total_questions,
-            image_surface=question_image,
-            options=current_q["options"],
-            current_gesture=gesture,
-            gesture_confidence=0.8 if gesture else 0,
-            camera_frame=frame_surface
-        )
+        with self.profiler.span("ui"):
+            self.ui.draw_game(
+                question_num=question_num,
+                total_questions=total_questions,
+                image_surface=question_image,
+                options=current_q["options"],
+                current_gesture=gesture,
+                gesture_confidence=0.8 if gesture else 0,
+                camera_frame=frame_surface
+            )
+        # "ui" termasuk present; present juga dicatat terpisah
+        self.profiler.record("present", self.ui.compositor.last_present_ms)
         
         # Handle events and gesture detection
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.VIDEORESIZE:
-                # Handle window resize
-                self.ui.width, self.ui.height = event.size
-                self.ui.screen = pygame.display.set_mode((self.ui.width, self.ui.height), pygame.RESIZABLE)
-                self.ui._update_fonts()  # Update fonts for new resolution
-            elif event.type == pygame.KEYDOWN:
+        for event in self._state_events(events):
+            if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 # DEBUG: Manual answer submission with keys
@@ -186,23 +300,28 @@ class CineTuneApp:
                     print(f"[GAME] Answer submitted (DEBUG): {answer}")
                     self.submit_answer(answer)
         
-        # Check if gesture was held long enough
-        if gesture:
-            import time
-            current_time = time.time()
-            
-            if gesture != self.last_gesture:
-                self.last_gesture = gesture
-                self.gesture_hold_start = current_time
-            elif (current_time - self.gesture_hold_start) >= self.gesture_hold_time:
-                # Gesture held long enough, submit answer
-                print(f"[GAME] Answer submitted: {gesture}")
-                self.submit_answer(gesture)
+        # Keputusan jawaban: satu observasi per hasil deteksi baru, termasuk
+        # hasil tanpa gesture. Timestamp = capture frame yang diproses, jadi
+        # hasil worker / prediksi yang diulang diabaikan engine (timestamp sama).
+        if self._last_observed_at is not None:
+            # Skor handedness sebagai pengganti confidence (lihat HandLandmarks)
+            confidence = hand.score if hand is not None else 1.0
+            decided = self.gesture_decision.update(gesture, self._last_observed_at, confidence)
+            if decided:
+                print(f"[GAME] Answer submitted: {decided}")
+                record = self.latency.begin(decided, self.gesture_decision.last_appeared,
+                                            self.gesture_decision.last_onset, time.monotonic())
+                self.submit_answer(decided, record)
                 self.current_gesture = None
-                self.last_gesture = None
     
-    def submit_answer(self, gesture_answer):
-        """Submit an answer"""
+    def submit_answer(self, gesture_answer, latency_record=None):
+        """
+        Submit an answer
+
+        Args:
+            gesture_answer: 'A'..'D'
+            latency_record: LatencyRecord dari keputusan gesture (None untuk input keyboard)
+        """
         if gesture_answer not in ['A', 'B', 'C', 'D']:
             return
         
@@ -215,10 +334,13 @@ class CineTuneApp:
             # <<< END ADDED >>>
 
             # Play audio feedback (correct / wrong)
+            feedback_start = time.monotonic()
             if result["is_correct"]:
                 self.audio_player.play_correct_sound(self.base_dir)
             else:
                 self.audio_player.play_wrong_sound(self.base_dir)
+            if latency_record is not None:
+                self.latency.finish(latency_record, result["is_correct"], feedback_start, time.monotonic())
             
             self.showing_result = True
             self.result_data = result
@@ -226,7 +348,7 @@ class CineTuneApp:
             self.ui.state = GameState.RESULT
 
     
-    def handle_result_state(self):
+    def handle_result_state(self, events=None):
         """Handle result state"""
         if not self.result_data:
             return
@@ -235,9 +357,6 @@ class CineTuneApp:
         if not current_q:
             return
         
-        # Load question image
-        question_image = self.ui.load_image(current_q["image"], max_width=400, max_height=400)
-        
         # Show result
         button = self.ui.draw_result(
             is_correct=self.result_data["is_correct"],
@@ -247,15 +366,8 @@ class CineTuneApp:
         )
         
         # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.VIDEORESIZE:
-                # Handle window resize
-                self.ui.width, self.ui.height = event.size
-                self.ui.screen = pygame.display.set_mode((self.ui.width, self.ui.height), pygame.RESIZABLE)
-                self.ui._update_fonts()  # Update fonts for new resolution
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+        for event in self._state_events(events):
+            if event.type == pygame.MOUSEBUTTONDOWN:
                 if button.collidepoint(event.pos):
                     print("[GAME] Moving to next question...")
                     self.game_manager.next_question()
@@ -278,7 +390,7 @@ class CineTuneApp:
                     else:
                         self.ui.state = GameState.GAME
     
-    def handle_game_over_state(self):
+    def handle_game_over_state(self, events=None):
         """Handle game over state"""
         stats = self.game_manager.get_stats()
         
@@ -288,15 +400,8 @@ class CineTuneApp:
             correct_answers=stats["score"]
         )
         
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.VIDEORESIZE:
-                # Handle window resize
-                self.ui.width, self.ui.height = event.size
-                self.ui.screen = pygame.display.set_mode((self.ui.width, self.ui.height), pygame.RESIZABLE)
-                self.ui._update_fonts()  # Update fonts for new resolution
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+        for event in self._state_events(events):
+            if event.type == pygame.MOUSEBUTTONDOWN:
                 if retry_btn.collidepoint(event.pos):
                     print("[GAME] Retry game from start...")
                     self.game_manager.reset()
@@ -314,28 +419,64 @@ class CineTuneApp:
     
     def run(self):
         """Main game loop"""
-        import time
-        
-        self.last_gesture = None
-        self.gesture_hold_start = time.time()
-        
+        events = []
         while self.running:
-            if self.ui.state == GameState.MENU:
-                self.handle_menu_state()
-            elif self.ui.state == GameState.GAME:
-                self.handle_game_state()
-            elif self.ui.state == GameState.RESULT:
-                self.handle_result_state()
-            elif self.ui.state == GameState.GAME_OVER:
-                self.handle_game_over_state()
-            
-            self.ui.clock.tick(60)
+            # Event window diproses sebelum menggambar supaya invalidate/resize
+            # langsung terlihat di frame ini
+            events = self._state_events(events)
+            self.ui.apply_pending_resize()
+            if self.vision.set_active(self.ui.state == GameState.GAME):
+                # Frame, gesture & vote dari sebelum pause sudah basi
+                self._last_camera_result = (None, None, None)
+                self._last_observed_at = None
+                self.latency.reset_frame()
+                self.gesture_decision.reset()
+
+            drawn_state = self.ui.state
+            if drawn_state == GameState.MENU:
+                self.handle_menu_state(events)
+            elif drawn_state == GameState.GAME:
+                self.handle_game_state(events)
+            elif drawn_state == GameState.RESULT:
+                self.handle_result_state(events)
+            elif drawn_state == GameState.GAME_OVER:
+                self.handle_game_over_state(events)
+
+            self.profiler.tick()
+            if not self.running:
+                break
+
+            # Layar static yang sudah tampil tidak perlu digambar ulang:
+            # tidur sampai ada event (atau timeout) alih-alih berputar 60 fps
+            active = self.ui.state == GameState.GAME or self.ui.state != drawn_state \
+                or self.ui.needs_redraw()
+            events = self.render_scheduler.next_events(
+                active, timeout_ms=self.ui.idle_timeout(self.render_scheduler.idle_timeout_ms))
     
     def cleanup(self):
         """Cleanup resources"""
         print("[CLEANUP] Cleaning up resources...")
-        if self.cap:
-            self.cap.release()
+        self.prefetcher.stop()
+        print(f"[CLEANUP] Prefetch stats: {self.prefetcher.get_stats()}")
+        if self.camera:
+            print(f"[CLEANUP] Camera stats: {self.camera.get_stats()}")
+            print(f"[CLEANUP] Vision lifecycle stats: {self.vision.get_stats()}")
+            self.camera.release()
+        if self.recorder is not None:
+            self.recorder.close()
+            print(f"[CLEANUP] Recording stats: {self.recorder.get_stats()}")
+        self.gesture_detector.close()
+        print(f"[CLEANUP] Inference scheduler stats: {self.inference_scheduler.get_stats()}")
+        print(f"[CLEANUP] Gesture decision stats: {self.gesture_decision.get_stats()}")
+        print(f"[CLEANUP] Image cache stats: {self.ui.image_cache.get_stats()}")
+        print(f"[CLEANUP] Camera display stats: {self.camera_display.get_stats()}")
+        print(f"[CLEANUP] Compositor stats: {self.ui.compositor.get_stats()}")
+        print(f"[CLEANUP] Text cache stats: {self.ui.text_cache.get_stats()}")
+        print(f"[CLEANUP] Font registry stats: {self.ui.fonts.get_stats()}")
+        print(f"[CLEANUP] Render scheduler stats: {self.render_scheduler.get_stats()}")
+        print(self.latency.report())
+        if self.profiler.enabled:
+            print(f"[CLEANUP] Frame profile (ms): {self.profiler.get_stats()}")
         self.audio_player.quit()
         self.ui.quit()
         cv2.destroyAllWindows()
@@ -0,0 +1,250 @@
+import os
+import sys
+
+import pygame
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.lru_cache import LRUCache
+
+# ==========================================
+# LAYOUT ENGINE
+# ==========================================
+# Semua geometri layar dihitung di sini sebagai fungsi murni dari ukuran
+# window (plus tinggi teks yang menentukan posisi elemen di bawahnya).
+# Tidak butuh display, jadi bisa dites langsung: game_layout(480, 640, 4)
+# dst. Rect hasil layout di-cache dan dipakai bersama oleh drawing &
+# hit-testing -> JANGAN diubah in-place (pakai .move()/.copy()).
+
+BASE_WIDTH = 480
+
+# Jumlah kartu penjelasan gesture di menu
+MENU_GESTURE_CARDS = 4
+
+
+def responsive_size(width, base_size):
+    """Ukuran relatif terhadap lebar dasar 480px"""
+    return int(base_size * width / BASE_WIDTH)
+
+
+def responsive_padding(width):
+    return max(8, responsive_size(width, 12))
+
+
+def responsive_margin(width):
+    return max(12, responsive_size(width, 16))
+
+
+def font_sizes(width):
+    """Ukuran font per peran, diskalakan dengan lebar window"""
+    width_ratio = width / BASE_WIDTH
+    return {
+        "large": max(28, int(40 * width_ratio)),
+        "medium": max(22, int(28 * width_ratio)),
+        "small": max(14, int(18 * width_ratio)),
+        "tiny": max(12, int(14 * width_ratio)),
+        "percent": responsive_size(width, 72),
+    }
+
+
+def poster_size(width, height):
+    """Ukuran maksimum poster soal"""
+    return min(400, int(width * 0.35)), min(400, int(height * 0.25))
+
+
+def menu_layout(width, height, title_h, subtitle_h):
+    """
+    Args:
+        title_h, subtitle_h: tinggi surface teks judul & subjudul
+
+    Returns:
+        dict menu: padding, title_y, subtitle_y, start_button, gesture_cards
+        (list (index, rect) kartu yang muat di layar)
+    """
+    padding = responsive_padding(width)
+    margin = responsive_margin(width)
+
+    title_y = int(height * 0.15)
+    subtitle_y = title_y + title_h + padding
+
+    btn_w = int(width * 0.5)
+    btn_h = responsive_size(width, 48)
+    btn_x = width // 2 - btn_w // 2
+    btn_y = subtitle_y + subtitle_h + margin + margin
+    start_button = pygame.Rect(btn_x, btn_y, btn_w, btn_h)
+
+    card_w = int(width * 0.85)
+    card_h = responsive_size(width, 64)
+    gap = padding + 4
+    gx = (width - card_w) // 2
+    gy = btn_y + btn_h + margin
+    cards = []
+    for i in range(MENU_GESTURE_CARDS):
+        y = gy + i * (card_h + gap)
+        # Kartu yang keluar layar tidak digambar
+        if y + card_h > height - padding:
+            continue
+        cards.append((i, pygame.Rect(gx, y, card_w, card_h)))
+
+    return {
+        "padding": padding,
+        "title_y": title_y,
+        "subtitle_y": subtitle_y,
+        "start_button": start_button,
+        "gesture_cards": cards,
+    }
+
+
+def game_layout(width, height, n_options, image_size=None):
+    """
+    Args:
+        n_options: jumlah opsi jawaban
+        image_size: (w, h) poster asli, None kalau tidak ada poster
+
+    Returns:
+        dict rect layar game: image, border, panel, cards (tanpa animasi), content
+    """
+    padding = responsive_padding(width)
+    margin = responsive_margin(width)
+    layout = {"image": None, "border": None}
+
+    img_bottom = int(height * 0.08)
+    if image_size:
+        iw, ih = image_size
+        max_w, max_h = int(width * 0.35), int(height * 0.25)
+        scale = min(max_w / iw, max_h / ih, 1.0)
+        size = (int(iw * scale), int(ih * scale))
+        img_x = (width - size[0]) // 2
+        img_y = int(height * 0.08)
+        layout["image"] = pygame.Rect((img_x, img_y), size)
+        layout["border"] = pygame.Rect(img_x - 6, img_y - 6, size[0] + 12, size[1] + 12)
+        img_bottom = img_y + size[1] + padding
+
+    panel_h = responsive_size(width, 56)
+    panel_w = int(width * 0.75)
+    panel_rect = pygame.Rect((width - panel_w) // 2, img_bottom + margin, panel_w, panel_h)
+    layout["panel"] = panel_rect
+
+    card_w = int(width * 0.8)
+    card_h = responsive_size(width, 48)
+    gap = padding
+
+    # Stack kartu di tengah ruang sisa di bawah panel
+    total_cards_h = n_options * card_h + (n_options - 1) * gap
+    max_bottom = height - padding
+    available_space = max_bottom - panel_rect.bottom
+    ideal_offset = max(int(margin * 1.5), (available_space - total_cards_h) // 2)
+    start_y = panel_rect.bottom + ideal_offset
+    if start_y + total_cards_h > max_bottom:
+        overflow = (start_y + total_cards_h) - max_bottom
+        start_y = max(panel_rect.bottom + int(margin * 1.5), start_y - overflow // 2)
+
+    card_x = (width - card_w) // 2
+    layout["cards"] = [pygame.Rect(card_x, start_y + idx * (card_h + gap), card_w, card_h)
+                       for idx in range(n_options)]
+
+    # Area yang berisi elemen static layer (untuk blit parsial)
+    content = panel_rect.unionall(layout["cards"]) if layout["cards"] else panel_rect.copy()
+    if layout["border"]:
+        content.union_ip(layout["border"])
+    layout["content"] = content.clip(pygame.Rect(0, 0, width, height))
+    return layout
+
+
+def result_layout(width, height, result_h):
+    """
+    Args:
+        result_h: tinggi surface teks hasil (BENAR/SALAH)
+
+    Returns:
+        dict layar hasil: result_y, feedback_y, correct_y, continue_button
+    """
+    margin = responsive_margin(width)
+
+    result_y = int(height * 0.12)
+    feedback_y = result_y + result_h + margin
+    correct_y = feedback_y + responsive_size(width, 40) + margin
+
+    btn_w = int(width * 0.7)
+    btn_h = responsive_size(width, 48)
+    continue_button = pygame.Rect(width // 2 - btn_w // 2, correct_y + responsive_size(width, 60), btn_w, btn_h)
+
+    return {
+        "result_y": result_y,
+        "feedback_y": feedback_y,
+        "correct_y": correct_y,
+        "continue_button": continue_button,
+    }
+
+
+def game_over_layout(width, height):
+    """
+    Returns:
+        dict layar game over: card (rect di screen), perc_y (baris teks
+        pertama, relatif ke card), line_gap (jarak antar baris teks),
+        retry_button, menu_button
+    """
+    padding = responsive_padding(width)
+    margin = responsive_margin(width)
+
+    card_w = int(width * 0.85)
+    card_h = int(height * 0.45)
+    btn_w = int(width * 0.65)
+    btn_h = responsive_size(width, 44)
+    btn_spacing = padding + 4
+
+    total_block_h = card_h + margin + btn_h * 2 + btn_spacing
+    card = pygame.Rect((width - card_w) // 2, max(margin, (height - total_block_h) // 2), card_w, card_h)
+
+    bx = (width - btn_w) // 2
+    by = card.bottom + margin
+    return {
+        "card": card,
+        "perc_y": int(card_h * 0.08),
+        "line_gap": padding,
+        "retry_button": pygame.Rect(bx, by, btn_w, btn_h),
+        "menu_button": pygame.Rect(bx, by + btn_h + btn_spacing, btn_w, btn_h),
+    }
+
+
+_BUILDERS = {
+    "menu": menu_layout,
+    "game": game_layout,
+    "result": result_layout,
+    "game_over": game_over_layout,
+}
+
+
+class LayoutCache:
+    """
+    Cache layout per (screen, width, height, argumen lain).
+
+    Layout dihitung sekali per ukuran window / jumlah opsi, bukan per
+    frame. Dibatasi (LRU) supaya resize ke banyak ukuran tidak menumpuk.
+    """
+
+    def __init__(self, max_entries=32):
+        self._cache = LRUCache(max_entries=max_entries)
+
+    def get(self, screen, width, height, *args):
+        """
+        Args:
+            screen: "menu" | "game" | "result" | "game_over"
+            *args: argumen tambahan builder (hashable), misal n_options
+
+        Returns:
+            dict layout (shared, read-only)
+        """
+        key = (screen, width, height) + args
+        layout = self._cache.get(key)
+        if layout is None:
+            layout = _BUILDERS[screen](width, height, *args)
+            self._cache.put(key, layout)
+        return layout
+
+    def clear(self):
+        self._cache.clear()
+
+    def get_stats(self):
+        return self._cache.get_stats()
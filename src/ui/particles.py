@@ -0,0 +1,142 @@
+import numpy as np
+import pygame
+
+
+class ParticleSystem:
+    """
+    Sistem partikel vectorized (struct-of-arrays).
+
+    Posisi, kecepatan, ukuran, alpha dan umur setiap partikel disimpan di
+    array NumPy berkapasitas tetap; partikel hidup selalu berada di prefix
+    [0:count]. update() memajukan semua partikel dalam satu langkah NumPy,
+    draw() memilih sprite dari atlas yang sudah di-render sebelumnya
+    (warna x radius x level alpha) dan mem-blit semuanya dengan satu
+    panggilan Surface.blits, tanpa membuat Surface per partikel.
+    """
+
+    def __init__(self, colors, capacity=4096, max_radius=10, alpha_levels=8):
+        """
+        Args:
+            colors: list warna RGB yang bisa dipakai partikel (index = color)
+            capacity: jumlah maksimum partikel hidup
+            max_radius: radius sprite terbesar di atlas (pixel)
+            alpha_levels: jumlah level alpha di atlas
+        """
+        self.capacity = capacity
+        self.max_radius = max_radius
+        self.alpha_levels = alpha_levels
+        self.count = 0
+
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.size = np.zeros(capacity, np.float32)
+        self.alpha = np.zeros(capacity, np.float32)
+        self.age = np.zeros(capacity, np.float32)
+        self.life = np.zeros(capacity, np.float32)
+        self.color = np.zeros(capacity, np.int32)
+        self._fields = (self.x, self.y, self.vx, self.vy, self.size,
+                        self.alpha, self.age, self.life, self.color)
+
+        self._sprites = self._build_atlas(colors)
+        self.dropped = 0
+
+    def _build_atlas(self, colors):
+        """Render semua kombinasi (warna, radius, alpha) sekali -> list datar"""
+        sprites = []
+        for rgb in colors:
+            for radius in range(1, self.max_radius + 1):
+                for level in range(self.alpha_levels):
+                    a = int(255 * (level + 1) / self.alpha_levels)
+                    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(surf, tuple(rgb[:3]) + (a,), (radius, radius), radius)
+                    sprites.append(surf)
+        return sprites
+
+    def _sprite_index(self, color, radius, level):
+        return (color * self.max_radius + (radius - 1)) * self.alpha_levels + level
+
+    def spawn(self, x, y, vx=0.0, vy=0.0, size=3.0, alpha=255.0, life=1.0, color=0):
+        """
+        Tambah partikel. Semua argumen boleh skalar atau array (di-broadcast).
+
+        Args:
+            x, y: posisi (pixel)
+            vx, vy: kecepatan (pixel/detik)
+            size: radius (pixel)
+            alpha: 0-255
+            life: umur maksimum (detik)
+            color: index ke daftar warna atlas
+
+        Returns:
+            jumlah partikel yang benar-benar ditambahkan
+        """
+        values = np.broadcast_arrays(x, y, vx, vy, size, alpha, 0.0, life, color)
+        n = values[0].size
+        room = self.capacity - self.count
+        if n > room:
+            self.dropped += n - room
+            n = room
+        if n <= 0:
+            return 0
+        start, end = self.count, self.count + n
+        for field, value in zip(self._fields, values):
+            field[start:end] = np.ravel(value)[:n]
+        self.count = end
+        return n
+
+    def update(self, dt, bounds=None):
+        """
+        Majukan semua partikel dt detik lalu buang yang sudah mati.
+
+        Args:
+            dt: selang waktu (detik)
+            bounds: (width, height) opsional; partikel di luar area dibuang
+        """
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n] * dt
+        y += self.vy[:n] * dt
+        self.age[:n] += dt
+
+        alive = self.age[:n] < self.life[:n]
+        if bounds is not None:
+            width, height = bounds
+            alive &= (y < height) & (x > -self.max_radius) & (x < width + self.max_radius)
+        if alive.all():
+            return
+
+        # Compaction: partikel hidup dipindah ke depan
+        keep = np.flatnonzero(alive)
+        for field in self._fields:
+            field[:keep.size] = field[keep]
+        self.count = keep.size
+
+    def draw(self, surface, fade=True):
+        """
+        Gambar semua partikel dengan satu Surface.blits.
+
+        Args:
+            surface: target
+            fade: kalau True, alpha berkurang linear sesuai umur
+        """
+        n = self.count
+        if n == 0:
+            return
+        radius = np.clip(np.rint(self.size[:n]), 1, self.max_radius).astype(np.int32)
+        alpha = self.alpha[:n]
+        if fade:
+            alpha = alpha * np.clip(1.0 - self.age[:n] / np.maximum(self.life[:n], 1e-6), 0.0, 1.0)
+        level = np.clip((alpha * self.alpha_levels / 256.0).astype(np.int32), 0, self.alpha_levels - 1)
+
+        index = self._sprite_index(self.color[:n], radius, level).tolist()
+        px = (self.x[:n] - radius).astype(np.int32).tolist()
+        py = (self.y[:n] - radius).astype(np.int32).tolist()
+        sprites = self._sprites
+        surface.blits([(sprites[i], (u, v)) for i, u, v in zip(index, px, py)], doreturn=False)
+
+    def clear(self):
+        self.count = 0
@@ -0,0 +1,80 @@
+import pygame
+
+# Stage yang ditampilkan (urutan tampil), label pendek
+OVERLAY_STAGES = [
+    ("capture", "capture"),
+    ("inference", "infer"),
+    ("landmarks", "lmk draw"),
+    ("gesture", "gesture"),
+    ("camera_bg", "cam bg"),
+    ("ui", "ui draw"),
+    ("present", "present"),
+]
+
+
+class PerfOverlay:
+    """
+    Overlay performa kecil di pojok kiri atas: FPS, p50/p95/p99 per stage
+    dari FrameProfiler, dan counter frame yang dibuang.
+
+    Teks hanya di-render ulang setiap refresh_ms (bukan per frame); di
+    antaranya panel yang sama cukup di-blit.
+    """
+
+    def __init__(self, profiler, font, counters_fn=None, refresh_ms=250):
+        """
+        Args:
+            profiler: FrameProfiler
+            font: pygame.font.Font untuk teks overlay
+            counters_fn: callable -> dict counter tambahan (misal frame dropped)
+            refresh_ms: interval render ulang teks
+        """
+        self.profiler = profiler
+        self.font = font
+        self.counters_fn = counters_fn
+        self.refresh_ms = refresh_ms
+        self._panel = None
+        self._rendered_at = None
+
+    def _lines(self):
+        lines = []
+        frame = self.profiler.percentiles("frame")
+        frame_text = f"  frame p95 {frame[1]:.1f}ms" if frame else ""
+        lines.append(f"FPS {self.profiler.fps():.1f}{frame_text}")
+        lines.append(f"{'ms':<9}{'p50':>6}{'p95':>7}{'p99':>7}")
+        for name, label in OVERLAY_STAGES:
+            p = self.profiler.percentiles(name)
+            if p is not None:
+                lines.append(f"{label:<9}{p[0]:6.2f}{p[1]:7.2f}{p[2]:7.2f}")
+        if self.counters_fn is not None:
+            counters = self.counters_fn()
+            if counters:
+                lines.append("  ".join(f"{k} {v}" for k, v in counters.items()))
+        return lines
+
+    def _render(self):
+        lines = self._lines()
+        surfaces = [self.font.render(line, True, (220, 255, 220)) for line in lines]
+        pad = 6
+        width = max(s.get_width() for s in surfaces) + pad * 2
+        height = sum(s.get_height() for s in surfaces) + pad * 2
+        panel = pygame.Surface((width, height))
+        panel.fill((0, 0, 0))
+        y = pad
+        for surf in surfaces:
+            panel.blit(surf, (pad, y))
+            y += surf.get_height()
+        return panel
+
+    def draw(self, surface):
+        """
+        Gambar overlay (panel opaque, aman digambar berulang di tempat yang sama).
+
+        Returns:
+            rect area yang digambar
+        """
+        now = pygame.time.get_ticks()
+        if self._panel is None or now - self._rendered_at >= self.refresh_ms:
+            self._panel = self._render()
+            self._rendered_at = now
+        return surface.blit(self._panel, (4, 4))
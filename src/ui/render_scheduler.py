@@ -0,0 +1,62 @@
+import pygame
+
+
+# Batas lama blocking di state static; setelah itu loop tetap berputar sekali
+IDLE_TIMEOUT_MS = 1000
+
+
+class RenderScheduler:
+    """
+    Menentukan kapan main loop boleh tidur.
+
+    - Aktif (GAME, transisi state, layar perlu digambar ulang): cadence
+      tetap lewat clock.tick(fps), event diambil dengan event.get().
+    - Idle (MENU/RESULT/GAME_OVER yang sudah tampil): block di
+      pygame.event.wait(timeout) sampai ada input/event window atau
+      timeout habis, jadi kiosk yang ditinggal tidak memakan CPU.
+    """
+
+    def __init__(self, clock, fps=60, idle_timeout_ms=IDLE_TIMEOUT_MS):
+        self.clock = clock
+        self.fps = fps
+        self.idle_timeout_ms = idle_timeout_ms
+
+        # Counters
+        self.active_frames = 0
+        self.idle_waits = 0
+        self.idle_timeouts = 0
+
+    def next_events(self, active, timeout_ms=None):
+        """
+        Tunggu frame berikutnya lalu kembalikan event yang masuk.
+
+        Args:
+            active: True kalau frame berikutnya harus digambar sesuai cadence
+            timeout_ms: batas blocking saat idle (default idle_timeout_ms)
+
+        Returns:
+            list pygame event
+        """
+        if active:
+            self.clock.tick(self.fps)
+            self.active_frames += 1
+            return pygame.event.get()
+
+        if timeout_ms is None:
+            timeout_ms = self.idle_timeout_ms
+        self.idle_waits += 1
+        event = pygame.event.wait(max(1, int(timeout_ms)))
+        # Jangan biarkan tick berikutnya menghitung waktu tidur sebagai frame time
+        self.clock.tick()
+        if event.type == pygame.NOEVENT:
+            self.idle_timeouts += 1
+            return []
+        return [event] + pygame.event.get()
+
+    def get_stats(self):
+        """Statistik scheduler"""
+        return {
+            "active_frames": self.active_frames,
+            "idle_waits": self.idle_waits,
+            "idle_timeouts": self.idle_timeouts,
+        }
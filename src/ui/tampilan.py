@@ -1,9 +1,22 @@
 import pygame
 import os
+import sys
 import math
-import random
 from enum import Enum
 
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.lru_cache import LRUCache
+from ui.compositor import LayerCompositor
+from ui.font_registry import FontRegistry
+from ui.layout import LayoutCache, font_sizes, poster_size, \
+    responsive_size, responsive_padding, responsive_margin
+from ui.particles import ParticleSystem
+from ui.text_cache import TextCache
+
 # ==========================================
 # CONSTANTS & COLORS
 # ==========================================
@@ -19,6 +32,9 @@ class Colors:
     YELLOW = (255, 255, 0)
     ORANGE = (255, 165, 0)
 
+# Resize window baru diterapkan setelah tidak ada VIDEORESIZE selama ini (ms)
+RESIZE_SETTLE_MS = 150
+
 class GameState(Enum):
     MENU = 1
     GAME = 2
@@ -97,11 +113,15 @@ def scale_preserve_aspect_ratio(surface, target_width, target_height, bg_color=(
         print(f"[ERROR] Scale preserve aspect ratio: {e}")
         return surface
 
+def surface_nbytes(surface):
+    """Perkiraan memori pixel sebuah surface (byte)"""
+    return surface.get_pitch() * surface.get_height()
+
 # ==========================================
 # UI CLASS
 # ==========================================
 class GameUI:
-    def __init__(self, width=480, height=640):
+    def __init__(self, width=480, height=640, image_cache_mb=32):
         # Initialize pygame if not already initialized
         if not pygame.get_init():
             pygame.init()
@@ -116,8 +136,28 @@ class GameUI:
         self.screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
         pygame.display.set_caption("CineTune - Tebak Film Lewat Gesture")
         
+        # Font di-memoize per (face, size); font yang sama -> objek yang sama,
+        # jadi entry text cache tetap valid lintas resize
+        self.fonts = FontRegistry()
+        self.text_cache = TextCache()
+        # Rect semua layar dihitung sekali per ukuran window (lihat ui/layout.py)
+        self.layouts = LayoutCache()
+        self._pending_size = None
+        self._pending_since = 0
+
         # Update fonts based on resolution (responsive)
         self._update_fonts()
+
+        # Cache image yang sudah di-decode, di-scale & di-convert ke format display
+        # key: (path, max_width, max_height, display mode)
+        self.image_cache = LRUCache(max_bytes=image_cache_mb * 1024 * 1024, size_of=surface_nbytes)
+        # Image yang sudah di-decode & di-scale oleh thread prefetch (belum di-convert)
+        self._preloaded_images = LRUCache(max_entries=4)
+
+        # Static layer + dirty rect: layar yang tidak berubah tidak digambar ulang
+        self.compositor = LayerCompositor(self.screen)
+        self._option_buttons = {}
+        self._screen_buttons = None
         
         # Clock
         self.clock = pygame.time.Clock()
@@ -136,71 +176,142 @@ class GameUI:
         self.card_border = (40, 80, 140)
         self.shadow = (0, 0, 0, 60)
         # particles/decoration disabled for elegant minimal UI
-        self._particles = []
+        # Partikel & confetti: struct-of-arrays NumPy + atlas sprite (lihat ui/particles.py)
+        # index warna: 0 = partikel latar, 1.. = confetti
+        self._particle_colors = [Colors.WHITE, self.accent_cyan, self.accent_pink, Colors.YELLOW, Colors.ORANGE]
+        self._particles = ParticleSystem(self._particle_colors)
+        self._confetti = ParticleSystem(self._particle_colors, capacity=256)
+        self._confetti_key = None
+        self._rng = np.random.default_rng()
         self._last_particle_time = 0
+        self._last_particle_update = pygame.time.get_ticks()
         self._particle_rate_ms = 999999
         self._decor_phase = 0.0
         self._fade_alpha = 0
     
     def _update_fonts(self):
         """Update font sizes based on screen resolution (responsive design)"""
-        # Calculate font sizes based on screen width (relative to base resolution 480px)
-        base_width = 480
-        width_ratio = self.width / base_width
-        
-        # Font sizes scale proportionally with width
-        self.font_large = pygame.font.Font(None, max(28, int(40 * width_ratio)))
-        self.font_medium = pygame.font.Font(None, max(22, int(28 * width_ratio)))
-        self.font_small = pygame.font.Font(None, max(14, int(18 * width_ratio)))
-        self.font_tiny = pygame.font.Font(None, max(12, int(14 * width_ratio)))
+        # Font sizes scale proportionally with width (relative to base resolution 480px)
+        sizes = font_sizes(self.width)
+        self.font_large = self.fonts.get(sizes["large"])
+        self.font_medium = self.fonts.get(sizes["medium"])
+        self.font_small = self.fonts.get(sizes["small"])
+        self.font_tiny = self.fonts.get(sizes["tiny"])
+        self.font_percent = self.fonts.get(sizes["percent"])
+
+    def render_text(self, font, text, color, antialias=True):
+        """font.render lewat text cache"""
+        return self.text_cache.render(font, text, antialias, color)
+    
+    def resize(self, width, height):
+        """Handle window resize: set mode baru, update font, invalidate cache"""
+        self.width, self.height = width, height
+        self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
+        self._update_fonts()  # Update fonts for new resolution
+        self.image_cache.clear()
+        self._preloaded_images.clear()
+        self.compositor.set_screen(self.screen)
+
+    def request_resize(self, width, height):
+        """
+        Catat ukuran window baru dari VIDEORESIZE tanpa langsung menerapkannya.
+        Drag-resize mengirim puluhan event; font & layout cukup dibangun
+        ulang sekali lewat apply_pending_resize setelah resize selesai.
+        """
+        self._pending_size = (width, height)
+        self._pending_since = pygame.time.get_ticks()
+        # Area window yang baru terbuka tetap perlu diisi selama menunggu
+        self.compositor.invalidate()
+
+    def apply_pending_resize(self, settle_ms=RESIZE_SETTLE_MS):
+        """
+        Terapkan resize yang tertunda kalau window sudah diam selama settle_ms.
+
+        Returns:
+            True kalau resize diterapkan di panggilan ini
+        """
+        if self._pending_size is None:
+            return False
+        if pygame.time.get_ticks() - self._pending_since < settle_ms:
+            return False
+        size, self._pending_size = self._pending_size, None
+        if size != (self.width, self.height):
+            self.resize(*size)
+        return True
+
+    def needs_redraw(self):
+        """True kalau screen harus digambar ulang (invalidate, resize tertunda)"""
+        if self._pending_size is not None and \
+                pygame.time.get_ticks() - self._pending_since >= RESIZE_SETTLE_MS:
+            return True
+        return not self.compositor.is_valid()
+
+    def idle_timeout(self, default_ms):
+        """Batas tidur loop idle: dipersingkat kalau ada resize yang menunggu diterapkan"""
+        if self._pending_size is None:
+            return default_ms
+        remaining = RESIZE_SETTLE_MS - (pygame.time.get_ticks() - self._pending_since)
+        return max(1, min(default_ms, remaining))
+
+    def invalidate(self):
+        """Paksa layar digambar ulang di frame berikutnya (misal window expose)"""
+        self.compositor.invalidate()
+
+    def _display_mode_key(self):
+        """Identitas format display, bagian dari key cache surface"""
+        return (self.screen.get_bitsize(), self.screen.get_masks())
+
+    def get_poster_size(self):
+        """Ukuran maksimum poster soal seperti yang ditampilkan di draw_game"""
+        return poster_size(self.width, self.height)
     
     def get_responsive_size(self, base_size):
         """Get a responsive size based on screen width"""
-        base_width = 480
-        width_ratio = self.width / base_width
-        return int(base_size * width_ratio)
+        return responsive_size(self.width, base_size)
     
     def get_responsive_padding(self):
         """Get responsive padding value"""
-        return max(8, self.get_responsive_size(12))
+        return responsive_padding(self.width)
     
     def get_responsive_margin(self):
         """Get responsive margin value"""
-        return max(12, self.get_responsive_size(16))
+        return responsive_margin(self.width)
+
+    def get_layout(self, screen, *args):
+        """Layout (cache) layar `screen` untuk ukuran window sekarang"""
+        return self.layouts.get(screen, self.width, self.height, *args)
         
     def draw_menu(self):
         """Draw main menu screen with animated gradient + neon title + styled start button"""
+        # Menu sepenuhnya static: gambar ulang hanya kalau ukuran window berubah
+        screen_key = ("menu", self.width, self.height)
+        if self.compositor.is_current(screen_key):
+            self.compositor.present(screen_key)
+            return self._screen_buttons
+
         # Flat elegant background
         self.screen.fill(self.bg_dark)
+        title_s = self.render_text(self.font_large, "CineTune", self.accent_cyan)
+        subtitle = self.render_text(self.font_small, "Tebak Gestur & Film", self.accent_gray)
+        layout = self.get_layout("menu", title_s.get_height(), subtitle.get_height())
         
-        # Responsive padding & margins
-        padding = self.get_responsive_padding()
-        margin = self.get_responsive_margin()
-        
-        # Title - positioned responsively
-        title_y = int(self.height * 0.15)
-        title_s = self.font_large.render("CineTune", True, self.accent_cyan)
-        self.screen.blit(title_s, (self.width // 2 - title_s.get_width() // 2, title_y))
+        # Title
+        self.screen.blit(title_s, (self.width // 2 - title_s.get_width() // 2, layout["title_y"]))
         
         # Subtitle
-        subtitle_y = title_y + title_s.get_height() + padding
-        subtitle = self.font_small.render("Tebak Gestur & Film", True, self.accent_gray)
         subtitle_x = self.width // 2 - subtitle.get_width() // 2
-        self.screen.blit(subtitle, (subtitle_x, subtitle_y))
-
-        # Start button - responsive size
-        btn_w = int(self.width * 0.5)
-        btn_h = self.get_responsive_size(48)
-        btn_x = self.width // 2 - btn_w // 2
-        btn_y = subtitle_y + subtitle.get_height() + margin + margin
-        start_button = pygame.Rect(btn_x, btn_y, btn_w, btn_h)
+        self.screen.blit(subtitle, (subtitle_x, layout["subtitle_y"]))
+
+        # Start button
+        start_button = layout["start_button"]
+        btn_x, btn_y, btn_w, btn_h = start_button
         
         # Elegant button: soft shadow, rounded, muted accent
         shadow_surf = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         pygame.draw.rect(shadow_surf, self.shadow, shadow_surf.get_rect(), border_radius=int(btn_h * 0.4))
         self.screen.blit(shadow_surf, (btn_x + 2, btn_y + 6))
         pygame.draw.rect(self.screen, self.accent_cyan, start_button, border_radius=int(btn_h * 0.4))
-        btn_text = self.font_medium.render("Mulai", True, Colors.WHITE)
+        btn_text = self.render_text(self.font_medium, "Mulai", Colors.WHITE)
         self.screen.blit(btn_text, (btn_x + btn_w // 2 - btn_text.get_width() // 2, btn_y + btn_h // 2 - btn_text.get_height() // 2))
 
         # Detailed gesture explanation area (per-gesture) below button
@@ -211,22 +322,10 @@ class GameUI:
             {"icon": "✊", "name": "Fist", "key": "D", "desc": "Genggaman - Pilih opsi D"},
         ]
 
-        # Layout vertikal satu kolom di tengah bawah tombol - responsive
-        card_w = int(self.width * 0.85)
-        card_h = self.get_responsive_size(64)
-        gap = padding + 4
-        gx = (self.width - card_w) // 2
-        gy = btn_y + btn_h + margin
-        
-        for i, gesture in enumerate(gestures):
-            x = gx
-            y = gy + i * (card_h + gap)
-            
-            # Skip rendering if card would go off-screen
-            if y + card_h > self.height - padding:
-                continue
-                
-            card_rect = pygame.Rect(x, y, card_w, card_h)
+        # Layout vertikal satu kolom di tengah bawah tombol (hanya kartu yang muat di layar)
+        for i, card_rect in layout["gesture_cards"]:
+            gesture = gestures[i]
+            x, y, card_w, card_h = card_rect
             # Card shadow
             card_shadow = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
             pygame.draw.rect(card_shadow, self.shadow, card_shadow.get_rect(), border_radius=int(card_h * 0.25))
@@ -236,127 +335,137 @@ class GameUI:
             pygame.draw.rect(self.screen, self.card_border, card_rect, 1, border_radius=int(card_h * 0.25))
             
             # Icon
-            icon_s = self.font_medium.render(gesture["icon"], True, self.accent_cyan)
+            icon_s = self.render_text(self.font_medium, gesture["icon"], self.accent_cyan)
             icon_x = card_rect.x + int(card_w * 0.08)
             icon_y = card_rect.y + (card_rect.height - icon_s.get_height()) // 2
             self.screen.blit(icon_s, (icon_x, icon_y))
             
             # Name
-            name_s = self.font_small.render(f"{gesture['name']} ({gesture['key']})", True, Colors.WHITE)
+            name_s = self.render_text(self.font_small, f"{gesture['name']} ({gesture['key']})", Colors.WHITE)
             name_x = card_rect.x + int(card_w * 0.18)
-            name_y = card_rect.y + padding
+            name_y = card_rect.y + layout["padding"]
             self.screen.blit(name_s, (name_x, name_y))
             
             # Description
-            desc_s = self.font_tiny.render(gesture['desc'], True, self.accent_gray)
-            desc_x = card_rect.x + int(card_w * 0.18)
-            desc_y = name_y + name_s.get_height() + 2
-            self.screen.blit(desc_s, (desc_x, desc_y))
+            desc_s = self.render_text(self.font_tiny, gesture['desc'], self.accent_gray)
+            self.screen.blit(desc_s, (name_x, name_y + name_s.get_height() + 2))
 
-        pygame.display.flip()
+        self._screen_buttons = start_button
+        self.compositor.mark_full()
+        self.compositor.present(screen_key)
         return start_button
     
-    def draw_game(self, question_num, total_questions, image_surface, options, current_gesture=None, gesture_confidence=0, camera_frame=None):
-        """Draw game screen in a TikTok-like style with responsive layout"""
-        padding = self.get_responsive_padding()
-        margin = self.get_responsive_margin()
-        
-        # Background: camera preview fill (if available), fallback ke tema gelap menu
-        if camera_frame:
-            try:
-                # Use preserve aspect ratio to avoid stretching
-                bg = scale_preserve_aspect_ratio(camera_frame, self.width, self.height, self.bg_dark)
-                self.screen.blit(bg, (0, 0))
-            except Exception:
-                self.screen.fill(self.bg_dark)
-        else:
-            self.screen.fill(self.bg_dark)
-
-        # Draw film image - responsive sizing
-        img_bottom = int(self.height * 0.08)
-        if image_surface:
-            img_rect = image_surface.get_rect()
-            max_w = int(self.width * 0.35)
-            max_h = int(self.height * 0.25)
-            scale = min(max_w / img_rect.width, max_h / img_rect.height, 1.0)
-            img_size = (int(img_rect.width * scale), int(img_rect.height * scale))
-            img_surf = pygame.transform.scale(image_surface, img_size)
-            img_x = (self.width - img_size[0]) // 2
-            img_y = int(self.height * 0.08)
-            border_rect = pygame.Rect(img_x-6, img_y-6, img_size[0]+12, img_size[1]+12)
-            pygame.draw.rect(self.screen, self.accent_cyan, border_rect, 3, border_radius=int(img_size[0] * 0.1))
-            self.screen.blit(img_surf, (img_x, img_y))
-            img_bottom = img_y + img_size[1] + padding
-
-        # Draw top panel - responsive
-        panel_h = self.get_responsive_size(56)
-        panel_y = img_bottom + margin
-        panel_w = int(self.width * 0.75)
-        panel_x = (self.width - panel_w) // 2
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
+    def _game_layout(self, image_surface, n_options):
+        """Semua rect layar game (poster, panel, kartu opsi tanpa animasi) dari layout cache"""
+        image_size = image_surface.get_size() if image_surface else None
+        return self.get_layout("game", n_options, image_size)
+
+    def _draw_option_card(self, surface, card_rect, key, text):
+        """Gambar satu kartu opsi jawaban"""
+        card_w, card_h = card_rect.size
+
+        # Simple card
+        pygame.draw.rect(surface, self.card_bg, card_rect, border_radius=int(card_h * 0.3))
+        pygame.draw.rect(surface, self.card_border, card_rect, 1, border_radius=int(card_h * 0.3))
+
+        # Option text: left side large key, then option text
+        key_surf = self.render_text(self.font_medium, key, Colors.WHITE)
+        key_x = card_rect.x + int(card_w * 0.08)
+        key_y = card_rect.y + (card_h - key_surf.get_height()) // 2
+        surface.blit(key_surf, (key_x, key_y))
+
+        txt_surf = self.render_text(self.font_small, text, Colors.LIGHT_GRAY)
+        txt_x = card_rect.x + int(card_w * 0.28)
+        txt_y = card_rect.y + (card_h - txt_surf.get_height()) // 2
+        surface.blit(txt_surf, (txt_x, txt_y))
+
+    def _build_game_layer(self, surface, layout, question_num, total_questions, image_surface, options, include_cards):
+        """Gambar elemen static layar game ke static layer"""
+        if layout["image"]:
+            img_rect = layout["image"]
+            if img_rect.size == image_surface.get_size():
+                # Sudah di-scale oleh load_image (cache), tidak perlu scale ulang
+                img_surf = image_surface
+            else:
+                img_surf = pygame.transform.scale(image_surface, img_rect.size)
+            pygame.draw.rect(surface, self.accent_cyan, layout["border"], 3, border_radius=int(img_rect.width * 0.1))
+            surface.blit(img_surf, img_rect.topleft)
+
+        panel_rect = layout["panel"]
         panel_surf = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
         panel_surf.fill(self.bg_panel + (220,))
-        pygame.draw.rect(panel_surf, self.card_border, panel_surf.get_rect(), 1, border_radius=int(panel_h * 0.35))
+        pygame.draw.rect(panel_surf, self.card_border, panel_surf.get_rect(), 1, border_radius=int(panel_rect.height * 0.35))
         
         # Question info di tengah panel
         q_text = f"Soal {question_num}/{total_questions}"
-        q_surf = self.font_medium.render(q_text, True, self.accent_cyan)
+        q_surf = self.render_text(self.font_medium, q_text, self.accent_cyan)
         q_x = panel_rect.width // 2 - q_surf.get_width() // 2
         q_y = panel_rect.height // 2 - q_surf.get_height() // 2
         panel_surf.blit(q_surf, (q_x, q_y))
-        self.screen.blit(panel_surf, (panel_rect.x, panel_rect.y))
-        
+        surface.blit(panel_surf, (panel_rect.x, panel_rect.y))
+
+        if include_cards:
+            for card_rect, (key, text) in zip(layout["cards"], options.items()):
+                self._draw_option_card(surface, card_rect, key, text)
+
+    def draw_game(self, question_num, total_questions, image_surface, options, current_gesture=None, gesture_confidence=0, camera_frame=None):
+        """Draw game screen in a TikTok-like style with responsive layout"""
         now = pygame.time.get_ticks()
         if self.state != self._last_state:
             self._state_change_time = now
             self._last_state = self.state
-        
-        # Define card layout variables untuk opsi - responsive
-        card_w = int(self.width * 0.8)
-        card_h = self.get_responsive_size(48)
-        gap = padding
-        base_start_y = panel_rect.bottom + margin
 
         raw_progress = min(1.0, (now - self._state_change_time) / 550.0)
         anim_progress = 1 - pow(1 - raw_progress, 3)
         slide_offset = int((1.0 - anim_progress) * 140)
+        animating = slide_offset != 0
 
-        # Hitung tinggi total stack card
-        total_cards_h = len(options) * card_h + (len(options) - 1) * gap
-        max_bottom = self.height - padding
+        # Tanpa kamera & tanpa animasi, layar tidak berubah -> tidak perlu digambar ulang
+        content_key = ("game", question_num, total_questions, id(image_surface),
+                       tuple(options.items()), self.width, self.height, animating)
+        screen_key = None if camera_frame else content_key
+        if screen_key is not None and not animating and self.compositor.is_current(screen_key):
+            self.compositor.present(screen_key)
+            return self._option_buttons
 
-        available_space = max_bottom - panel_rect.bottom
-        ideal_offset = max(int(margin * 1.5), (available_space - total_cards_h) // 2)
-        start_y = panel_rect.bottom + ideal_offset
+        layout = self._game_layout(image_surface, len(options))
 
-        if start_y + total_cards_h > max_bottom:
-            overflow = (start_y + total_cards_h) - max_bottom
-            start_y = max(panel_rect.bottom + int(margin * 1.5), start_y - overflow // 2)
+        # Background: camera preview fill (if available), fallback ke tema gelap menu
+        if camera_frame:
+            try:
+                if camera_frame.get_size() == (self.width, self.height):
+                    # Sudah seukuran window (CameraDisplayPipeline)
+                    bg = camera_frame
+                else:
+                    # Use preserve aspect ratio to avoid stretching
+                    bg = scale_preserve_aspect_ratio(camera_frame, self.width, self.height, self.bg_dark)
+                self.screen.blit(bg, (0, 0))
+            except Exception:
+                self.screen.fill(self.bg_dark)
+        else:
+            self.screen.fill(self.bg_dark)
 
-        option_buttons = {}
-        for idx, (key, text) in enumerate(options.items()):
-            y = start_y + idx * (card_h + gap) + slide_offset
-            card_x = (self.width - card_w) // 2
-            card_rect = pygame.Rect(card_x, y, card_w, card_h)
-
-            # Simple card
-            pygame.draw.rect(self.screen, self.card_bg, card_rect, border_radius=int(card_h * 0.3))
-            pygame.draw.rect(self.screen, self.card_border, card_rect, 1, border_radius=int(card_h * 0.3))
-
-            # Option text: left side large key, then option text
-            key_surf = self.font_medium.render(key, True, Colors.WHITE)
-            key_x = card_rect.x + int(card_w * 0.08)
-            key_y = card_rect.y + (card_h - key_surf.get_height()) // 2
-            self.screen.blit(key_surf, (key_x, key_y))
-
-            txt_surf = self.font_small.render(text, True, Colors.LIGHT_GRAY)
-            txt_x = card_rect.x + int(card_w * 0.28)
-            txt_y = card_rect.y + (card_h - txt_surf.get_height()) // 2
-            self.screen.blit(txt_surf, (txt_x, txt_y))
+        # Static layer: poster, panel, dan kartu opsi (kalau animasi sudah selesai)
+        layer = self.compositor.static_layer(content_key, lambda surface: self._build_game_layer(
+            surface, layout, question_num, total_questions, image_surface, options, include_cards=not animating))
+        self.screen.blit(layer, layout["content"].topleft, area=layout["content"])
 
+        # Dynamic: kartu yang sedang slide-in
+        option_buttons = {}
+        for card_rect, (key, text) in zip(layout["cards"], options.items()):
+            card_rect = card_rect.move(0, slide_offset)
+            if animating:
+                self._draw_option_card(self.screen, card_rect, key, text)
             option_buttons[key] = card_rect
+        self._option_buttons = option_buttons
 
-        pygame.display.flip()
+        if screen_key is not None and animating and self.compositor.is_current(screen_key) and layout["cards"]:
+            # Hanya area kartu yang bergerak yang dikirim ke display
+            top = layout["cards"][0].top
+            self.compositor.mark_dirty(pygame.Rect(0, top, self.width, self.height - top))
+        else:
+            self.compositor.mark_full()
+        self.compositor.present(screen_key)
         return option_buttons
 
     def _draw_gesture_legend(self, x=24, y=24):
@@ -377,8 +486,8 @@ class GameUI:
         ex = 12
         ey = 12
         for icon, key in entries:
-            icon_s = self.font_small.render(icon, True, Colors.WHITE)
-            key_s = self.font_tiny.render(key, True, Colors.LIGHT_GRAY)
+            icon_s = self.render_text(self.font_small, icon, Colors.WHITE)
+            key_s = self.render_text(self.font_tiny, key, Colors.LIGHT_GRAY)
             surf.blit(icon_s, (ex, ey))
             surf.blit(key_s, (ex + 40, ey + (icon_s.get_height() - key_s.get_height()) // 2))
             ey += icon_s.get_height() + 8
@@ -389,68 +498,68 @@ class GameUI:
         """Draw a lightweight confetti effect determined by score."""
         # seed by score for deterministic effect during a session
         seed = int((correct_answers / max(1, total_questions)) * 1000)
-        random.seed(seed + pygame.time.get_ticks() // 500)
-        count = 40
-        for i in range(count):
-            x = random.randint(0, self.width)
-            y = random.randint(0, int(self.height * 0.4))
-            size = random.randint(4, 10)
-            col = random.choice([self.accent_cyan, self.accent_pink, Colors.YELLOW, Colors.ORANGE])
-            pygame.draw.circle(self.screen, col, (x, y), size)
+        key = (seed + pygame.time.get_ticks() // 500, self.width, self.height)
+        if key != self._confetti_key:
+            # Layout confetti hanya berubah tiap 500ms -> spawn ulang saat itu saja
+            rng = np.random.default_rng(key[0])
+            count = 40
+            self._confetti.clear()
+            self._confetti.spawn(
+                x=rng.integers(0, self.width + 1, count),
+                y=rng.integers(0, int(self.height * 0.4) + 1, count),
+                size=rng.integers(4, 11, count),
+                life=np.inf,
+                color=rng.integers(1, len(self._particle_colors), count),
+            )
+            self._confetti_key = key
+        self._confetti.draw(self.screen, fade=False)
 
     # ------------------ Particle + Decorative helpers ------------------
-    def _spawn_particle(self, x=None, y=0):
-        """Spawn a subtle floating particle for background depth"""
+    def _spawn_particle(self, x=None, y=0, count=1):
+        """Spawn subtle floating particles for background depth"""
+        rng = self._rng
         if x is None:
-            x = random.randint(0, self.width)
-        part = {
-            "x": float(x),
-            "y": float(y if y else random.randint(0, int(self.height*0.4))),
-            "vy": random.uniform(0.2, 0.8),
-            "size": random.uniform(2.0, 6.0),
-            "alpha": random.randint(30, 90),
-            "life": random.randint(1800, 4200),
-            "t": pygame.time.get_ticks()
-        }
-        self._particles.append(part)
+            x = rng.integers(0, self.width + 1, count)
+        if not y:
+            y = rng.integers(0, int(self.height * 0.4) + 1, count)
+        self._particles.spawn(
+            x=x,
+            y=y,
+            vy=rng.uniform(12.0, 48.0, count),     # pixel/detik (~0.2-0.8 px per frame @60fps)
+            size=rng.uniform(2.0, 6.0, count),
+            alpha=rng.integers(30, 91, count),
+            life=rng.uniform(1.8, 4.2, count),
+            color=0,
+        )
 
     def _update_particles(self):
         now = pygame.time.get_ticks()
-        keep = []
-        for p in self._particles:
-            dt = now - p["t"]
-            p["y"] += p["vy"]
-            # fade slowly
-            life_ratio = dt / max(1, p["life"])
-            if life_ratio < 1.0 and p["y"] < self.height * 0.9:
-                keep.append(p)
-        self._particles = keep
+        dt = (now - self._last_particle_update) / 1000.0
+        self._last_particle_update = now
+        self._particles.update(dt, bounds=(self.width, self.height * 0.9))
 
     def _draw_particles(self):
-        for p in self._particles:
-            a = max(8, min(255, int(p["alpha"])))
-            col = (255, 255, 255, a)
-            surf = pygame.Surface((int(p["size"]*2), int(p["size"]*2)), pygame.SRCALPHA)
-            pygame.draw.circle(surf, col, (int(p["size"]), int(p["size"])), int(p["size"]))
-            self.screen.blit(surf, (int(p["x"] - p["size"]), int(p["y"] - p["size"])))
+        self._particles.draw(self.screen, fade=False)
 
     def _draw_decorative_icons(self):
         # floating film icons at left/right edges
         t = pygame.time.get_ticks() / 800.0
         left_y = int(self.height * 0.28 + math.sin(t) * 18)
         right_y = int(self.height * 0.34 + math.cos(t*1.2) * 18)
-        film = self.font_medium.render("🎬", True, Colors.WHITE)
-        clap = self.font_medium.render("👏", True, Colors.WHITE)
+        film = self.render_text(self.font_medium, "🎬", Colors.WHITE)
+        clap = self.render_text(self.font_medium, "👏", Colors.WHITE)
         self.screen.blit(film, (36, left_y))
         self.screen.blit(clap, (self.width - 72, right_y))
     
     def draw_result(self, is_correct, answer_key, correct_answer, feedback_text=""):
         """Draw result screen after answering - responsive"""
+        screen_key = ("result", is_correct, answer_key, correct_answer, feedback_text, self.width, self.height)
+        if self.compositor.is_current(screen_key):
+            self.compositor.present(screen_key)
+            return self._screen_buttons
+
         self.screen.fill(self.bg_dark)
         
-        padding = self.get_responsive_padding()
-        margin = self.get_responsive_margin()
-        
         if is_correct:
             result_color = Colors.GREEN
             result_text = "✓ BENAR!"
@@ -458,100 +567,84 @@ class GameUI:
             result_color = Colors.RED
             result_text = "✗ SALAH!"
         
-        # Result title - responsive positioning
-        result_y = int(self.height * 0.12)
-        result_surface = self.font_large.render(result_text, True, result_color)
+        # Result title
+        result_surface = self.render_text(self.font_large, result_text, result_color)
+        layout = self.get_layout("result", result_surface.get_height())
         result_x = self.width // 2 - result_surface.get_width() // 2
-        self.screen.blit(result_surface, (result_x, result_y))
+        self.screen.blit(result_surface, (result_x, layout["result_y"]))
         
         # Feedback
-        feedback_y = result_y + result_surface.get_height() + margin
         if feedback_text:
-            feedback_surface = self.font_medium.render(feedback_text, True, Colors.LIGHT_GRAY)
+            feedback_surface = self.render_text(self.font_medium, feedback_text, Colors.LIGHT_GRAY)
             feedback_x = self.width // 2 - feedback_surface.get_width() // 2
-            self.screen.blit(feedback_surface, (feedback_x, feedback_y))
+            self.screen.blit(feedback_surface, (feedback_x, layout["feedback_y"]))
         
         # Show correct answer
-        correct_y = feedback_y + self.get_responsive_size(40) + margin
         correct_text = f"Jawaban Benar: {correct_answer}"
-        correct_surface = self.font_medium.render(correct_text, True, Colors.YELLOW)
+        correct_surface = self.render_text(self.font_medium, correct_text, Colors.YELLOW)
         correct_x = self.width // 2 - correct_surface.get_width() // 2
-        self.screen.blit(correct_surface, (correct_x, correct_y))
+        self.screen.blit(correct_surface, (correct_x, layout["correct_y"]))
         
-        # Continue button - responsive
-        btn_w = int(self.width * 0.7)
-        btn_h = self.get_responsive_size(48)
-        btn_x = self.width // 2 - btn_w // 2
-        btn_y = correct_y + self.get_responsive_size(60)
-        continue_button = pygame.Rect(btn_x, btn_y, btn_w, btn_h)
+        # Continue button
+        continue_button = layout["continue_button"]
+        btn_x, btn_y, btn_w, btn_h = continue_button
         
         # Custom styled button
         cb_surf = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         pygame.draw.rect(cb_surf, self.accent_cyan + (220,), cb_surf.get_rect(), border_radius=int(btn_h * 0.3))
         pygame.draw.rect(cb_surf, (255, 255, 255, 18), cb_surf.get_rect(), width=2, border_radius=int(btn_h * 0.3))
         self.screen.blit(cb_surf, (btn_x, btn_y))
-        label = self.font_medium.render("LANJUT", True, Colors.WHITE)
+        label = self.render_text(self.font_medium, "LANJUT", Colors.WHITE)
         label_x = btn_x + (btn_w - label.get_width()) // 2
         label_y = btn_y + (btn_h - label.get_height()) // 2
         self.screen.blit(label, (label_x, label_y))
         
-        pygame.display.flip()
+        self._screen_buttons = continue_button
+        self.compositor.mark_full()
+        self.compositor.present(screen_key)
         return continue_button
     
     def draw_game_over(self, score, total_questions, correct_answers):
         """Draw game over screen - responsive"""
-        self.screen.fill(self.bg_dark)
+        screen_key = ("game_over", score, total_questions, correct_answers, self.width, self.height)
+        if self.compositor.is_current(screen_key):
+            self.compositor.present(screen_key)
+            return self._screen_buttons
 
-        padding = self.get_responsive_padding()
-        margin = self.get_responsive_margin()
-        
-        # Center score card - responsive
-        card_w = int(self.width * 0.85)
-        card_h = int(self.height * 0.45)
-        card_x = (self.width - card_w) // 2
-
-        # Responsive button sizing
-        btn_w = int(self.width * 0.65)
-        btn_h = self.get_responsive_size(44)
-        btn_spacing = padding + 4
-        
-        # Calculate vertical layout
-        total_block_h = card_h + margin + btn_h * 2 + btn_spacing
-        card_y = max(margin, (self.height - total_block_h) // 2)
+        self.screen.fill(self.bg_dark)
+        layout = self.get_layout("game_over")
+        line_gap = layout["line_gap"]
         
+        # Center score card
+        card_rect = layout["card"]
+        card_w, card_h = card_rect.size
         card = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
         card.fill(self.bg_panel + (230,))
         pygame.draw.rect(card, self.card_border, card.get_rect(), border_radius=int(card_h * 0.08))
 
-        # Large percentage - responsive font
+        # Large percentage
         percentage = (correct_answers / total_questions * 100) if total_questions > 0 else 0
         perc_text = f"{percentage:.0f}%"
-        perc_font_size = self.get_responsive_size(72)
-        perc_font = pygame.font.Font(None, perc_font_size)
-        perc_surf = perc_font.render(perc_text, True, self.accent_cyan)
-        perc_x = (card_w - perc_surf.get_width()) // 2
-        perc_y = int(card_h * 0.08)
-        card.blit(perc_surf, (perc_x, perc_y))
+        perc_surf = self.render_text(self.font_percent, perc_text, self.accent_cyan)
+        perc_y = layout["perc_y"]
+        card.blit(perc_surf, ((card_w - perc_surf.get_width()) // 2, perc_y))
 
         # Title under percentage
-        title_s = self.font_large.render("Game Selesai", True, Colors.WHITE)
-        title_x = (card_w - title_s.get_width()) // 2
-        title_y = perc_y + perc_surf.get_height() + padding
-        card.blit(title_s, (title_x, title_y))
+        title_s = self.render_text(self.font_large, "Game Selesai", Colors.WHITE)
+        title_y = perc_y + perc_surf.get_height() + line_gap
+        card.blit(title_s, ((card_w - title_s.get_width()) // 2, title_y))
 
         # Score details
         score_text = f"Skor: {score} / {total_questions}"
-        score_s = self.font_medium.render(score_text, True, Colors.LIGHT_GRAY)
-        score_x = (card_w - score_s.get_width()) // 2
-        score_y = title_y + title_s.get_height() + padding
-        card.blit(score_s, (score_x, score_y))
+        score_s = self.render_text(self.font_medium, score_text, Colors.LIGHT_GRAY)
+        score_y = title_y + title_s.get_height() + line_gap
+        card.blit(score_s, ((card_w - score_s.get_width()) // 2, score_y))
 
         # Correct answers text
         correct_text = f"Jawaban Benar: {correct_answers}"
-        corr_s = self.font_small.render(correct_text, True, Colors.LIGHT_GRAY)
-        corr_x = (card_w - corr_s.get_width()) // 2
-        corr_y = score_y + score_s.get_height() + padding
-        card.blit(corr_s, (corr_x, corr_y))
+        corr_s = self.render_text(self.font_small, correct_text, Colors.LIGHT_GRAY)
+        corr_y = score_y + score_s.get_height() + line_gap
+        card.blit(corr_s, ((card_w - corr_s.get_width()) // 2, corr_y))
 
         # Message / badge
         if percentage >= 80:
@@ -564,41 +657,40 @@ class GameUI:
             message = "Coba lagi! 💪"
             badge_col = (255, 165, 0)
 
-        msg_s = self.font_medium.render(message, True, badge_col)
-        msg_x = (card_w - msg_s.get_width()) // 2
-        msg_y = corr_y + corr_s.get_height() + padding
-        card.blit(msg_s, (msg_x, msg_y))
+        msg_s = self.render_text(self.font_medium, message, badge_col)
+        card.blit(msg_s, ((card_w - msg_s.get_width()) // 2, corr_y + corr_s.get_height() + line_gap))
 
         # Draw card to screen
-        self.screen.blit(card, (card_x, card_y))
+        self.screen.blit(card, card_rect.topleft)
 
-        # Action buttons under card - responsive
-        bx = (self.width - btn_w) // 2
-        by = card_y + card_h + margin
+        # Action buttons under card
+        retry_btn = layout["retry_button"]
+        menu_btn = layout["menu_button"]
+        btn_w, btn_h = retry_btn.size
 
         # Retry button (atas)
-        retry_btn = pygame.Rect(bx, by, btn_w, btn_h)
         retry_s = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         pygame.draw.rect(retry_s, (34, 34, 34, 220), retry_s.get_rect(), border_radius=int(btn_h * 0.3))
         pygame.draw.rect(retry_s, (255, 255, 255, 18), retry_s.get_rect(), width=2, border_radius=int(btn_h * 0.3))
         self.screen.blit(retry_s, (retry_btn.x, retry_btn.y))
-        r_label = self.font_medium.render("ULANGI", True, Colors.WHITE)
+        r_label = self.render_text(self.font_medium, "ULANGI", Colors.WHITE)
         r_label_x = retry_btn.x + (btn_w - r_label.get_width()) // 2
         r_label_y = retry_btn.y + (btn_h - r_label.get_height()) // 2
         self.screen.blit(r_label, (r_label_x, r_label_y))
 
         # Menu button (bawah)
-        menu_btn = pygame.Rect(bx, by + btn_h + btn_spacing, btn_w, btn_h)
         menu_s = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         pygame.draw.rect(menu_s, self.accent_pink + (220,), menu_s.get_rect(), border_radius=int(btn_h * 0.3))
         pygame.draw.rect(menu_s, (255, 255, 255, 18), menu_s.get_rect(), width=2, border_radius=int(btn_h * 0.3))
         self.screen.blit(menu_s, (menu_btn.x, menu_btn.y))
-        m_label = self.font_small.render("KEMBALI KE MENU", True, Colors.WHITE)
+        m_label = self.render_text(self.font_small, "KEMBALI KE MENU", Colors.WHITE)
         m_label_x = menu_btn.x + (btn_w - m_label.get_width()) // 2
         m_label_y = menu_btn.y + (btn_h - m_label.get_height()) // 2
         self.screen.blit(m_label, (m_label_x, m_label_y))
 
-        pygame.display.flip()
+        self._screen_buttons = (retry_btn, menu_btn)
+        self.compositor.mark_full()
+        self.compositor.present(screen_key)
         return retry_btn, menu_btn
     
     def draw_camera_preview(self, frame_surface, x=0, y=100):
@@ -609,24 +701,49 @@ class GameUI:
             pygame.draw.rect(self.screen, self.accent_cyan, 
                            (x, y, frame_surface.get_width(), frame_surface.get_height()), 3)
     
+    def _decode_image(self, image_path, max_width, max_height):
+        """Decode & scale image dari disk (aman dipanggil dari thread lain)"""
+        img = pygame.image.load(image_path)
+
+        # Scale image
+        img_rect = img.get_rect()
+        scale_factor = min(max_width / img_rect.width, max_height / img_rect.height)
+        new_size = (int(img_rect.width * scale_factor), int(img_rect.height * scale_factor))
+        return pygame.transform.scale(img, new_size)
+
+    def preload_image(self, image_path, max_width, max_height):
+        """
+        Decode image lebih dulu (dipanggil dari thread prefetch).
+        Convert ke format display tetap dilakukan di main thread oleh load_image.
+        """
+        key = (image_path, max_width, max_height)
+        if key in self._preloaded_images or key + (self._display_mode_key(),) in self.image_cache:
+            return
+        self._preloaded_images.put(key, self._decode_image(image_path, max_width, max_height))
+
     def load_image(self, image_path, max_width=None, max_height=None):
-        """Load and scale image for display - responsive sizing"""
+        """Load and scale image for display - responsive sizing (cached)"""
+        # Use responsive defaults if not specified
+        if max_width is None:
+            max_width = int(self.width * 0.35)
+        if max_height is None:
+            max_height = int(self.height * 0.25)
+
+        key = (image_path, max_width, max_height, self._display_mode_key())
+        img = self.image_cache.get(key)
+        if img is not None:
+            return img
+
         try:
-            # Use responsive defaults if not specified
-            if max_width is None:
-                max_width = int(self.width * 0.35)
-            if max_height is None:
-                max_height = int(self.height * 0.25)
-            
-            img = pygame.image.load(image_path)
+            img = self._preloaded_images.pop(key[:3])
+            if img is None:
+                img = self._decode_image(image_path, max_width, max_height)
+
+            # Convert sekali ke format display supaya blit per frame cepat
+            img = img.convert()
             img.set_colorkey(Colors.BLACK)  # Remove black background if any
-            
-            # Scale image
-            img_rect = img.get_rect()
-            scale_factor = min(max_width / img_rect.width, max_height / img_rect.height)
-            new_size = (int(img_rect.width * scale_factor), int(img_rect.height * scale_factor))
-            img = pygame.transform.scale(img, new_size)
-            
+
+            self.image_cache.put(key, img)
             return img
         except Exception as e:
             print(f"[ERROR] Gagal load image {image_path}: {e}")
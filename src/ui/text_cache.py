@@ -0,0 +1,40 @@
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.lru_cache import LRUCache
+
+
+class TextCache:
+    """
+    Cache hasil font.render.
+
+    Key: (id font, text, antialias, warna). Setiap entry juga menyimpan
+    referensi ke font-nya, sehingga id font tidak mungkin dipakai ulang
+    oleh font lain selama entry masih ada di cache. Surface hasil cache
+    dipakai bersama: pemanggil hanya boleh mem-blit, bukan mengubahnya.
+    """
+
+    def __init__(self, max_entries=256):
+        self._cache = LRUCache(max_entries=max_entries)
+
+    def render(self, font, text, antialias, color):
+        """Pengganti font.render(text, antialias, color) yang memakai cache"""
+        key = (id(font), text, antialias, tuple(color))
+        entry = self._cache.get(key)
+        if entry is not None:
+            return entry[1]
+
+        surface = font.render(text, antialias, color)
+        self._cache.put(key, (font, surface))
+        return surface
+
+    def clear(self):
+        """Invalidate semua entry (misal font dibangun ulang)"""
+        self._cache.clear()
+
+    def get_stats(self):
+        """Statistik cache (hits, misses, hit_rate, ...)"""
+        return self._cache.get_stats()
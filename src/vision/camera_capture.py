@@ -0,0 +1,245 @@
+import threading
+import time
+
+import cv2
+
+
+class CameraCapture:
+    """
+    Capture stage yang jalan di thread sendiri.
+
+    Thread capture terus membaca dari cv2.VideoCapture dan hanya menyimpan
+    frame TERBARU (latest-frame slot). Render loop cukup memanggil read()
+    yang tidak pernah menunggu kamera; frame lama yang belum sempat diambil
+    langsung ditimpa (dihitung sebagai dropped) dan tidak pernah diantrikan.
+
+    Saat di-pause (tidak ada yang mengonsumsi frame), thread hanya
+    grab() tanpa decode supaya buffer driver tetap kosong; setelah
+    idle_release_s detik device dilepas sama sekali dan dibuka lagi
+    saat resume().
+
+    Sumber non-live yang tidak di-pace (FrameSource paced=False) dibaca
+    lockstep: frame berikutnya baru dibaca setelah frame sebelumnya diambil
+    read(), dan timestamp diambil dari waktu media sumber. Tidak ada frame
+    yang dibuang, jadi replay rekaman deterministik.
+    """
+
+    def __init__(self, source=0, idle_release_s=30.0):
+        """
+        Args:
+            source: index device / path video (diteruskan ke cv2.VideoCapture),
+                    FrameSource (lihat vision/frame_source.py), atau object lain
+                    yang sudah terbuka dengan API mirip VideoCapture
+                    (read(), isOpened(), release()).
+            idle_release_s: lama pause sebelum device dilepas (None = tidak pernah).
+                            Hanya berlaku untuk source index/path atau FrameSource
+                            yang reopenable.
+        """
+        if isinstance(source, (int, str)):
+            self._source = source
+            self.cap = cv2.VideoCapture(source)
+        else:
+            self._source = source if getattr(source, "reopenable", False) else None
+            self.cap = source
+        self.idle_release_s = idle_release_s
+        self.lockstep = not getattr(self.cap, "live", True) and not getattr(self.cap, "paced", True)
+
+        self._lock = threading.Lock()
+        self._new_frame = threading.Condition(self._lock)
+        self._thread = None
+        self._running = False
+        self._paused = False
+        self._paused_since = 0.0
+
+        # Latest-frame slot
+        self._frame = None
+        self._timestamp = 0.0
+        self._seq = 0
+        self._consumed_seq = 0
+
+        # Counters
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.read_failures = 0
+        self.frames_drained = 0
+        self.device_releases = 0
+        self.device_reopens = 0
+
+    def is_opened(self):
+        """Cek apakah device capture berhasil dibuka (atau sedang dilepas karena idle)"""
+        if self.cap is None:
+            # Dilepas karena idle: masih dianggap terbuka sampai thread capture
+            # membukanya ulang, supaya resume() tetap menunggu frame (warm-up)
+            return self._source is not None
+        return self.cap.isOpened()
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def pause(self):
+        """Berhenti mengisi latest-frame slot; device di-drain (lalu dilepas kalau idle lama)"""
+        with self._lock:
+            if self._paused:
+                return
+            self._paused = True
+            self._paused_since = time.monotonic()
+            if not self.lockstep:
+                self._frame = None
+
+    def resume(self):
+        """Lanjutkan capture; read() hanya mengembalikan frame yang diambil setelah ini (kecuali lockstep)"""
+        with self._lock:
+            self._paused = False
+            # Lockstep: frame di slot tidak basi (waktu media ikut berhenti saat pause)
+            if not self.lockstep:
+                self._frame = None
+
+    def wait_for_frame(self, timeout):
+        """
+        Block sampai ada frame baru yang belum dibaca, maksimal `timeout` detik.
+
+        Returns:
+            True kalau frame baru tersedia
+        """
+        deadline = time.monotonic() + timeout
+        with self._new_frame:
+            while self._frame is None or self._seq == self._consumed_seq:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._running:
+                    return False
+                self._new_frame.wait(remaining)
+            return True
+
+    def start(self):
+        """Mulai thread capture (tidak melakukan apa-apa kalau device tidak tersedia)"""
+        if self._running or not self.is_opened():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, name="CameraCapture", daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        """Mode pause: buang frame di driver tanpa decode, lepas device kalau idle lama"""
+        if self.cap is None or not getattr(self.cap, "live", True):
+            # Dilepas, atau sumber non-live (file/sintetis) tanpa buffer driver
+            time.sleep(0.05)
+            return
+        if self._source is not None and self.idle_release_s is not None \
+                and time.monotonic() - self._paused_since >= self.idle_release_s:
+            self.cap.release()
+            self.cap = None
+            self.device_releases += 1
+            print("[CAMERA] Device released (idle)")
+            return
+
+        grab = getattr(self.cap, "grab", None)
+        ok = grab() if grab is not None else self.cap.read()[0]
+        if ok:
+            self.frames_drained += 1
+        else:
+            time.sleep(0.01)
+
+    def _wait_consumed(self):
+        """Lockstep: tunggu sampai frame di slot sudah diambil. False kalau pause/stop."""
+        with self._new_frame:
+            while self._running and not self._paused \
+                    and self._frame is not None and self._seq != self._consumed_seq:
+                self._new_frame.wait(0.05)
+            return self._running and not self._paused
+
+    def _capture_loop(self):
+        while self._running:
+            if self._paused:
+                self._drain()
+                continue
+            if self.cap is None:
+                # Dilepas saat idle -> buka ulang setelah resume
+                if isinstance(self._source, (int, str)):
+                    self.cap = cv2.VideoCapture(self._source)
+                else:
+                    self.cap = self._source.open()
+                self.device_reopens += 1
+                print(f"[CAMERA] Device reopened: {self.cap.isOpened()}")
+                continue
+
+            if self.lockstep and not self._wait_consumed():
+                continue
+
+            ret, frame = self.cap.read()
+            source_timestamp = getattr(self.cap, "timestamp", None)
+            timestamp = source_timestamp if source_timestamp is not None else time.monotonic()
+
+            if not ret:
+                self.read_failures += 1
+                # Hindari busy-loop kalau device sedang bermasalah
+                time.sleep(0.01)
+                continue
+
+            with self._lock:
+                if self._paused and not self.lockstep:
+                    # pause() terjadi saat read() sedang berjalan
+                    continue
+                # Frame sebelumnya belum diambil consumer -> dibuang
+                if self._frame is not None and self._seq != self._consumed_seq:
+                    self.frames_dropped += 1
+                self._frame = frame
+                self._timestamp = timestamp
+                self._seq += 1
+                self.frames_captured += 1
+                self._new_frame.notify_all()
+
+    def read(self):
+        """
+        Ambil frame terbaru tanpa menunggu.
+
+        Returns:
+            (frame, timestamp, seq) kalau ada frame baru sejak read() terakhir,
+            None kalau belum ada frame baru. timestamp memakai time.monotonic().
+        """
+        with self._lock:
+            if self._frame is None or self._seq == self._consumed_seq:
+                return None
+            self._consumed_seq = self._seq
+            # Lockstep: bangunkan thread capture untuk frame berikutnya
+            self._new_frame.notify_all()
+            return self._frame, self._timestamp, self._seq
+
+    def get_stats(self):
+        """Statistik capture stage"""
+        return {
+            "captured": self.frames_captured,
+            "dropped": self.frames_dropped,
+            "read_failures": self.read_failures,
+            "drained": self.frames_drained,
+            "device_releases": self.device_releases,
+            "device_reopens": self.device_reopens,
+            "last_seq": self._seq,
+        }
+
+    def release(self):
+        """Hentikan thread capture dan lepaskan device"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self.cap is not None:
+            self.cap.release()
+
+
+if __name__ == "__main__":
+    # Test mandiri: baca dari kamera selama beberapa detik
+    capture = CameraCapture(0)
+    print("[TEST] Camera opened:", capture.is_opened())
+    capture.start()
+
+    start = time.monotonic()
+    consumed = 0
+    while time.monotonic() - start < 3.0:
+        packet = capture.read()
+        if packet is not None:
+            consumed += 1
+        time.sleep(1 / 60)
+
+    capture.release()
+    print(f"[TEST] Consumed {consumed} frames | stats: {capture.get_stats()}")
@@ -0,0 +1,410 @@
+"""
+Sumber frame untuk CameraCapture: kamera live, file video, direktori
+gambar, generator sintetis, atau rekaman (vision/recording.py).
+
+Semua sumber punya API mirip cv2.VideoCapture (read(), grab(),
+isOpened(), release()) sehingga bisa langsung dipakai CameraCapture,
+ditambah resolution, fps dan describe().
+
+- paced=True: frame dikeluarkan sesuai fps sumber (read() menunggu),
+  seperti kamera sungguhan; cocok untuk kiosk dengan footage rekaman.
+- paced=False: frame dikeluarkan secepat mungkin; cocok untuk load test
+  pipeline dengan throughput maksimum dan replay deterministik. timestamp
+  frame mengikuti waktu media (jarak antar frame sesuai fps / timestamp
+  rekaman), bukan jam dinding, dan CameraCapture tidak membuang frame
+  (lockstep), jadi urutan frame & timestamp identik di setiap run.
+Kamera live selalu di-pace oleh device-nya sendiri.
+
+Spec (lihat open_frame_source / CINETUNE_SOURCE):
+    camera:0                 kamera index 0 (default)
+    camera:/dev/video2       kamera via path device
+    video:rekaman.mp4        file video
+    images:folder[@15]       gambar di folder (urut nama), fps opsional
+    synthetic[:1280x720@30]  noise + blob bergerak, tanpa I/O
+    recording:rekaman/sesi1  rekaman FrameRecorder (pacing dari timestamp)
+"""
+import abc
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vision.recording import Recording
+
+DEFAULT_FPS = 30.0
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class FrameSource(abc.ABC):
+    """
+    Base class sumber frame. Subclass mengimplementasikan resolution, fps,
+    _next_frame() (frame BGR berikutnya atau None kalau habis) dan
+    _rewind() (untuk loop).
+    """
+
+    # Device live: punya buffer driver yang perlu di-drain saat pause
+    live = False
+    # Bisa dilepas saat idle lalu dibuka lagi dengan open()
+    reopenable = False
+
+    def __init__(self, name, paced=True, loop=False):
+        self.name = name
+        self.paced = paced
+        self.loop = loop
+        self.finished = False
+        self._due = None
+        # Waktu media frame terakhir (hanya unpaced), None = pakai waktu baca
+        self.timestamp = None
+        self._next_timestamp = None
+
+        # Counters
+        self.frames_read = 0
+        self.loops = 0
+
+    @property
+    @abc.abstractmethod
+    def resolution(self):
+        """(width, height) native sumber"""
+
+    @property
+    @abc.abstractmethod
+    def fps(self):
+        """FPS native sumber (None kalau tidak diketahui)"""
+
+    @abc.abstractmethod
+    def _next_frame(self):
+        """Frame BGR berikutnya, atau None kalau habis"""
+
+    @abc.abstractmethod
+    def _rewind(self):
+        """Kembali ke frame pertama (untuk loop)"""
+
+    def _interval(self):
+        """Jarak (detik) ke frame berikutnya untuk pacing"""
+        fps = self.fps
+        return 1.0 / fps if fps else 1.0 / DEFAULT_FPS
+
+    def _pace(self, interval):
+        """Tunggu sampai jadwal frame; kalau tertinggal jauh, jadwal dimulai ulang"""
+        if self._due is not None:
+            wait = self._due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            elif wait < -interval:
+                self._due = None
+        self._due = (self._due if self._due is not None else time.monotonic()) + interval
+
+    def _advance_timestamp(self, interval):
+        """Waktu media: mulai dari time.monotonic() di frame pertama, naik `interval` per frame"""
+        if self._next_timestamp is None:
+            self._next_timestamp = time.monotonic()
+        self.timestamp = self._next_timestamp
+        self._next_timestamp += interval
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        """Returns: (ok, frame) seperti cv2.VideoCapture.read()"""
+        frame = self._next_frame()
+        if frame is None and self.loop and self.frames_read > 0:
+            self._rewind()
+            self.loops += 1
+            frame = self._next_frame()
+        if frame is None:
+            self.finished = True
+            return False, None
+        if self.paced:
+            self._pace(self._interval())
+        else:
+            self._advance_timestamp(self._interval())
+        self.frames_read += 1
+        return True, frame
+
+    def grab(self):
+        return self.read()[0]
+
+    def open(self):
+        """Buka ulang sumber yang dilepas (lihat reopenable). Returns self."""
+        self._due = None
+        return self
+
+    def release(self):
+        pass
+
+    def describe(self):
+        """Ringkasan satu baris untuk log"""
+        width, height = self.resolution
+        fps = f"{self.fps:.1f}fps" if self.fps else "fps ?"
+        pacing = "device" if self.live else ("paced" if self.paced else "unpaced")
+        return f"{self.name} {width}x{height} @{fps} ({pacing})"
+
+
+class CameraSource(FrameSource):
+    """Kamera live via cv2.VideoCapture (di-pace oleh device)"""
+
+    live = True
+    reopenable = True
+
+    def __init__(self, index=0):
+        """
+        Args:
+            index: index device (int) atau path device (misal "/dev/video2")
+        """
+        super().__init__(f"camera:{index}", paced=False)
+        self.index = index
+        self.cap = cv2.VideoCapture(index)
+
+    @property
+    def resolution(self):
+        return (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+    @property
+    def fps(self):
+        return self.cap.get(cv2.CAP_PROP_FPS) or None
+
+    def isOpened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    def _next_frame(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def _rewind(self):
+        # Kamera live tidak bisa diulang (loop selalu False)
+        pass
+
+    def read(self):
+        # Tanpa pacing/loop; read gagal sesaat tidak berarti sumber habis
+        frame = self._next_frame()
+        if frame is None:
+            return False, None
+        self.frames_read += 1
+        return True, frame
+
+    def grab(self):
+        return self.cap.grab()
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.index)
+        return self
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """File video (apa pun yang bisa dibuka cv2.VideoCapture)"""
+
+    reopenable = True
+
+    def __init__(self, path, paced=True, loop=False):
+        super().__init__(f"video:{path}", paced, loop)
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+
+    @property
+    def resolution(self):
+        return (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+
+    @property
+    def fps(self):
+        return self.cap.get(cv2.CAP_PROP_FPS) or None
+
+    def isOpened(self):
+        return self.cap is not None and self.cap.isOpened()
+
+    def _next_frame(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def _rewind(self):
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.path)
+        return super().open()
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+
+
+class ImageSequenceSource(FrameSource):
+    """Gambar di satu direktori, diurutkan berdasarkan nama file"""
+
+    def __init__(self, directory, fps=DEFAULT_FPS, paced=True, loop=False):
+        super().__init__(f"images:{directory}", paced, loop)
+        self.directory = directory
+        self._fps = fps
+        self.files = sorted(
+            os.path.join(directory, name) for name in os.listdir(directory)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        self._pos = 0
+        first = cv2.imread(self.files[0]) if self.files else None
+        self._resolution = (first.shape[1], first.shape[0]) if first is not None else (0, 0)
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    @property
+    def fps(self):
+        return self._fps
+
+    def isOpened(self):
+        return bool(self.files)
+
+    def _next_frame(self):
+        while self._pos < len(self.files):
+            frame = cv2.imread(self.files[self._pos])
+            self._pos += 1
+            if frame is not None:
+                return frame
+        return None
+
+    def _rewind(self):
+        self._pos = 0
+
+
+class SyntheticSource(FrameSource):
+    """
+    Frame buatan tanpa I/O: noise statis + blob warna kulit yang bergerak.
+    Deterministik untuk seed yang sama; tidak berisi tangan sungguhan.
+    """
+
+    def __init__(self, width=640, height=480, fps=DEFAULT_FPS, paced=True, loop=False, frames=None, seed=0):
+        """
+        Args:
+            frames: jumlah frame sebelum habis/loop (None = tidak terbatas)
+        """
+        super().__init__(f"synthetic:{width}x{height}", paced, loop)
+        self._resolution = (width, height)
+        self._fps = fps
+        self.frames = frames
+        self._base = np.random.default_rng(seed).integers(0, 255, (height, width, 3), dtype=np.uint8)
+        self._pos = 0
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    @property
+    def fps(self):
+        return self._fps
+
+    def _next_frame(self):
+        if self.frames is not None and self._pos >= self.frames:
+            return None
+        width, height = self._resolution
+        i = self._pos
+        self._pos += 1
+        frame = self._base.copy()
+        center = (width // 4 + (i * 7) % (width // 2), height // 2 + int(height / 8 * np.sin(i / 5)))
+        cv2.ellipse(frame, center, (width // 10, height // 5), 0, 0, 360, (120, 160, 220), -1)
+        return frame
+
+    def _rewind(self):
+        self._pos = 0
+
+
+class RecordingSource(FrameSource):
+    """Frame dari rekaman FrameRecorder; pacing mengikuti timestamp rekaman"""
+
+    def __init__(self, path, paced=True, loop=False):
+        super().__init__(f"recording:{path}", paced, loop)
+        self.recording = Recording(path)
+        self._timestamps = np.asarray(self.recording.timestamps, dtype=np.float64)
+        self._pos = 0
+
+    @property
+    def resolution(self):
+        height, width = self.recording.frame_shape[:2]
+        return (width, height)
+
+    @property
+    def fps(self):
+        if len(self.recording) < 2 or self.recording.duration <= 0:
+            return None
+        return (len(self.recording) - 1) / self.recording.duration
+
+    def isOpened(self):
+        return self.recording.has_frames() and len(self.recording) > 0
+
+    def _next_frame(self):
+        if self._pos >= len(self.recording):
+            return None
+        frame = self.recording.frame(self._pos)
+        self._pos += 1
+        return frame
+
+    def _interval(self):
+        # Jarak ke frame berikutnya sesuai rekaman (frame terakhir: rata-rata)
+        i = self._pos
+        if 0 < i < len(self._timestamps):
+            return float(self._timestamps[i] - self._timestamps[i - 1])
+        return super()._interval()
+
+    def _rewind(self):
+        self._pos = 0
+
+    def release(self):
+        self.recording.close()
+
+
+def _parse_fps(arg):
+    """'folder@15' -> ('folder', 15.0); tanpa @angka -> (arg, None)"""
+    head, sep, tail = arg.rpartition("@")
+    if sep and tail.replace(".", "", 1).isdigit():
+        return head, float(tail)
+    return arg, None
+
+
+def open_frame_source(spec, paced=True, loop=False):
+    """
+    Buat FrameSource dari spec string (lihat docstring modul).
+
+    Args:
+        spec: "camera:<index|path>", "video:<file>", "images:<dir>[@fps]",
+              "synthetic[:WxH[@fps]]" atau "recording:<dir>"
+        paced: pacing sesuai fps sumber (diabaikan untuk kamera)
+        loop: ulang dari awal setelah frame terakhir (bukan kamera)
+    """
+    kind, _, arg = spec.partition(":")
+    if kind == "camera":
+        # Angka = index device, selain itu path device (cv2.VideoCapture menerima keduanya)
+        return CameraSource(int(arg) if arg.isdigit() else (arg or 0))
+    if kind == "video":
+        return VideoFileSource(arg, paced, loop)
+    if kind == "images":
+        directory, fps = _parse_fps(arg)
+        return ImageSequenceSource(directory, fps or DEFAULT_FPS, paced, loop)
+    if kind == "synthetic":
+        size, fps = _parse_fps(arg)
+        width, height = (int(v) for v in size.split("x")) if size else (640, 480)
+        return SyntheticSource(width, height, fps or DEFAULT_FPS, paced, loop)
+    if kind == "recording":
+        return RecordingSource(arg, paced, loop)
+    raise ValueError(f"Frame source tidak dikenal: {spec!r}")
+
+
+if __name__ == "__main__":
+    # Test mandiri: ukur throughput sumber, paced vs unpaced
+    spec = sys.argv[1] if len(sys.argv) > 1 else "synthetic"
+    for paced in (True, False):
+        source = open_frame_source(spec, paced=paced)
+        print(f"[SOURCE] {source.describe()} opened={source.isOpened()}")
+        start = time.monotonic()
+        count = 0
+        while time.monotonic() - start < 2.0 and source.read()[0]:
+            count += 1
+        elapsed = time.monotonic() - start
+        print(f"[SOURCE] {count} frame dalam {elapsed:.2f}s -> {count / elapsed:.1f} fps")
+        source.release()
@@ -0,0 +1,165 @@
+import numpy as np
+
+# Label gesture yang bisa diputuskan (index 0 = tidak ada gesture)
+DECISION_LABELS = [None, "A", "B", "C", "D"]
+
+
+class GestureDecisionEngine:
+    """
+    Keputusan jawaban dari aliran gesture per frame.
+
+    - Majority vote berbobot confidence di ring buffer `window` observasi
+      terakhir; update O(1) (bobot yang keluar dikurangi, yang masuk ditambah).
+    - Hysteresis: kandidat jadi aktif kalau porsi vote-nya >= enter_ratio,
+      dan baru lepas kalau turun di bawah exit_ratio. Satu frame yang
+      flicker tidak mereset hold.
+    - Dwell dihitung sejak pose pertama muncul (frame pertama run beruntun
+      kandidat), bukan sejak vote mencapai enter_ratio, jadi ramp-up vote
+      ikut terhitung dan hold yang stabil selesai tepat `dwell` detik.
+      Setelah aktif, hold bertambah dt * min(1, porsi vote / enter_ratio):
+      hold yang goyah melambat tapi tidak mulai dari nol.
+    - Cooldown setelah submit: observasi diabaikan selama `cooldown` detik.
+
+    Semua waktu memakai timestamp capture (time.monotonic) dari frame sumber.
+    Setelah keputusan, last_appeared (frame pertama pose muncul beruntun)
+    dan last_onset (kandidat jadi aktif) tersedia untuk pengukuran latency.
+    """
+
+    def __init__(self, window=7, dwell=0.5, enter_ratio=0.6, exit_ratio=0.4, cooldown=1.0,
+                 history=100):
+        """
+        Args:
+            window: jumlah observasi di ring buffer vote
+            dwell: lama hold efektif sebelum jawaban di-submit (detik)
+            enter_ratio: porsi vote minimum untuk mengaktifkan kandidat
+            exit_ratio: porsi vote di bawah ini melepas kandidat aktif
+            cooldown: jeda setelah submit (detik)
+            history: jumlah latency keputusan yang disimpan untuk statistik
+        """
+        self.window = window
+        self.dwell = dwell
+        self.enter_ratio = enter_ratio
+        self.exit_ratio = exit_ratio
+        self.cooldown = cooldown
+        self.history = history
+
+        self._codes = np.zeros(window, np.int8)
+        self._weights = np.zeros(window, np.float32)
+        self._totals = np.zeros(len(DECISION_LABELS), np.float64)
+        self._latencies = []
+
+        # Counters
+        self.decisions = 0
+        self.resets = 0
+        self._cooldown_until = None
+        self.last_appeared = None
+        self.last_onset = None
+        self.reset()
+
+    def reset(self):
+        """
+        Kosongkan vote & hold (misal soal baru / kamera di-resume).
+        Cooldown setelah submit tetap berlaku, supaya gesture yang masih
+        ditahan saat kembali ke GAME tidak langsung menjawab soal berikutnya.
+        """
+        self._codes[:] = 0
+        self._weights[:] = 0.0
+        self._totals[:] = 0.0
+        self._head = 0
+        self._last_timestamp = None
+        self._active = 0
+        self._onset = None
+        self._appeared = None
+        self._held = 0.0
+        # Awal run observasi beruntun dengan kode yang sama
+        self._run_code = 0
+        self._run_start = None
+
+    def update(self, gesture, timestamp, confidence=1.0):
+        """
+        Tambah satu observasi.
+
+        Args:
+            gesture: 'A'..'D' atau None
+            timestamp: waktu capture frame (monotonic, detik); observasi dengan
+                       timestamp yang sama/lebih lama dari sebelumnya diabaikan
+            confidence: bobot vote observasi ini (0-1)
+
+        Returns:
+            label yang diputuskan di observasi ini, atau None
+        """
+        if self._last_timestamp is not None and timestamp <= self._last_timestamp:
+            return None
+        dt = 0.0 if self._last_timestamp is None else timestamp - self._last_timestamp
+        self._last_timestamp = timestamp
+
+        if self._cooldown_until is not None:
+            if timestamp < self._cooldown_until:
+                return None
+            self._cooldown_until = None
+
+        # Ring buffer O(1): buang bobot observasi terlama, tambah yang baru
+        code = DECISION_LABELS.index(gesture) if gesture in DECISION_LABELS else 0
+        if code != self._run_code or self._run_start is None:
+            self._run_code = code
+            self._run_start = timestamp
+        weight = max(0.0, float(confidence)) if code else 1.0
+        head = self._head
+        self._totals[self._codes[head]] -= self._weights[head]
+        self._codes[head] = code
+        self._weights[head] = weight
+        self._totals[code] += weight
+        self._head = (head + 1) % self.window
+
+        total = self._totals.sum()
+        if total <= 0:
+            return None
+        leader = int(self._totals[1:].argmax()) + 1
+        ratios = self._totals / total
+
+        # Hysteresis
+        if self._active and ratios[self._active] < self.exit_ratio:
+            self._active = 0
+            self._held = 0.0
+            self._onset = None
+            self.resets += 1
+        if not self._active and ratios[leader] >= self.enter_ratio:
+            self._active = leader
+            self._onset = timestamp
+            self._appeared = self._run_start if self._run_code == leader else timestamp
+            # Ramp-up vote (pose muncul -> kandidat aktif) sudah termasuk hold
+            self._held = timestamp - self._appeared
+            return self._check_dwell(timestamp)
+        if not self._active:
+            return None
+
+        self._held += dt * min(1.0, ratios[self._active] / self.enter_ratio)
+        return self._check_dwell(timestamp)
+
+    def _check_dwell(self, timestamp):
+        # Toleransi kecil: jumlah dt float dari frame 30 fps tidak pas 0.5
+        if self._held < self.dwell - 1e-6:
+            return None
+
+        label = DECISION_LABELS[self._active]
+        self._latencies.append(timestamp - self._appeared)
+        if len(self._latencies) > self.history:
+            self._latencies.pop(0)
+        self.decisions += 1
+        self.last_appeared = self._appeared
+        self.last_onset = self._onset
+
+        self.reset()
+        self._last_timestamp = timestamp
+        self._cooldown_until = timestamp + self.cooldown
+        return label
+
+    def get_stats(self):
+        """Statistik keputusan (latency = pose muncul -> submit, detik)"""
+        latencies = np.array(self._latencies) if self._latencies else None
+        return {
+            "decisions": self.decisions,
+            "resets": self.resets,
+            "latency_p50": float(np.percentile(latencies, 50)) if latencies is not None else None,
+            "latency_max": float(latencies.max()) if latencies is not None else None,
+        }
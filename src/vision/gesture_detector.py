@@ -1,44 +1,222 @@
 import cv2
 import mediapipe as mp
 
+from vision.hand_landmarks import HandLandmarks
+from vision.inference_worker import InferenceWorker
+
+# Pasangan index landmark yang dihubungkan garis (urut supaya gambar deterministik)
+HAND_CONNECTIONS = sorted(mp.solutions.hands.HAND_CONNECTIONS)
+# Warna & ukuran sama dengan default mp.solutions.drawing_utils.draw_landmarks (BGR)
+CONNECTION_COLOR = (224, 224, 224)
+LANDMARK_COLOR = (0, 0, 255)
+LINE_THICKNESS = 2
+LANDMARK_RADIUS = 2
+
+
 class GestureDetector:
-    def __init__(self):
-        self.hands = mp.solutions.hands.Hands(
+    def __init__(self, use_worker=False, roi_tracking=False, roi_margin=0.35, roi_max_side=256):
+        """
+        Args:
+            use_worker: True -> MediaPipe Hands dijalankan di proses terpisah
+                        (InferenceWorker), frame dikirim lewat shared memory.
+            roi_tracking: True -> inferensi hanya pada crop di sekitar bounding
+                        box tangan terakhir (+ margin), fallback ke full frame
+                        kalau tangan hilang.
+            roi_margin: margin crop relatif terhadap sisi terpanjang bounding box
+            roi_max_side: sisi terpanjang crop setelah di-downsize (pixel)
+        """
+        self.hands = None
+        self.roi_hands = None
+        self.worker = None
+        self.roi_tracking = roi_tracking
+        self.roi_margin = roi_margin
+        self.roi_max_side = roi_max_side
+        if use_worker:
+            self.worker = InferenceWorker(detector_kwargs={
+                "roi_tracking": roi_tracking,
+                "roi_margin": roi_margin,
+                "roi_max_side": roi_max_side,
+            })
+        else:
+            self.hands = self._create_hands()
+            if roi_tracking:
+                # Instance terpisah supaya tracking internal MediaPipe untuk crop
+                # tidak tercampur dengan koordinat frame penuh
+                self.roi_hands = self._create_hands()
+
+        # ROI tracking state: (x0, y0, x1, y1) dalam pixel frame penuh
+        self._roi_box = None
+        self.roi_frames = 0
+        self.full_frames = 0
+
+        # Sequence frame yang menghasilkan landmarks terakhir (mode worker)
+        self.last_result_seq = 0
+        # Timestamp capture frame yang menghasilkan hasil estimate() terakhir,
+        # juga kalau hasilnya None (None = belum ada hasil)
+        self.last_result_timestamp = None
+
+    @staticmethod
+    def _create_hands():
+        return mp.solutions.hands.Hands(
             max_num_hands=1,
             min_detection_confidence=0.7,
             min_tracking_confidence=0.7
         )
-        self.drawer = mp.solutions.drawing_utils
 
-    def detect(self, frame):
+    @staticmethod
+    def _process(hands, frame, timestamp=0.0):
+        """Jalankan satu instance Hands, return HandLandmarks (ternormalisasi terhadap frame) atau None"""
+        # Convert BGR → RGB
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        # Proses tangan
+        results = hands.process(rgb)
+
+        if not results.multi_hand_landmarks:
+            return None
+        handedness = results.multi_handedness[0] if results.multi_handedness else None
+        h, w = frame.shape[:2]
+        return HandLandmarks.from_mediapipe(results.multi_hand_landmarks[0], handedness,
+                                            timestamp=timestamp, aspect=w / h)
+
+    def _infer_roi(self, frame, timestamp):
+        """Inferensi pada crop ROI, landmarks dipetakan balik ke frame penuh"""
+        h, w = frame.shape[:2]
+        x0, y0, x1, y1 = self._roi_box
+        crop = frame[y0:y1, x0:x1]
+        crop_w, crop_h = x1 - x0, y1 - y0
+
+        scale = self.roi_max_side / max(crop_w, crop_h)
+        if scale < 1.0:
+            crop = cv2.resize(crop, (max(1, int(crop_w * scale)), max(1, int(crop_h * scale))),
+                              interpolation=cv2.INTER_AREA)
+
+        hand = self._process(self.roi_hands, crop, timestamp)
+        if hand is None:
+            return None
+        # Koordinat crop -> koordinat frame penuh (in-place di array landmarks)
+        points = hand.points
+        points[:, 0] = (x0 + points[:, 0] * crop_w) / w
+        points[:, 1] = (y0 + points[:, 1] * crop_h) / h
+        points[:, 2] *= crop_w / w
+        hand.aspect = w / h
+        return hand
+
+    def _update_roi(self, hand, frame_shape):
+        """Hitung ROI frame berikutnya dari bounding box landmarks + margin"""
+        if hand is None:
+            self._roi_box = None
+            return
+
+        h, w = frame_shape[:2]
+        (min_x, min_y), (max_x, max_y) = hand.points[:, :2].min(axis=0), hand.points[:, :2].max(axis=0)
+        cx = (min_x + max_x) / 2 * w
+        cy = (min_y + max_y) / 2 * h
+        side = max((max_x - min_x) * w, (max_y - min_y) * h)
+        half = side * (0.5 + self.roi_margin)
+
+        x0, y0 = max(0, int(cx - half)), max(0, int(cy - half))
+        x1, y1 = min(w, int(cx + half)), min(h, int(cy + half))
+        if x1 - x0 < 16 or y1 - y0 < 16:
+            self._roi_box = None
+        else:
+            self._roi_box = (x0, y0, x1, y1)
+
+    def infer(self, frame, timestamp=0.0):
+        """
+        Jalankan MediaPipe Hands pada satu frame (tanpa menggambar).
+
+        Input: frame BGR (opencv), timestamp capture frame (monotonic)
+        Output: HandLandmarks (ternormalisasi terhadap frame penuh), atau None
+        """
+        if not self.roi_tracking:
+            return self._process(self.hands, frame, timestamp)
+
+        hand = None
+        if self._roi_box is not None:
+            hand = self._infer_roi(frame, timestamp)
+            self.roi_frames += 1
+        if hand is None:
+            # Tangan hilang dari ROI -> cari ulang di full frame
+            hand = self._process(self.hands, frame, timestamp)
+            self.full_frames += 1
+
+        self._update_roi(hand, frame.shape)
+        return hand
+
+    def reset_tracking(self):
+        """Lupakan ROI terakhir & hasil worker lama (frame berikutnya dicari di full frame)"""
+        self._roi_box = None
+        if self.worker is not None:
+            self.worker.discard_results()
+
+    def estimate(self, frame, timestamp=0.0):
+        """
+        HandLandmarks untuk frame ini (tanpa menggambar).
+        Mode worker: kirim frame, pakai hasil terbaru yang sudah kembali
+        (timestamp hasil = timestamp frame yang benar-benar diproses, lihat
+        last_result_timestamp untuk hasil None).
+        """
+        if self.worker is not None:
+            self.worker.submit(frame, timestamp)
+            if not self.worker.failed:
+                self.last_result_seq, self.last_result_timestamp, hand = self.worker.poll()
+                return hand
+            self._fallback_in_process()
+        self.last_result_timestamp = timestamp
+        return self.infer(frame, timestamp)
+
+    def _fallback_in_process(self):
+        """Worker terus mati: lanjutkan dengan MediaPipe Hands di proses utama"""
+        print(f"[VISION] Inference worker failed {self.worker.restarts} times, "
+              f"falling back to in-process inference")
+        self.worker.stop()
+        self.worker = None
+        self._roi_box = None
+        self.hands = self._create_hands()
+        if self.roi_tracking:
+            self.roi_hands = self._create_hands()
+
+    def draw(self, frame, hand):
+        """
+        Gambar landmarks di frame.
+
+        Returns:
+            array (21, 2) koordinat pixel, atau None kalau tidak ada tangan
+        """
+        if hand is None:
+            return None
+
+        # Langsung dari koordinat pixel, tanpa membangun protobuf landmarks tiap frame
+        h, w = frame.shape[:2]
+        pixels = hand.to_pixels(w, h)
+        points = [tuple(p) for p in pixels.tolist()]
+        for start, end in HAND_CONNECTIONS:
+            cv2.line(frame, points[start], points[end], CONNECTION_COLOR, LINE_THICKNESS)
+        # Titik digambar setelah garis (border putih + isi merah)
+        for point in points:
+            cv2.circle(frame, point, LANDMARK_RADIUS + 1, CONNECTION_COLOR, LINE_THICKNESS)
+            cv2.circle(frame, point, LANDMARK_RADIUS, LANDMARK_COLOR, LINE_THICKNESS)
+        return pixels
+
+    def detect(self, frame, timestamp=0.0):
         """
         Input: frame BGR (opencv)
         Output:
-            - landmarks: list berisi 21 titik (x, y)
+            - hand: HandLandmarks atau None
             - frame: frame dengan landmark digambar
         """
+        hand = self.estimate(frame, timestamp)
+        self.draw(frame, hand)
+        return hand, frame
 
-        # Convert BGR → RGB
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # Proses tangan
-        results = self.hands.process(rgb)
-
-        landmarks = None
-
-        # Jika ada tangan
-        if results.multi_hand_landmarks:
-            handLms = results.multi_hand_landmarks[0]
-            
-            # Draw landmarks di frame
-            self.drawer.draw_landmarks(
-                frame, 
-                handLms,
-                mp.solutions.hands.HAND_CONNECTIONS
-            )
-
-            # Extract koordinat setiap titik
-            h, w, _ = frame.shape
-            landmarks = [(int(lm.x * w), int(lm.y * h)) for lm in handLms.landmark]
-
-        return landmarks, frame
+    def close(self):
+        """Lepaskan resource MediaPipe / worker process"""
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker = None
+        for hands in (self.hands, self.roi_hands):
+            if hands is not None:
+                hands.close()
+        self.hands = None
+        self.roi_hands = None
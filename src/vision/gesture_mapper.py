@@ -1,44 +1,109 @@
+import numpy as np
+
+from vision.hand_landmarks import HandLandmarks
+
+# Index landmark MediaPipe Hands
+WRIST = 0
+MIDDLE_MCP = 9
+FINGER_TIPS = [4, 8, 12, 16, 20]   # jempol, telunjuk, tengah, manis, kelingking
+
+# Kode hasil klasifikasi batch: 0 = tidak ada gesture
+GESTURE_LABELS = [None, "A", "B", "C", "D"]
+NO_GESTURE, GESTURE_A, GESTURE_B, GESTURE_C, GESTURE_D = range(5)
+
+
+def normalize_landmarks(points, aspect=1.0):
+    """
+    Normalisasi landmarks ke origin pergelangan & ukuran tangan.
+
+    Args:
+        points: array (..., 21, 2|3), koordinat ternormalisasi MediaPipe
+                (x, y dalam 0..1) atau pixel
+        aspect: width / height frame kalau points ternormalisasi per sumbu,
+                supaya x dan y berskala sama (1.0 untuk koordinat pixel)
+
+    Returns:
+        float32 (..., 21, 3): wrist di (0, 0, 0), jarak wrist -> pangkal jari
+        tengah = 1. Sumbu y tetap ke bawah seperti koordinat gambar.
+    """
+    pts = np.asarray(points, dtype=np.float32)
+    if pts.shape[-1] == 2:
+        pts = np.concatenate([pts, np.zeros(pts.shape[:-1] + (1,), np.float32)], axis=-1)
+    else:
+        pts = pts.copy()
+    pts[..., 0] *= aspect
+
+    pts -= pts[..., WRIST:WRIST + 1, :]
+    size = np.linalg.norm(pts[..., MIDDLE_MCP, :2], axis=-1)
+    pts /= np.maximum(size, 1e-6)[..., None, None]
+    return pts
+
+
 class GestureMapper:
-    def map(self, landmarks):
+    """
+    Klasifikasi gesture dari landmarks tangan yang sudah dinormalisasi
+    (lihat normalize_landmarks), jadi tidak bergantung resolusi kamera
+    maupun jarak tangan ke kamera. Semua rule dihitung vectorized, sehingga
+    classify_batch bisa dipakai untuk satu frame (live) maupun jutaan frame
+    rekaman sekaligus (evaluasi offline).
+    """
+
+    def __init__(self, fist_tolerance=0.25):
         """
-        Input: landmarks (list dari 21 titik tangan)
-        Output: 'A', 'B', 'C', 'D', atau None
+        Args:
+            fist_tolerance: selisih tinggi ujung jari maksimum (dalam satuan
+                            ukuran tangan) supaya dianggap genggaman (D)
         """
+        self.fist_tolerance = fist_tolerance
 
-        if landmarks is None:
-            return None
+    @staticmethod
+    def features(hands):
+        """
+        Fitur ekstensi jari: tinggi ujung tiap jari relatif ke pergelangan.
+
+        Args:
+            hands: (N, 21, 3) landmarks ternormalisasi
+
+        Returns:
+            (N, 5) float32, urutan jempol..kelingking; makin negatif = makin
+            terangkat (sumbu y gambar ke bawah)
+        """
+        return hands[:, FINGER_TIPS, 1]
 
-        # Ambil titik penting
-        thumb_tip  = landmarks[4]   # ujung jempol
-        index_tip  = landmarks[8]   # ujung telunjuk
-        middle_tip = landmarks[12]  # ujung jari tengah
-        ring_tip   = landmarks[16]
-        pinky_tip  = landmarks[20]
-
-        # ------------------------------------------
-        # RULE DASAR (bisa kamu tweak nanti)
-        # ------------------------------------------
-
-         # D = ✊ (semua jari turun: perbedaan kecil antar titik)
-        if (
-            abs(index_tip[1] - middle_tip[1]) < 25 and
-            abs(middle_tip[1] - ring_tip[1]) < 25 and
-            abs(ring_tip[1] - pinky_tip[1]) < 25
-        ):
-            return "D"
-        
-        # A = 👍 (jempol paling atas)
-        if thumb_tip[1] < index_tip[1] and thumb_tip[1] < middle_tip[1]:
-            return "A"
-
-        # B = ✌️ (dua jari menghadap atas: telunjuk & tengah)
-        if index_tip[1] < thumb_tip[1] and middle_tip[1] < thumb_tip[1]:
-            return "B"
-
-        # C = ☝️ (hanya telunjuk yang naik)
-        if index_tip[1] < middle_tip[1] and index_tip[1] < ring_tip[1]:
-            return "C"
-
-       
-
-        return None
+    def classify_batch(self, hands):
+        """
+        Args:
+            hands: (N, 21, 3) landmarks ternormalisasi
+
+        Returns:
+            int8 (N,) kode gesture (index ke GESTURE_LABELS)
+        """
+        tip_y = self.features(np.asarray(hands, dtype=np.float32))
+        thumb, index, middle, ring, pinky = tip_y.T
+        tol = self.fist_tolerance
+
+        # Urutan = prioritas rule (yang pertama cocok menang)
+        conditions = [
+            # D = ✊ (semua jari turun: perbedaan kecil antar ujung jari)
+            (np.abs(index - middle) < tol) & (np.abs(middle - ring) < tol) & (np.abs(ring - pinky) < tol),
+            # A = 👍 (jempol paling atas)
+            (thumb < index) & (thumb < middle),
+            # B = ✌️ (telunjuk & tengah di atas jempol)
+            (index < thumb) & (middle < thumb),
+            # C = ☝️ (hanya telunjuk yang naik)
+            (index < middle) & (index < ring),
+        ]
+        codes = [GESTURE_D, GESTURE_A, GESTURE_B, GESTURE_C]
+        return np.select(conditions, codes, default=NO_GESTURE).astype(np.int8)
+
+    def map(self, hand):
+        """
+        Input: HandLandmarks, atau array (21, 3) yang sudah dinormalisasi
+        Output: 'A', 'B', 'C', 'D', atau None
+        """
+        if hand is None:
+            return None
+        if isinstance(hand, HandLandmarks):
+            hand = normalize_landmarks(hand.points, hand.aspect)
+        code = self.classify_batch(np.asarray(hand, dtype=np.float32)[None])[0]
+        return GESTURE_LABELS[code]
@@ -0,0 +1,71 @@
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+
+class HandLandmarks:
+    """
+    Landmarks satu tangan dalam bentuk ringkas.
+
+    Satu object per deteksi (bukan 21 tuple): koordinat disimpan di satu
+    array float32 (21, 3) berisi x, y, z ternormalisasi MediaPipe terhadap
+    frame penuh, ditambah handedness, score, timestamp capture frame-nya
+    (time.monotonic) dan aspect (width / height) frame.
+    Bisa di-pickle (dikirim dari InferenceWorker apa adanya).
+
+    score BUKAN confidence deteksi: MediaPipe Hands (solutions API) tidak
+    mengeluarkan skor deteksi per tangan (min_detection_confidence hanya
+    ambang internal). Yang tersedia hanya skor klasifikasi handedness, dan
+    itu yang dipakai sebagai pengganti (misal bobot vote di
+    GestureDecisionEngine).
+    """
+
+    __slots__ = ("points", "handedness", "score", "timestamp", "aspect")
+
+    def __init__(self, points, handedness=None, score=0.0, timestamp=0.0, aspect=1.0):
+        """
+        Args:
+            points: array-like (21, 3) koordinat ternormalisasi
+            handedness: "Left" / "Right" (label MediaPipe) atau None
+            score: skor klasifikasi handedness MediaPipe (0-1), pengganti
+                   confidence deteksi yang tidak tersedia
+            timestamp: waktu capture frame sumber (detik, monotonic)
+            aspect: width / height frame sumber
+        """
+        self.points = np.asarray(points, dtype=np.float32).reshape(NUM_LANDMARKS, 3)
+        self.handedness = handedness
+        self.score = score
+        self.timestamp = timestamp
+        self.aspect = aspect
+
+    @classmethod
+    def from_mediapipe(cls, hand_landmarks, classification=None, timestamp=0.0, aspect=1.0):
+        """
+        Args:
+            hand_landmarks: NormalizedLandmarkList (results.multi_hand_landmarks[i])
+            classification: results.multi_handedness[i] atau None
+        """
+        points = np.fromiter(
+            (v for lm in hand_landmarks.landmark for v in (lm.x, lm.y, lm.z)),
+            dtype=np.float32, count=NUM_LANDMARKS * 3,
+        )
+        handedness, score = None, 0.0
+        if classification is not None and classification.classification:
+            top = classification.classification[0]
+            handedness, score = top.label, top.score
+        return cls(points, handedness, score, timestamp, aspect)
+
+    def with_points(self, points, timestamp):
+        """Salinan dengan koordinat & timestamp baru (misal hasil interpolasi)"""
+        return HandLandmarks(points, self.handedness, self.score, timestamp, self.aspect)
+
+    def to_pixels(self, width, height):
+        """Koordinat pixel (21, 2) int32"""
+        return (self.points[:, :2] * (width, height)).astype(np.int32)
+
+    def __len__(self):
+        return NUM_LANDMARKS
+
+    def __repr__(self):
+        return (f"HandLandmarks(handedness={self.handedness!r}, score={self.score:.2f}, "
+                f"timestamp={self.timestamp:.3f})")
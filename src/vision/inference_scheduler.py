@@ -0,0 +1,144 @@
+import math
+import time
+
+import cv2
+
+
+class InferenceScheduler:
+    """
+    Menentukan frame mana yang benar-benar dijalankan inferensi tangan.
+
+    Inferensi dijalankan setiap N frame (N tetap, atau adaptif terhadap
+    biaya inferensi), atau lebih cepat kalau ada gerakan di frame. Di antara
+    dua inferensi, landmarks terakhir dibawa maju (hold) atau diekstrapolasi
+    linear dari dua keyframe terakhir, sehingga konsumer tetap mendapat
+    landmarks di setiap frame.
+    """
+
+    def __init__(self, interval=1, adaptive=False, max_interval=4, budget_ms=8.0,
+                 motion_threshold=6.0, interpolation="linear"):
+        """
+        Args:
+            interval: jalankan inferensi setiap N frame (minimum kalau adaptive)
+            adaptive: True -> N dinaikkan sampai max_interval supaya rata-rata
+                      biaya inferensi per frame <= budget_ms
+            max_interval: batas atas N pada mode adaptive
+            budget_ms: target biaya inferensi per frame (ms)
+            motion_threshold: rata-rata beda pixel thumbnail grayscale (0-255)
+                      yang dianggap gerakan -> inferensi langsung dijalankan
+            interpolation: "linear" (ekstrapolasi) atau "hold" (carry forward)
+        """
+        self.min_interval = max(1, interval)
+        self.interval = self.min_interval
+        self.adaptive = adaptive
+        self.max_interval = max(self.min_interval, max_interval)
+        self.budget_ms = budget_ms
+        self.motion_threshold = motion_threshold
+        self.interpolation = interpolation
+
+        self._frames_since_run = 0
+        self._infer_ms_ema = None
+        self._thumb = None
+
+        # Dua keyframe terakhir: (timestamp, HandLandmarks atau None)
+        self._prev = (None, None)
+        self._last = (None, None)
+        # False kalau hasil step() terakhir prediksi (frame dilewati)
+        self.last_step_inferred = False
+
+        # Counters
+        self.inference_runs = 0
+        self.motion_runs = 0
+        self.skipped_frames = 0
+
+    def _thumbnail(self, frame):
+        small = cv2.resize(frame, (32, 24), interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def _has_motion(self, thumb):
+        if self._thumb is None:
+            return True
+        return float(cv2.absdiff(thumb, self._thumb).mean()) > self.motion_threshold
+
+    def should_run(self, frame):
+        """True kalau frame ini perlu inferensi"""
+        if self.interval <= 1 or self._last[0] is None:
+            return True
+        if self._frames_since_run + 1 >= self.interval:
+            return True
+        if self.motion_threshold is not None and self._has_motion(self._thumbnail(frame)):
+            self.motion_runs += 1
+            return True
+        return False
+
+    def step(self, frame, timestamp, infer_fn):
+        """
+        Proses satu frame.
+
+        Args:
+            frame: frame BGR
+            timestamp: waktu capture frame (monotonic, detik)
+            infer_fn: callable (frame, timestamp) -> HandLandmarks atau None
+
+        Returns:
+            HandLandmarks untuk frame ini (hasil inferensi atau prediksi), atau None
+        """
+        if self.should_run(frame):
+            start = time.perf_counter()
+            landmarks = infer_fn(frame, timestamp)
+            self._record_run(frame, timestamp, landmarks, (time.perf_counter() - start) * 1000.0)
+            self.last_step_inferred = True
+            return self._last[1]
+
+        self.last_step_inferred = False
+        self._frames_since_run += 1
+        self.skipped_frames += 1
+        return self._predict(timestamp)
+
+    def _record_run(self, frame, timestamp, landmarks, infer_ms):
+        self.inference_runs += 1
+        self._frames_since_run = 0
+        if self.motion_threshold is not None and self.interval > 1:
+            self._thumb = self._thumbnail(frame)
+
+        if landmarks is None or landmarks is not self._last[1]:
+            # Mode worker bisa mengembalikan hasil yang sama beberapa kali;
+            # keyframe memakai timestamp frame yang benar-benar diproses
+            self._prev = self._last
+            self._last = (landmarks.timestamp if landmarks is not None else timestamp, landmarks)
+
+        if self.adaptive:
+            alpha = 0.2
+            self._infer_ms_ema = infer_ms if self._infer_ms_ema is None else (
+                alpha * infer_ms + (1 - alpha) * self._infer_ms_ema)
+            wanted = math.ceil(self._infer_ms_ema / self.budget_ms)
+            self.interval = min(self.max_interval, max(self.min_interval, wanted))
+
+    def _predict(self, timestamp):
+        t1, last = self._last
+        t0, prev = self._prev
+        if last is None or self.interpolation != "linear" or prev is None or t1 <= t0:
+            return last
+
+        # Ekstrapolasi linear, dibatasi maksimal satu interval keyframe ke depan
+        alpha = min(1.0, (timestamp - t1) / (t1 - t0))
+        return last.with_points(last.points + (last.points - prev.points) * alpha, timestamp)
+
+    def reset(self):
+        """Buang keyframe (misal saat kamera di-pause)"""
+        self._frames_since_run = 0
+        self._thumb = None
+        self._prev = (None, None)
+        self._last = (None, None)
+
+    def get_stats(self):
+        """Statistik scheduler"""
+        total = self.inference_runs + self.skipped_frames
+        return {
+            "interval": self.interval,
+            "inference_runs": self.inference_runs,
+            "motion_runs": self.motion_runs,
+            "skipped_frames": self.skipped_frames,
+            "run_ratio": (self.inference_runs / total) if total else 0.0,
+            "infer_ms_ema": self._infer_ms_ema,
+        }
@@ -0,0 +1,256 @@
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def _worker_main(shm_name, ring_shape, task_queue, result_queue, detector_kwargs):
+    """
+    Entry point proses worker.
+
+    Proses ini memiliki instance MediaPipe Hands sendiri. Frame dibaca langsung
+    dari ring buffer shared memory (tanpa pickling); yang dikirim lewat queue
+    hanya (seq, slot, timestamp) dan hasil (seq, timestamp, HandLandmarks)
+    yang kecil.
+    """
+    # Import di sini supaya proses utama tidak perlu mengimpor ulang modul ini
+    from vision.gesture_detector import GestureDetector
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    ring = np.ndarray(ring_shape, dtype=np.uint8, buffer=shm.buf)
+    detector = GestureDetector(**detector_kwargs)
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            # Lewati frame basi: hanya proses task paling baru di antrian
+            stop = False
+            while True:
+                try:
+                    newer = task_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if newer is None:
+                    stop = True
+                    break
+                result_queue.put((task[0], task[2], None, True))
+                task = newer
+
+            seq, slot, timestamp = task
+            hand = detector.infer(ring[slot], timestamp)
+            result_queue.put((seq, timestamp, hand, False))
+            if stop:
+                break
+    finally:
+        detector.close()
+        del ring
+        shm.close()
+
+
+class InferenceWorker:
+    """
+    Menjalankan inferensi MediaPipe di proses terpisah.
+
+    Frame ditulis ke ring buffer multiprocessing.shared_memory berisi
+    `slots` frame. Slot hanya ditimpa kalau sudah tidak dipakai worker
+    (jumlah task pending < slots); kalau ring penuh, frame baru dibuang
+    sehingga proses utama tidak pernah menunggu inferensi.
+
+    Kalau proses worker mati (crash MediaPipe, OOM, di-kill), worker
+    di-restart di submit() berikutnya; setelah max_restarts kali, failed
+    menjadi True dan pemanggil sebaiknya kembali ke inferensi in-process.
+    """
+
+    def __init__(self, slots=3, detector_kwargs=None, max_restarts=3):
+        """
+        Args:
+            slots: jumlah frame di ring buffer shared memory
+            detector_kwargs: argumen GestureDetector di dalam proses worker
+            max_restarts: batas restart otomatis setelah proses worker mati
+        """
+        self.slots = slots
+        self.max_restarts = max_restarts
+        self.detector_kwargs = detector_kwargs or {}
+        self._ctx = multiprocessing.get_context("spawn")
+        self._process = None
+        self._shm = None
+        self._ring = None
+        self._frame_shape = None
+        self._task_queue = None
+        self._result_queue = None
+
+        self._seq = 0
+        self.pending = 0
+        self.latest_seq = 0
+        # Timestamp capture frame yang menghasilkan latest_landmarks (juga kalau None)
+        self.latest_timestamp = None
+        self.latest_landmarks = None
+
+        # Counters
+        self.frames_submitted = 0
+        self.frames_dropped = 0
+        self.frames_skipped = 0
+        self.restarts = 0
+
+    @property
+    def failed(self):
+        """True kalau worker terus mati dan batas restart sudah habis"""
+        return self.restarts > self.max_restarts
+
+    def is_alive(self):
+        return self._process is not None and self._process.is_alive()
+
+    def _check_alive(self):
+        """
+        Deteksi proses worker yang mati: hasil yang masih di queue diambil,
+        task pending dianggap hilang, resource dibebaskan (start() berikutnya
+        menjalankan worker baru).
+
+        Returns:
+            True kalau worker masih hidup (atau belum dijalankan)
+        """
+        if self._process is None or self._process.is_alive():
+            return True
+        exitcode = self._process.exitcode
+        try:
+            self._drain()
+        except Exception:
+            # Proses mati di tengah put(): sisa queue tidak bisa dibaca
+            pass
+        self.restarts += 1
+        action = "giving up" if self.failed else f"restart {self.restarts}/{self.max_restarts}"
+        print(f"[VISION] Inference worker died (exitcode={exitcode}), {action}")
+        self.stop()
+        self.pending = 0
+        return False
+
+    def start(self, frame_shape):
+        """Alokasikan ring buffer untuk ukuran frame ini dan jalankan proses worker"""
+        self.stop()
+
+        ring_shape = (self.slots,) + tuple(frame_shape)
+        size = int(np.prod(ring_shape))
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._ring = np.ndarray(ring_shape, dtype=np.uint8, buffer=self._shm.buf)
+        self._frame_shape = tuple(frame_shape)
+
+        self._task_queue = self._ctx.Queue()
+        self._result_queue = self._ctx.Queue()
+        self._process = self._ctx.Process(
+            target=_worker_main,
+            args=(self._shm.name, ring_shape, self._task_queue, self._result_queue, self.detector_kwargs),
+            name="InferenceWorker",
+            daemon=True,
+        )
+        self._process.start()
+        self.pending = 0
+        print(f"[VISION] Inference worker started (pid={self._process.pid}, ring={ring_shape})")
+
+    def submit(self, frame, timestamp=0.0):
+        """
+        Salin frame ke slot ring berikutnya dan antrikan ke worker.
+
+        Args:
+            frame: frame BGR
+            timestamp: waktu capture frame, ikut dikembalikan di HandLandmarks
+
+        Returns:
+            True kalau frame dikirim, False kalau dibuang (ring penuh /
+            worker gagal, lihat failed).
+        """
+        self._check_alive()
+        if self.failed:
+            return False
+        if self._process is None or frame.shape != self._frame_shape:
+            self.start(frame.shape)
+
+        self.poll()
+        if self.pending >= self.slots:
+            self.frames_dropped += 1
+            return False
+
+        self._seq += 1
+        slot = self._seq % self.slots
+        np.copyto(self._ring[slot], frame)
+        self._task_queue.put((self._seq, slot, timestamp))
+        self.pending += 1
+        self.frames_submitted += 1
+        return True
+
+    def poll(self):
+        """
+        Ambil semua hasil yang sudah kembali tanpa menunggu.
+
+        Returns:
+            (seq, timestamp, landmarks) terbaru; timestamp = waktu capture
+            frame yang diproses (None kalau belum ada hasil), landmarks berupa
+            HandLandmarks (koordinat ternormalisasi) atau None.
+        """
+        # Worker mati: task pending tidak akan pernah kembali (restart di submit())
+        if self._check_alive() and self._result_queue is not None:
+            self._drain()
+        return self.latest_seq, self.latest_timestamp, self.latest_landmarks
+
+    def _drain(self):
+        """Ambil semua hasil di result queue tanpa menunggu"""
+        while True:
+            try:
+                seq, timestamp, landmarks, skipped = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if skipped:
+                self.frames_skipped += 1
+            elif seq > self.latest_seq:
+                self.latest_seq = seq
+                self.latest_timestamp = timestamp
+                self.latest_landmarks = landmarks
+
+    def discard_results(self):
+        """Abaikan hasil frame yang sudah dikirim sebelum ini (misal kamera di-pause)"""
+        self.poll()
+        # poll() hanya menerima seq > latest_seq -> hasil yang masih in-flight ikut terbuang
+        self.latest_seq = self._seq
+        self.latest_timestamp = None
+        self.latest_landmarks = None
+
+    def get_stats(self):
+        """Statistik worker"""
+        return {
+            "submitted": self.frames_submitted,
+            "dropped": self.frames_dropped,
+            "skipped": self.frames_skipped,
+            "pending": self.pending,
+            "latest_seq": self.latest_seq,
+            "restarts": self.restarts,
+        }
+
+    def stop(self):
+        """Hentikan proses worker dan bebaskan shared memory"""
+        if self._process is not None:
+            try:
+                self._task_queue.put(None)
+                self._process.join(timeout=2.0)
+            except Exception:
+                pass
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+            print(f"[VISION] Inference worker stopped | stats: {self.get_stats()}")
+
+        for q in (self._task_queue, self._result_queue):
+            if q is not None:
+                q.close()
+        self._task_queue = None
+        self._result_queue = None
+
+        if self._shm is not None:
+            self._ring = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        self._frame_shape = None
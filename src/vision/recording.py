@@ -0,0 +1,289 @@
+"""
+Rekaman frame kamera + landmarks. Replay lewat RecordingSource
+(vision/frame_source.py, spec "recording:<dir>") seperti sumber frame lain.
+
+Format rekaman (satu direktori, semua file append-only sehingga rekaman
+yang terpotong karena crash tetap terbaca sampai frame terakhir yang utuh):
+
+    meta.json       format frame, shape, scale
+    frames.u8       frame BGR mentah (N, H, W, 3) uint8  -> np.memmap
+    frames.avi      (alternatif frames.u8) video MJPG kalau video=True
+    landmarks.f32   (N, 21, 3) float32 ternormalisasi, NaN = tidak ada
+                    hasil inferensi baru di frame ini
+    index.bin       (N,) INDEX_DTYPE: timestamp, landmark_timestamp,
+                    predicted, handedness, score, aspect
+
+Frame disimpan apa adanya dari kamera (sebelum flip), landmarks seperti
+yang dilihat aplikasi (frame sudah di-flip), jadi replay melewati
+get_camera_frame persis seperti kamera live.
+
+Hanya hasil inferensi sungguhan yang disimpan. Landmarks prediksi
+InferenceScheduler (frame yang dilewati) dan hasil worker yang sama yang
+dikembalikan ulang disimpan sebagai NaN dengan predicted=1.
+landmark_timestamp adalah waktu capture frame yang benar-benar
+diinferensi. Di mode worker, nilainya lebih lama dari timestamp frame.
+
+Contoh:
+    CINETUNE_RECORD=rekaman/sesi1 python src/main.py
+    CINETUNE_REPLAY=rekaman/sesi1 CINETUNE_SOURCE_PACED=0 python src/main.py
+    python src/vision/recording.py rekaman/sesi1
+"""
+import json
+import os
+import sys
+
+import cv2
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vision.hand_landmarks import HandLandmarks, NUM_LANDMARKS
+
+INDEX_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("landmark_timestamp", "<f8"),  # capture frame sumber landmarks, NaN = tidak ada
+    ("predicted", "u1"),            # 1 = aplikasi memakai landmarks prediksi/ulang (tidak disimpan)
+    ("handedness", "i1"),           # -1 = tidak ada / tidak diketahui, 0 = Left, 1 = Right
+    ("score", "<f4"),
+    ("aspect", "<f4"),
+])
+HANDEDNESS = ["Left", "Right"]
+LANDMARK_BYTES = NUM_LANDMARKS * 3 * 4
+
+
+class FrameRecorder:
+    """
+    Rekam frame kamera dan landmarks per frame ke direktori rekaman.
+
+    Semua file ditulis append (tanpa preallocation), jadi jumlah frame tidak
+    perlu diketahui di awal.
+    """
+
+    def __init__(self, path, scale=1.0, video=False, frames=True, video_fps=30.0):
+        """
+        Args:
+            path: direktori rekaman (dibuat kalau belum ada)
+            scale: faktor downscale frame (1.0 = resolusi asli)
+            video: simpan frame sebagai video MJPG (lebih kecil, lossy)
+                   alih-alih array mentah
+            frames: False = hanya landmarks + index (tanpa frame)
+            video_fps: fps yang ditulis ke header video
+        """
+        self.path = path
+        self.scale = scale
+        self.frame_format = ("video" if video else "raw") if frames else "none"
+        self.video_fps = video_fps
+        os.makedirs(path, exist_ok=True)
+
+        self._landmarks = open(os.path.join(path, "landmarks.f32"), "wb")
+        self._index = open(os.path.join(path, "index.bin"), "wb")
+        self._frames = None
+        self._writer = None
+        self._frame_shape = None
+        self._empty = np.full((NUM_LANDMARKS, 3), np.nan, np.float32)
+        self._last_hand = None
+
+        # Counters
+        self.frames_written = 0
+        self.bytes_written = 0
+
+    def _open_frames(self, frame_shape, source_shape):
+        """Tulis meta & buka output frame saat frame pertama datang"""
+        self._frame_shape = frame_shape
+        meta = {
+            "version": 1,
+            "frame_format": self.frame_format,
+            "frame_shape": list(frame_shape),
+            "source_shape": list(source_shape),
+            "scale": self.scale,
+            "video_fps": self.video_fps,
+        }
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+
+        if self.frame_format == "raw":
+            self._frames = open(os.path.join(self.path, "frames.u8"), "wb")
+        elif self.frame_format == "video":
+            height, width = frame_shape[:2]
+            self._writer = cv2.VideoWriter(os.path.join(self.path, "frames.avi"),
+                                           cv2.VideoWriter_fourcc(*"MJPG"), self.video_fps, (width, height))
+
+    def write(self, frame, timestamp, hand=None, predicted=False):
+        """
+        Args:
+            frame: frame BGR dari kamera (sebelum flip)
+            timestamp: waktu capture (monotonic, detik)
+            hand: HandLandmarks yang dipakai aplikasi di frame ini, atau None
+            predicted: True kalau hand bukan hasil inferensi di frame ini
+                       (prediksi/carry-forward InferenceScheduler)
+        """
+        source_shape = frame.shape[:2]
+        if self.frame_format != "none" and self.scale != 1.0:
+            frame = cv2.resize(frame, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        if self._frame_shape is None:
+            self._open_frames(frame.shape, source_shape)
+        elif self.frame_format != "none" and frame.shape != self._frame_shape:
+            # Resolusi kamera berubah di tengah rekaman: samakan ke shape awal
+            frame = cv2.resize(frame, (self._frame_shape[1], self._frame_shape[0]),
+                               interpolation=cv2.INTER_AREA)
+
+        if self._frames is not None:
+            data = np.ascontiguousarray(frame).tobytes()
+            self._frames.write(data)
+            self.bytes_written += len(data)
+        elif self._writer is not None:
+            self._writer.write(np.ascontiguousarray(frame))
+
+        row = np.zeros(1, INDEX_DTYPE)
+        row["timestamp"] = timestamp
+        row["landmark_timestamp"] = np.nan
+        row["handedness"] = -1
+        points = self._empty
+        if hand is not None and (predicted or hand is self._last_hand):
+            # Bukan pengukuran baru: jangan dicampur dengan deteksi sungguhan
+            row["predicted"] = 1
+        elif hand is not None:
+            self._last_hand = hand
+            row["landmark_timestamp"] = hand.timestamp
+            points = hand.points
+            if hand.handedness in HANDEDNESS:
+                row["handedness"] = HANDEDNESS.index(hand.handedness)
+            row["score"] = hand.score
+            row["aspect"] = hand.aspect
+        self._landmarks.write(np.ascontiguousarray(points, np.float32).tobytes())
+        self._index.write(row.tobytes())
+        self.bytes_written += LANDMARK_BYTES + INDEX_DTYPE.itemsize
+        self.frames_written += 1
+
+    def close(self):
+        """Flush dan tutup semua file rekaman"""
+        for f in (self._frames, self._landmarks, self._index):
+            if f is not None and not f.closed:
+                f.close()
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+
+    def get_stats(self):
+        return {
+            "path": self.path,
+            "format": self.frame_format,
+            "frames": self.frames_written,
+            "mb": self.bytes_written / (1024 * 1024),
+        }
+
+
+class Recording:
+    """
+    Reader rekaman: frame, landmarks dan index sebagai np.memmap (tidak
+    dimuat ke memori). Jumlah frame = jumlah record utuh di semua file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.frame_format = self.meta["frame_format"]
+        self.frame_shape = tuple(self.meta["frame_shape"])
+
+        counts = [
+            os.path.getsize(os.path.join(path, "index.bin")) // INDEX_DTYPE.itemsize,
+            os.path.getsize(os.path.join(path, "landmarks.f32")) // LANDMARK_BYTES,
+        ]
+        self._video = None
+        if self.frame_format == "raw":
+            frame_bytes = int(np.prod(self.frame_shape))
+            counts.append(os.path.getsize(os.path.join(path, "frames.u8")) // frame_bytes)
+        elif self.frame_format == "video":
+            self._video = cv2.VideoCapture(os.path.join(path, "frames.avi"))
+            counts.append(int(self._video.get(cv2.CAP_PROP_FRAME_COUNT)))
+            self._video_pos = 0
+        self.count = min(counts)
+
+        self.index = self._memmap("index.bin", INDEX_DTYPE, (self.count,))
+        self.landmarks = self._memmap("landmarks.f32", np.float32, (self.count, NUM_LANDMARKS, 3))
+        self.frames = None
+        if self.frame_format == "raw":
+            self.frames = self._memmap("frames.u8", np.uint8, (self.count,) + self.frame_shape)
+
+    def _memmap(self, name, dtype, shape):
+        if shape[0] == 0:
+            return np.zeros(shape, dtype)
+        return np.memmap(os.path.join(self.path, name), dtype=dtype, mode="r", shape=shape)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def timestamps(self):
+        return self.index["timestamp"]
+
+    @property
+    def duration(self):
+        """Durasi rekaman (detik)"""
+        if self.count < 2:
+            return 0.0
+        return float(self.timestamps[-1] - self.timestamps[0])
+
+    def has_frames(self):
+        return self.frame_format != "none"
+
+    def frame(self, i):
+        """Frame ke-i (BGR, sebelum flip)"""
+        if self.frames is not None:
+            return self.frames[i]
+        if self._video is None:
+            return None
+        if i != self._video_pos:
+            self._video.set(cv2.CAP_PROP_POS_FRAMES, i)
+        ret, frame = self._video.read()
+        self._video_pos = i + 1
+        return frame if ret else None
+
+    def hand(self, i):
+        """HandLandmarks yang tercatat di frame ke-i, atau None"""
+        points = self.landmarks[i]
+        if np.isnan(points[0, 0]):
+            return None
+        row = self.index[i]
+        handedness = HANDEDNESS[row["handedness"]] if row["handedness"] >= 0 else None
+        return HandLandmarks(points, handedness, float(row["score"]), float(row["landmark_timestamp"]),
+                             float(row["aspect"]))
+
+    def hand_mask(self):
+        """bool (N,): frame yang punya landmarks hasil inferensi"""
+        return ~np.isnan(self.landmarks[:, 0, 0])
+
+    def predicted_mask(self):
+        """bool (N,): frame yang di aplikasi memakai landmarks prediksi (tidak disimpan)"""
+        return self.index["predicted"] != 0
+
+    def close(self):
+        if self._video is not None:
+            self._video.release()
+            self._video = None
+
+
+if __name__ == "__main__":
+    # Ringkasan rekaman + distribusi gesture dari landmarks yang tercatat
+    from vision.gesture_mapper import GestureMapper, GESTURE_LABELS, normalize_landmarks
+
+    if len(sys.argv) < 2:
+        print("Usage: python src/vision/recording.py <direktori rekaman>")
+        sys.exit(1)
+
+    recording = Recording(sys.argv[1])
+    mask = recording.hand_mask()
+    print(f"[RECORDING] {recording.path}: {len(recording)} frame, {recording.duration:.1f}s, "
+          f"format={recording.frame_format} shape={recording.frame_shape}")
+    print(f"[RECORDING] Frame dengan tangan: {int(mask.sum())} ({mask.mean() * 100 if len(mask) else 0:.1f}%), "
+          f"prediksi (tidak disimpan): {int(recording.predicted_mask().sum())}")
+
+    if mask.any():
+        # aspect per frame (M, 1) -> broadcast ke (M, 21)
+        hands = normalize_landmarks(recording.landmarks[mask], recording.index["aspect"][mask][:, None])
+        codes = GestureMapper().classify_batch(hands)
+        counts = np.bincount(codes, minlength=len(GESTURE_LABELS))
+        print("[RECORDING] Gesture:", {str(GESTURE_LABELS[i]): int(c) for i, c in enumerate(counts)})
+    recording.close()
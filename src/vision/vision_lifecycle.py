@@ -0,0 +1,91 @@
+import time
+
+
+class VisionLifecycle:
+    """
+    Lifecycle capture + gesture detection mengikuti state game.
+
+    Di luar GAME tidak ada yang mengonsumsi frame: kamera di-pause (buffer
+    driver di-drain, device dilepas kalau idle lama) dan state tracking
+    detector/scheduler dibuang supaya tidak ada ROI, keyframe atau hasil
+    worker basi yang terbawa ke soal berikutnya. Saat play dimulai lagi,
+    resume() menunggu frame segar maksimal warmup_timeout detik.
+    """
+
+    def __init__(self, camera, detector, scheduler, warmup_timeout=0.5):
+        """
+        Args:
+            camera: CameraCapture
+            detector: GestureDetector
+            scheduler: InferenceScheduler
+            warmup_timeout: batas tunggu frame pertama setelah resume (detik)
+        """
+        self.camera = camera
+        self.detector = detector
+        self.scheduler = scheduler
+        self.warmup_timeout = warmup_timeout
+        self.active = True
+
+        # Counters
+        self.suspends = 0
+        self.resumes = 0
+        self.warmup_timeouts = 0
+        self.last_warmup_ms = None
+        self.max_warmup_ms = 0.0
+
+    def set_active(self, active):
+        """
+        Args:
+            active: True kalau frame kamera sedang dikonsumsi (state GAME)
+
+        Returns:
+            True kalau terjadi transisi suspend/resume di panggilan ini
+        """
+        if active == self.active:
+            return False
+        if active:
+            self.resume()
+        else:
+            self.suspend()
+        return True
+
+    def suspend(self):
+        """Pause capture dan buang state tracking"""
+        self.camera.pause()
+        self.detector.reset_tracking()
+        self.scheduler.reset()
+        self.active = False
+        self.suspends += 1
+
+    def resume(self):
+        """
+        Lanjutkan capture dan tunggu frame segar (bounded).
+
+        Returns:
+            True kalau frame segar tersedia sebelum warmup_timeout
+        """
+        self.camera.resume()
+        self.active = True
+        self.resumes += 1
+        if not self.camera.is_opened():
+            return False
+
+        start = time.perf_counter()
+        fresh = self.camera.wait_for_frame(self.warmup_timeout)
+        self.last_warmup_ms = (time.perf_counter() - start) * 1000.0
+        self.max_warmup_ms = max(self.max_warmup_ms, self.last_warmup_ms)
+        if not fresh:
+            # Device masih dibuka ulang: render loop jalan terus, frame menyusul
+            self.warmup_timeouts += 1
+            print(f"[VISION] Warm-up timeout ({self.warmup_timeout:.2f}s), lanjut tanpa frame")
+        return fresh
+
+    def get_stats(self):
+        """Statistik lifecycle"""
+        return {
+            "suspends": self.suspends,
+            "resumes": self.resumes,
+            "warmup_timeouts": self.warmup_timeouts,
+            "last_warmup_ms": self.last_warmup_ms,
+            "max_warmup_ms": self.max_warmup_ms,
+        }